@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+翻訳カタログを一括ビルドするスクリプト
+
+translate_*.py を個別に実行する代わりに、変更のあった辞書の出力だけを再生成する。
+"""
+
+import sys
+
+from i18n_catalog.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,13 @@
 import { Toaster } from "@/components/ui/sonner";
 import { TooltipProvider } from "@/components/ui/tooltip";
+import { cn } from "@/lib/utils";
 import NotFound from "@/pages/NotFound";
-import { Route, Switch } from "wouter";
+import { AlertTriangle, RotateCcw } from "lucide-react";
+import { Route, Switch, useLocation } from "wouter";
 import ErrorBoundary from "./components/ErrorBoundary";
 import { ThemeProvider } from "./contexts/ThemeContext";
+import { useCatalogNamespaces } from "./hooks/useCatalogNamespaces";
+import { namespacesForRoute } from "./i18n";
 import Home from "./pages/Home";
 import Settings from "./pages/Settings";
 import MyTemplates from "./pages/MyTemplates";
@@ -14,7 +18,38 @@ import Terms from "./pages/Terms";
 import AdSenseGuide from "./pages/AdSenseGuide";
 import ApiSettings from "./pages/ApiSettings";
 
+// Shown when the route's catalogs still fail to load after the automatic
+// retries. Like ErrorBoundary, the text is not translated (the catalogs are
+// what failed to load).
+function CatalogLoadError({ retry }: { retry: () => void }) {
+  return (
+    <div className="flex items-center justify-center min-h-screen p-8 bg-background">
+      <div className="flex flex-col items-center w-full max-w-2xl p-8">
+        <AlertTriangle size={48} className="text-destructive mb-6 flex-shrink-0" />
+        <h2 className="text-xl mb-6">Failed to load translations.</h2>
+        <button
+          onClick={retry}
+          className={cn(
+            "flex items-center gap-2 px-4 py-2 rounded-lg",
+            "bg-primary text-primary-foreground",
+            "hover:opacity-90 cursor-pointer"
+          )}
+        >
+          <RotateCcw size={16} />
+          Retry
+        </button>
+      </div>
+    </div>
+  );
+}
+
 function Router() {
+  // Wait for the route's translation namespaces before rendering the page
+  const [location] = useLocation();
+  const catalog = useCatalogNamespaces(namespacesForRoute(location));
+  if (catalog.error) return <CatalogLoadError retry={catalog.retry} />;
+  if (!catalog.ready) return null;
+
   // make sure to consider if you need authentication for certain routes
   return (
     <Switch>
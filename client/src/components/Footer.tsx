@@ -102,7 +102,7 @@ export default function Footer() {
 
         {/* コピーライト */}
         <div className="mt-8 pt-8 border-t text-center text-sm text-muted-foreground space-y-2">
-          <p>{t('footer.copyright', { year: currentYear, title: APP_TITLE })}</p>
+          <p>{t('footer.copyright', { year: currentYear, APP_TITLE })}</p>
           <p className="text-xs">
             {t('footer.madeWith')}{" "}
             <a 
@@ -1,6 +1,6 @@
 import { Button } from "@/components/ui/button";
 import { Languages } from "lucide-react";
-import { useTranslation } from "react-i18next";
+import { changeLanguage } from "@/i18n";
 import {
   DropdownMenu,
   DropdownMenuContent,
@@ -9,12 +9,6 @@ import {
 } from "@/components/ui/dropdown-menu";
 
 export function LanguageSwitcher() {
-  const { i18n } = useTranslation();
-
-  const changeLanguage = (lng: string) => {
-    i18n.changeLanguage(lng);
-  };
-
   return (
     <DropdownMenu>
       <DropdownMenuTrigger asChild>
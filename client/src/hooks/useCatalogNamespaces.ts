@@ -0,0 +1,62 @@
+import { areNamespacesLoaded, loadNamespaces } from "@/i18n";
+import { useCallback, useEffect, useState } from "react";
+
+// Automatic attempts before giving up, and the delay before the first retry
+// (doubled for each one after it).
+const MAX_ATTEMPTS = 3;
+const RETRY_DELAY_MS = 1000;
+
+export type CatalogStatus = {
+  ready: boolean;
+  error: unknown;
+  retry: () => void;
+};
+
+/**
+ * Loads the given catalog namespaces on demand.
+ * `ready` becomes true once every namespace is available to t(). A failed
+ * load is retried with backoff; after MAX_ATTEMPTS the error is returned so
+ * the caller can render a fallback, and `retry` starts over.
+ */
+export function useCatalogNamespaces(namespaces: string[]): CatalogStatus {
+  const [, setVersion] = useState(0);
+  const [attempt, setAttempt] = useState(0);
+  const [error, setError] = useState<unknown>(null);
+  const ready = areNamespacesLoaded(namespaces);
+  const key = namespaces.join(",");
+
+  // A new route starts with a clean slate.
+  useEffect(() => {
+    setAttempt(0);
+    setError(null);
+  }, [key]);
+
+  useEffect(() => {
+    if (ready || error) return;
+    let active = true;
+    const delay = attempt ? RETRY_DELAY_MS * 2 ** (attempt - 1) : 0;
+    const timer = setTimeout(() => {
+      loadNamespaces(namespaces)
+        .then(() => {
+          if (active) setVersion(version => version + 1);
+        })
+        .catch(reason => {
+          console.error("[i18n] Failed to load catalog", reason);
+          if (!active) return;
+          if (attempt + 1 < MAX_ATTEMPTS) setAttempt(attempt + 1);
+          else setError(reason ?? new Error("Failed to load catalog"));
+        });
+    }, delay);
+    return () => {
+      active = false;
+      clearTimeout(timer);
+    };
+  }, [key, ready, attempt, error]);
+
+  const retry = useCallback(() => {
+    setAttempt(0);
+    setError(null);
+  }, []);
+
+  return { ready, error, retry };
+}
@@ -1,25 +1,265 @@
 import i18n from 'i18next';
 import { initReactI18next } from 'react-i18next';
 import LanguageDetector from 'i18next-browser-languagedetector';
+import {
+  formatMessage,
+  templateSource,
+  type MessageTemplate,
+} from './lib/messageFormat';
 
-import translationEN from './locales/en.json';
-import translationJA from './locales/ja.json';
+type Catalog = Record<string, unknown>;
 
-const resources = {
-  en: {
-    translation: translationEN,
-  },
-  ja: {
-    translation: translationJA,
+// Each catalog file pairs the messages with their precompiled interpolation
+// templates (see i18n_catalog/compile.py). Messages without placeholders have
+// no template and are returned as-is.
+type CatalogChunkData = {
+  messages: Catalog;
+  templates: Record<string, MessageTemplate>;
+  // Production catalogs only; see expandMessages
+  strings?: string[];
+};
+
+export const SUPPORTED_LANGUAGES = ['ja', 'en'];
+
+// Namespaces needed for first paint. The catalog build bundles them per locale
+// into locales/core/{lng}.json; keep this list in sync with CORE_NAMESPACES in
+// i18n_catalog/split.py and with the brace pattern below.
+export const CORE_NAMESPACES = ['app', 'header', 'common', 'home'];
+
+type CatalogLoaders = Record<string, () => Promise<CatalogChunkData>>;
+
+// Catalogs are loaded lazily so that only the active locale is downloaded.
+// In development each one is a module of the app so that Vite can hot-swap it
+// (see vite.config.ts). Production builds fetch the content-hashed files listed
+// in locales/manifest.json instead (written by `build_catalogs.py build
+// --production`, see i18n_catalog/artifacts.py): a copy edit then changes only
+// that catalog's URL and the manifest, and the app bundle stays cached.
+const coreCatalogs: CatalogLoaders = import.meta.env.DEV
+  ? import.meta.glob<CatalogChunkData>('./locales/core/*.json', {
+      import: 'default',
+    })
+  : {};
+
+const namespaceCatalogs: CatalogLoaders = import.meta.env.DEV
+  ? import.meta.glob<CatalogChunkData>(
+      [
+        './locales/*/*.json',
+        '!./locales/core/*.json',
+        '!./locales/*/{app,header,common,home}.json',
+      ],
+      { import: 'default' }
+    )
+  : {};
+
+type CatalogManifest = {
+  core: Record<string, string>;
+  namespaces: Record<string, Record<string, string>>;
+};
+
+const manifestUrl = new URL(
+  `${import.meta.env.BASE_URL}locales/manifest.json`,
+  window.location.href
+);
+let manifest: Promise<CatalogManifest> | undefined;
+
+async function fetchJson<T>(url: URL, init?: RequestInit): Promise<T> {
+  const response = await fetch(url, init);
+  if (!response.ok) throw new Error(`${response.status} ${url}`);
+  return response.json();
+}
+
+function loadManifest() {
+  // The manifest is the only unhashed file, so always revalidate it.
+  manifest ??= fetchJson<CatalogManifest>(manifestUrl, { cache: 'no-cache' }).catch(
+    error => {
+      manifest = undefined;
+      throw error;
+    }
+  );
+  return manifest;
+}
+
+// A language without the namespace gets an empty chunk, like a missing module
+// in development.
+function fetchChunk(lng: string, ns?: string) {
+  return async (): Promise<CatalogChunkData> => {
+    const { core, namespaces } = await loadManifest();
+    const file = ns ? namespaces[lng]?.[ns] : core[lng];
+    if (!file) return { messages: {}, templates: {} };
+    return fetchJson<CatalogChunkData>(new URL(file, manifestUrl));
+  };
+}
+
+// Extra namespaces each route needs on top of CORE_NAMESPACES.
+export const ROUTE_NAMESPACES: Record<string, string[]> = {
+  '/': [
+    'apiKeyError',
+    'history',
+    'patterns',
+    'shortcuts',
+    'toast',
+    'template',
+    'footer',
+    'announcement',
+  ],
+  '/my-templates': ['myTemplates', 'footer'],
+  '/favorites': ['favorites', 'footer'],
+  '/guide': ['guide', 'footer'],
+  '/privacy': ['privacy'],
+  '/terms': ['terms'],
+  '/api-settings': ['apiSettings', 'footer'],
+};
+
+type CatalogChunk = {
+  lng: string;
+  path: string;
+  load?: () => Promise<CatalogChunkData>;
+  ns?: string;
+};
+
+// The core chunk plus one chunk per non-core namespace, for each language.
+function* catalogChunks(
+  namespaces: readonly string[],
+  languages: readonly string[]
+): Generator<CatalogChunk> {
+  for (const lng of languages) {
+    const corePath = `./locales/core/${lng}.json`;
+    yield {
+      lng,
+      path: corePath,
+      load: import.meta.env.DEV ? coreCatalogs[corePath] : fetchChunk(lng),
+    };
+    for (const ns of namespaces) {
+      if (CORE_NAMESPACES.includes(ns)) continue;
+      const path = `./locales/${lng}/${ns}.json`;
+      const load = import.meta.env.DEV ? namespaceCatalogs[path] : fetchChunk(lng, ns);
+      yield { lng, path, load, ns };
+    }
+  }
+}
+
+const loaded = new Set<string>();
+const pending = new Map<string, Promise<void>>();
+const requestedNamespaces = new Set<string>();
+const templates: Record<string, Record<string, MessageTemplate>> = {};
+
+function resolveStrings(node: unknown, strings: string[]): unknown {
+  if (typeof node === 'number') return strings[node];
+  if (Array.isArray(node)) return node.map(item => resolveStrings(item, strings));
+  if (node && typeof node === 'object') {
+    return Object.fromEntries(
+      Object.entries(node).map(([key, value]) => [key, resolveStrings(value, strings)])
+    );
+  }
+  return node;
+}
+
+// Production catalogs (`build_catalogs.py build --production`, see
+// i18n_catalog/minify.py) replace repeated strings with indexes into the
+// chunk's string table and omit messages that their template spells out.
+// Both are restored here, so t() sees the same catalog as in development.
+function expandMessages(ns: string | undefined, data: CatalogChunkData): Catalog {
+  const messages = data.strings
+    ? (resolveStrings(data.messages, data.strings) as Catalog)
+    : data.messages;
+  const prefix = ns ? `${ns}.` : '';
+  for (const [key, template] of Object.entries(data.templates)) {
+    const path = key.slice(prefix.length).split('.');
+    let node = messages;
+    for (const part of path.slice(0, -1)) {
+      node = (node[part] ??= {}) as Catalog;
+    }
+    node[path[path.length - 1]] ??= templateSource(template);
+  }
+  return messages;
+}
+
+function addChunk(lng: string, ns: string | undefined, data: CatalogChunkData) {
+  const messages = expandMessages(ns, data);
+  const bundle = ns ? { [ns]: messages } : messages;
+  i18n.addResourceBundle(lng, 'translation', bundle, true, true);
+  templates[lng] = { ...templates[lng], ...data.templates };
+}
+
+function loadChunk({ lng, path, load, ns }: CatalogChunk) {
+  let task = pending.get(path);
+  if (!task) {
+    task = load!()
+      .then(data => {
+        addChunk(lng, ns, data);
+        loaded.add(path);
+      })
+      .finally(() => pending.delete(path));
+    pending.set(path, task);
+  }
+  return task;
+}
+
+export function namespacesForRoute(path: string) {
+  return ROUTE_NAMESPACES[path] ?? [];
+}
+
+export function areNamespacesLoaded(
+  namespaces: string[],
+  languages: readonly string[] = i18n.languages
+) {
+  for (const chunk of catalogChunks(namespaces, languages)) {
+    if (chunk.load && !loaded.has(chunk.path)) return false;
+  }
+  return true;
+}
+
+// Loads the namespaces for the active language and its fallbacks only.
+export function loadNamespaces(
+  namespaces: string[],
+  languages: readonly string[] = i18n.languages
+): Promise<void> {
+  namespaces.forEach(ns => requestedNamespaces.add(ns));
+  const tasks: Promise<void>[] = [];
+  for (const chunk of catalogChunks(namespaces, languages)) {
+    if (chunk.load && !loaded.has(chunk.path)) tasks.push(loadChunk(chunk));
+  }
+  return Promise.all(tasks).then(() => undefined);
+}
+
+// Fetches the new language's catalogs before switching so the page never
+// renders raw keys.
+export async function changeLanguage(lng: string) {
+  const languages: string[] =
+    i18n.services.languageUtils.toResolveHierarchy(lng);
+  await loadNamespaces([...requestedNamespaces], languages);
+  await i18n.changeLanguage(lng);
+}
+
+// Replaces i18next's regex-based interpolation with the precompiled templates.
+const precompiledFormat = {
+  type: 'i18nFormat' as const,
+  // Keep returnObjects working for arrays such as terms.article2.features
+  handleAsObject: true,
+  parse(
+    res: string,
+    options: Record<string, unknown>,
+    lng: string,
+    _ns: string,
+    key: string
+  ) {
+    const template = templates[lng]?.[key];
+    return template ? formatMessage(template, options) : res;
   },
 };
 
 i18n
   .use(LanguageDetector)
+  .use(precompiledFormat)
   .use(initReactI18next)
   .init({
-    resources,
-    fallbackLng: 'ja',
+    // Catalogs are added on demand; an empty object keeps init synchronous.
+    resources: {},
+    supportedLngs: SUPPORTED_LANGUAGES,
+    // The en catalogs are pre-resolved against ja at build time (see
+    // i18n_catalog/fallback.py), so en lookups never need the ja chunks.
+    // Unsupported languages still fall back to ja.
+    fallbackLng: { en: [], default: ['ja'] },
     debug: false,
     interpolation: {
       escapeValue: false,
@@ -30,4 +270,48 @@ i18n
     },
   });
 
+type CatalogUpdate = {
+  lng: string;
+  path: string;
+  ns?: string;
+  catalog: CatalogChunkData;
+};
+
+// Replaces the namespaces of an already loaded chunk wholesale so that keys
+// deleted from the catalog disappear too.
+function replaceChunk(lng: string, ns: string | undefined, data: CatalogChunkData) {
+  const messages = expandMessages(ns, data);
+  const bundle: Catalog = ns ? { [ns]: messages } : messages;
+  const prefixes = Object.keys(bundle).map(name => `${name}.`);
+  const kept = Object.entries(templates[lng] ?? {}).filter(
+    ([key]) => !prefixes.some(prefix => key.startsWith(prefix))
+  );
+  i18n.addResourceBundle(lng, 'translation', bundle, false, true);
+  templates[lng] = { ...Object.fromEntries(kept), ...data.templates };
+}
+
+// In development the catalog build (`build_catalogs.py watch`) rewrites only the
+// namespace files whose content changed, and the i18n-catalog-hmr plugin in
+// vite.config.ts sends each one here instead of reloading the page, so the
+// open page re-renders in place and keeps its form state.
+if (import.meta.hot) {
+  import.meta.hot.on('i18n:catalog-update', (update: CatalogUpdate) => {
+    const { lng, path, ns, catalog } = update;
+    // Chunks that have not been fetched yet pick up the new content on first
+    // use; the module Vite has cached for them is stale.
+    const catalogs = ns ? namespaceCatalogs : coreCatalogs;
+    catalogs[path] = () => Promise.resolve(catalog);
+    if (!loaded.has(path)) return;
+    replaceChunk(lng, ns, catalog);
+    // react-i18next re-renders on languageChanged; nothing is remounted.
+    if (i18n.languages.includes(lng)) i18n.emit('languageChanged', i18n.language);
+  });
+}
+
+// Resolves once the detected language's core catalog and the catalogs for the
+// initial route are available.
+export const i18nReady = loadNamespaces(
+  namespacesForRoute(window.location.pathname)
+).catch(error => console.error('[i18n] Failed to load catalog', error));
+
 export default i18n;
@@ -0,0 +1,44 @@
+/**
+ * ビルド時にコンパイルされた補間テンプレートのフォーマッター
+ * （テンプレートは i18n_catalog/compile.py が生成する）
+ */
+
+/**
+ * [プレースホルダー名, セグメント]
+ * セグメントはリテラル文字列か、プレースホルダー名のインデックス
+ */
+export type MessageTemplate = [names: string[], segments: (string | number)[]];
+
+/**
+ * テンプレートから元のメッセージ（{{name}} 形式）を組み立てる
+ * 本番用カタログはテンプレートのあるメッセージを省いているので、読み込み時に復元する
+ */
+export function templateSource([names, segments]: MessageTemplate): string {
+  let result = "";
+  for (const segment of segments) {
+    result += typeof segment === "string" ? segment : `{{${names[segment]}}}`;
+  }
+  return result;
+}
+
+/**
+ * テンプレートに値を埋め込む
+ * 値が渡されなかったプレースホルダーは i18next と同じく {{name}} のまま残す
+ */
+export function formatMessage(
+  template: MessageTemplate,
+  values: Record<string, unknown>
+): string {
+  const [names, segments] = template;
+  let result = "";
+  for (const segment of segments) {
+    if (typeof segment === "string") {
+      result += segment;
+      continue;
+    }
+    const name = names[segment];
+    const value = values[name];
+    result += value === undefined ? `{{${name}}}` : String(value);
+  }
+  return result;
+}
@@ -61,7 +61,7 @@ export default function Guide() {
             {t('guide.title')}
           </h1>
           <p className="text-lg text-muted-foreground max-w-2xl mx-auto">
-            {t('guide.subtitle', { title: APP_TITLE })}
+            {t('guide.subtitle', { APP_TITLE })}
           </p>
         </div>
 
@@ -80,12 +80,12 @@ export default function Guide() {
               <CardHeader>
                 <CardTitle className="flex items-center gap-2">
                   <BookOpen className="h-5 w-5" />
-                  {t('guide.overview.what.title', { title: APP_TITLE })}
+                  {t('guide.overview.what.title', { APP_TITLE })}
                 </CardTitle>
               </CardHeader>
               <CardContent className="space-y-4">
                 <p>
-                  {t('guide.overview.what.description', { title: APP_TITLE })}
+                  {t('guide.overview.what.description', { APP_TITLE })}
                 </p>
                 <div className="grid md:grid-cols-3 gap-4 mt-6">
                   <div className="p-4 border rounded-lg">
@@ -0,0 +1,5 @@
+"""
+翻訳カタログのビルドツール
+
+translate_*.py に定義された翻訳辞書を読み込み、JSONカタログを生成する。
+"""
@@ -0,0 +1,84 @@
+"""
+本番配信用のカタログ成果物
+
+build --production で、コアバンドルとコア以外の名前空間を本番用の形式（minify.py）にして
+client/public/locales/ に書き出す。ファイル名には内容のハッシュを含め
+（ja/guide.3f9a0c1b2d.json）、gzip で事前圧縮したファイル（.json.gz）を隣に置く。
+(言語, 名前空間) → ファイルの対応は manifest.json に書き、client/src/i18n.ts が
+本番ではこれを読んで fetch する。内容の変わらないカタログは URL も変わらないので、
+デプロイをまたいでブラウザのキャッシュ（immutable）が効き続ける。
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from .compile import compile_chunk
+from .minify import minify_chunk
+from .output import serialize, write_bytes_if_changed, write_if_changed
+from .split import CORE_NAMESPACES
+
+ARTIFACTS_DIR = Path("client/public/locales")
+MANIFEST_FILE = "manifest.json"
+HASH_LENGTH = 10
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def load_manifest(directory: Path) -> dict:
+    path = directory / MANIFEST_FILE
+    if not path.exists():
+        return {"core": {}, "namespaces": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def referenced(manifest: dict) -> set[str]:
+    files = set(manifest["core"].values())
+    for catalogs in manifest["namespaces"].values():
+        files.update(catalogs.values())
+    return files
+
+
+def emit_artifacts(root: Path, trees: dict[str, dict], directory: Path = ARTIFACTS_DIR) -> list[str]:
+    """成果物とマニフェストを書き出し、更新・削除したファイルのパスを返す
+
+    直前のマニフェストが参照していたファイルは残す（デプロイ前に開いたページが
+    後から名前空間を読み込んでも 404 にならないように）。それより古いものは削除する。
+    """
+    base = root / directory
+    previous = load_manifest(base)
+    manifest: dict = {"core": {}, "namespaces": {}}
+    written = []
+
+    def emit(stem: str, chunk: dict, prefix: str = "") -> str:
+        data = serialize(minify_chunk(chunk, prefix), compact=True)
+        name = f"{stem}.{content_hash(data)}.json"
+        path = base / name
+        if write_bytes_if_changed(path, data):
+            written.append(str(path.relative_to(root)))
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        # 小さなファイルは gzip のほうが大きくなるので、そのときは圧縮版を置かない
+        if len(compressed) < len(data) and write_bytes_if_changed(path.with_name(f"{path.name}.gz"), compressed):
+            written.append(f"{path.relative_to(root)}.gz")
+        return name
+
+    for lang, tree in trees.items():
+        core = {namespace: tree[namespace] for namespace in CORE_NAMESPACES if namespace in tree}
+        manifest["core"][lang] = emit(f"core/{lang}", compile_chunk(core))
+        manifest["namespaces"][lang] = {
+            namespace: emit(f"{lang}/{namespace}", compile_chunk(catalog, f"{namespace}."), f"{namespace}.")
+            for namespace, catalog in tree.items()
+            if namespace not in CORE_NAMESPACES
+        }
+    written += write_if_changed(root, base / MANIFEST_FILE, manifest)
+
+    keep = referenced(manifest) | referenced(previous)
+    for path in sorted(base.glob("*/*.json*")):
+        name = path.relative_to(base).as_posix().removesuffix(".gz")
+        if name not in keep:
+            path.unlink()
+            written.append(str(path.relative_to(root)))
+    return written
@@ -0,0 +1,281 @@
+"""
+カタログツールのベンチマーク
+
+client/src/locales と同じ形（privacy.collection.* のような深いネスト、
+terms.article2.features のような配列、{{count}} などのプレースホルダー）の合成カタログを
+1k〜1M キーで生成し、段階ごと（load / merge / placeholders / lint / split / serialize / write）
+の時間と、サイズ全体のピーク RSS を計測する。ru_maxrss はプロセスの最大値しか分からない
+ので段階ごとには記録しない（段階ごとの割り当ては --profile-memory で見る）。サイズごとに
+新しいプロセスで計測するので、ピーク RSS は前のサイズの影響を受けない。結果は
+catalog_bench/<コミット>.json に保存し、compare で別のコミットの結果と比べる。
+"""
+
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .compile import compile_chunk
+from .lint import lint
+from .merge import Layer, load_catalog, merge_layers
+from .output import atomic_write, serialize
+from .placeholders import verify
+
+BENCH_DIR = Path("catalog_bench")
+BENCH_VERSION = 2
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+NOISE_SECONDS = 0.005
+
+# 実カタログの大きめの名前空間（guide, privacy）と同程度
+NAMESPACE_KEYS = 400
+# 0 番目がネストしたベースカタログ、残りが translate_*.py 出力相当のフラットなレイヤー
+LAYERS = 9
+PLACEHOLDER_RATE = 0.1
+ARRAY_RATE = 0.02
+
+WORDS = {
+    "ja": ("職務経歴書", "テンプレート", "履歴", "保存", "削除", "お気に入り", "求人情報", "自己PR", "読み込み中", "設定"),
+    "en": ("resume", "template", "history", "save", "delete", "favorite", "job posting", "self PR", "loading", "settings"),
+}
+PLACEHOLDERS = ("count", "date", "name", "APP_TITLE")
+
+
+def parse_size(text: str) -> int:
+    """1000 / 10k / 1m のような表記をキー数に変換する"""
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:].lower(), 1)
+    return int(text[:-1] if multiplier > 1 else text) * multiplier
+
+
+def key_path(i: int) -> list[str]:
+    """i 番目のキーのパス（名前空間.セクション.グループ.項目 の4階層）"""
+    j = i % NAMESPACE_KEYS
+    return [f"ns{i // NAMESPACE_KEYS}", f"section{j // 64}", f"group{j // 8 % 8}", f"item{j % 8}"]
+
+
+def message(rng: random.Random, lang: str, placeholder: str | None) -> str:
+    words = WORDS[lang]
+    text = ("" if lang == "ja" else " ").join(rng.choice(words) for _ in range(rng.randint(2, 8)))
+    return f"{text} {{{{{placeholder}}}}}" if placeholder else text
+
+
+def synthetic_layers(keys: int, seed: int = 0) -> dict[str, list[dict]]:
+    """言語ごとのレイヤー（先頭がネストしたベースカタログ、以降がドット区切りキーの辞書）"""
+    rng = random.Random(seed)
+    layers = {lang: [{} for _ in range(LAYERS)] for lang in WORDS}
+    for i in range(keys):
+        path = key_path(i)
+        roll = rng.random()
+        placeholder = rng.choice(PLACEHOLDERS) if roll < PLACEHOLDER_RATE else None
+        length = rng.randint(3, 6) if roll > 1 - ARRAY_RATE else 0
+        layer = i % LAYERS
+        state = rng.getstate()
+        for lang in WORDS:
+            rng.setstate(state)  # ja と en で同じ形・同じプレースホルダーにする
+            value = [message(rng, lang, None) for _ in range(length)] if length else message(rng, lang, placeholder)
+            if layer:
+                layers[lang][layer][".".join(path)] = value
+            else:
+                node = layers[lang][0]
+                for part in path[:-1]:
+                    node = node.setdefault(part, {})
+                node[path[-1]] = value
+    return layers
+
+
+def peak_rss() -> int:
+    """このプロセスのピーク RSS（バイト）"""
+    if resource is None:
+        return 0
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+@dataclass
+class StageResult:
+    seconds: float
+
+
+@dataclass
+class SizeResult:
+    keys: int
+    namespaces: int
+    bytes: dict[str, int]
+    stages: dict[str, StageResult] = field(default_factory=dict)
+    # 全段階・全繰り返しを通したピーク RSS
+    peak_rss: int = 0
+
+
+class Timer:
+    """段階ごとの最短時間（repeat 回のうち）を記録する"""
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageResult] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - started
+        previous = self.stages.get(name)
+        best = min(seconds, previous.seconds) if previous else seconds
+        self.stages[name] = StageResult(best)
+
+
+def run_pipeline(directory: Path, files: dict[str, list[Path]], timer: Timer) -> None:
+    with timer.stage("load"):
+        layers = {
+            lang: [Layer(path.name, load_catalog(path)) for path in paths]
+            for lang, paths in files.items()
+        }
+    with timer.stage("merge"):
+        trees = {lang: merge_layers(lang_layers)[0] for lang, lang_layers in layers.items()}
+    del layers
+    with timer.stage("placeholders"):
+        verify(trees["ja"], trees["en"])
+    with timer.stage("lint"):
+        lint(trees)
+    with timer.stage("split"):
+        chunks = {
+            (lang, namespace): compile_chunk(catalog, f"{namespace}.")
+            for lang, tree in trees.items()
+            for namespace, catalog in tree.items()
+        }
+    with timer.stage("serialize"):
+        data = {key: serialize(chunk) for key, chunk in chunks.items()}
+    del chunks
+    with timer.stage("write"):
+        for (lang, namespace), chunk in data.items():
+            atomic_write(directory / "out" / lang / f"{namespace}.json", chunk)
+
+
+def write_inputs(directory: Path, keys: int, seed: int = 0) -> dict[str, list[Path]]:
+    """合成カタログをレイヤーごとの JSON ファイルとして書き出す"""
+    files: dict[str, list[Path]] = {}
+    for lang, layers in synthetic_layers(keys, seed).items():
+        files[lang] = []
+        for n, catalog in enumerate(layers):
+            path = directory / (f"{lang}.json" if n == 0 else f"layer{n}_{lang}.json")
+            path.write_bytes(serialize(catalog))
+            files[lang].append(path)
+    return files
+
+
+def run_size(directory: Path, files: dict[str, list[Path]], keys: int, repeat: int) -> SizeResult:
+    """1サイズ分の計測（入力の生成とは別の新しいプロセスで呼ばれる）"""
+    timer = Timer()
+    for _ in range(repeat):
+        run_pipeline(directory, files, timer)
+    sizes = {lang: sum(path.stat().st_size for path in paths) for lang, paths in files.items()}
+    namespaces = (keys + NAMESPACE_KEYS - 1) // NAMESPACE_KEYS
+    return SizeResult(keys, namespaces, sizes, timer.stages, peak_rss())
+
+
+def in_new_process(func, *args):
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(func, *args).result()
+
+
+def git_revision(root: Path) -> tuple[str, bool]:
+    """(短いコミットハッシュ, 作業ツリーに変更があるか)"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return commit, bool(status.strip())
+
+
+def run(root: Path, sizes: list[int], repeat: int = 3, seed: int = 0, progress=None) -> dict:
+    commit, dirty = git_revision(root)
+    results = []
+    for keys in sizes:
+        # 生成や前のサイズのメモリがピーク RSS に残らないよう、計測は毎回新しいプロセスで行う
+        with tempfile.TemporaryDirectory(prefix="i18n-bench-") as temp:
+            directory = Path(temp)
+            files = in_new_process(write_inputs, directory, keys, seed)
+            result = in_new_process(run_size, directory, files, keys, repeat)
+        if progress:
+            progress(result)
+        results.append(asdict(result))
+    return {
+        "version": BENCH_VERSION,
+        "commit": commit,
+        "dirty": dirty,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def default_output(root: Path, results: dict) -> Path:
+    suffix = "-dirty" if results["dirty"] else ""
+    return root / BENCH_DIR / f"{results['commit']}{suffix}.json"
+
+
+def save(path: Path, results: dict) -> None:
+    atomic_write(path, json.dumps(results, ensure_ascii=False, indent=2).encode("utf-8"))
+
+
+@dataclass(frozen=True)
+class Comparison:
+    keys: int
+    stage: str
+    base: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.base if self.base else float("inf")
+
+    def regressed(self, threshold: float) -> bool:
+        if self.stage == "peak_rss":
+            return self.ratio > threshold
+        # 数ミリ秒の段階は揺らぎで倍率が大きく振れるので、差が小さければ無視する
+        return self.ratio > threshold and self.current - self.base > NOISE_SECONDS
+
+
+def compare(base: dict, current: dict) -> list[Comparison]:
+    """両方の結果にあるサイズ・段階の組を比べる"""
+    base_sizes = {result["keys"]: result for result in base["results"]}
+    comparisons = []
+    for result in current["results"]:
+        previous = base_sizes.get(result["keys"])
+        if previous is None:
+            continue
+        for stage, measured in result["stages"].items():
+            if stage in previous["stages"]:
+                comparisons.append(
+                    Comparison(result["keys"], stage, previous["stages"][stage]["seconds"], measured["seconds"])
+                )
+        comparisons.append(
+            Comparison(result["keys"], "peak_rss", overall_peak(previous), overall_peak(result))
+        )
+    return comparisons
+
+
+def overall_peak(result: dict) -> int:
+    if "peak_rss" in result:
+        return result["peak_rss"]
+    # BENCH_VERSION 1 は段階ごとに（その時点までの最大値を）記録していた
+    return max((stage["peak_rss"] for stage in result["stages"].values()), default=0)
@@ -0,0 +1,173 @@
+"""
+名前空間・言語ごとのカタログサイズの予算
+
+配信されるカタログ（split.py が書き出した core/{lang}.json と、コア以外の
+{lang}/{namespace}.json）について、そのままのサイズ（raw）・空白を除いたサイズ（minified）・
+minified を gzip したサイズ（gzip）を測り、catalog_budget.json の上限と比べる。
+build --production ではマニフェストが指す成果物（artifacts.py）を測り、形式の違う
+成果物には別の予算（catalog_budget.json の "production"）を使う。
+build --record-history でリリース（package.json の version）ごとのサイズを
+catalog_reports/size_history.json に残し、増え方を追えるようにする。
+"""
+
+import gzip
+import json
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .artifacts import ARTIFACTS_DIR, load_manifest
+from .merge import LOCALES_DIR
+from .output import REPORTS_DIR, write_if_changed
+from .split import CORE_NAMESPACES
+
+BUDGET_FILE = "catalog_budget.json"
+# 予算ファイルの節（開発用の形式 / 本番の成果物）
+BUDGET_SECTIONS = {False: "budgets", True: "production"}
+HISTORY_FILE = REPORTS_DIR / "size_history.json"
+METRICS = ("raw", "minified", "gzip")
+
+# budget --update で現在のサイズに上乗せする余裕と、丸めの単位（バイト）
+HEADROOM = 0.1
+ROUND_TO = 256
+
+
+def measure(data: bytes) -> dict[str, int]:
+    minified = json.dumps(
+        json.loads(data), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    return {
+        "raw": len(data),
+        "minified": len(minified),
+        "gzip": len(gzip.compress(minified, compresslevel=9, mtime=0)),
+    }
+
+
+def measure_catalogs(root: Path, locales_dir: Path = LOCALES_DIR) -> dict[str, dict[str, int]]:
+    """"{lang}/{namespace}"（コアバンドルは "core/{lang}"）→ サイズ
+
+    コアの名前空間の個別ファイルはコアバンドルに含まれて配信されないので測らない。
+    """
+    sizes = {}
+    for path in sorted((root / locales_dir).glob("*/*.json")):
+        if path.stem not in CORE_NAMESPACES:
+            sizes[f"{path.parent.name}/{path.stem}"] = measure(path.read_bytes())
+    return sizes
+
+
+def measure_artifacts(root: Path, directory: Path = ARTIFACTS_DIR) -> dict[str, dict[str, int]]:
+    """マニフェストが指す配信用の成果物のサイズ（キーは measure_catalogs と同じ）"""
+    base = root / directory
+    manifest = load_manifest(base)
+    files = {f"core/{lang}": name for lang, name in manifest["core"].items()}
+    for lang, catalogs in manifest["namespaces"].items():
+        files.update({f"{lang}/{namespace}": name for namespace, name in catalogs.items()})
+    return {chunk: measure((base / files[chunk]).read_bytes()) for chunk in sorted(files)}
+
+
+def load_budgets(root: Path) -> dict[str, dict[str, dict[str, int]]]:
+    path = root / BUDGET_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_budget(root: Path, production: bool = False) -> dict[str, dict[str, int]]:
+    return load_budgets(root).get(BUDGET_SECTIONS[production], {})
+
+
+def allowance(size: int) -> int:
+    return math.ceil(size * (1 + HEADROOM) / ROUND_TO) * ROUND_TO
+
+
+def chunk_namespace(chunk: str) -> str:
+    """"ja/favorites" → favorites、コアバンドル "core/ja" → core"""
+    directory, name = chunk.split("/")
+    return "core" if directory == "core" else name
+
+
+def write_budget(
+    root: Path, sizes: dict[str, dict[str, int]], production: bool = False, namespaces: list[str] | None = None
+) -> list[str]:
+    """現在のサイズに余裕を持たせた上限で予算ファイルの節を作り直す（もう一方の節はそのまま）
+
+    namespaces を指定したときは、その名前空間（コアバンドルは core）の予算だけを置き換え、
+    他の予算はそのまま残す。
+    """
+    budgets = load_budgets(root)
+    section = BUDGET_SECTIONS[production]
+    updated = {
+        chunk: {metric: allowance(measured[metric]) for metric in METRICS}
+        for chunk, measured in sizes.items()
+        if namespaces is None or chunk_namespace(chunk) in namespaces
+    }
+    budgets[section] = {**budgets.get(section, {}), **updated} if namespaces is not None else updated
+    return write_if_changed(root, root / BUDGET_FILE, budgets)
+
+
+@dataclass(frozen=True)
+class Overage:
+    chunk: str
+    metric: str
+    size: int
+    limit: int
+
+    def describe(self) -> str:
+        return f"{self.chunk}: {self.metric} {self.size} バイト（上限 {self.limit} バイト、+{self.size - self.limit}）"
+
+
+@dataclass
+class BudgetResult:
+    sizes: dict[str, dict[str, int]] = field(default_factory=dict)
+    overages: list[Overage] = field(default_factory=list)
+    # 予算ファイルに無い名前空間
+    unbudgeted: list[str] = field(default_factory=list)
+
+
+def check(sizes: dict[str, dict[str, int]], budgets: dict[str, dict[str, int]]) -> BudgetResult:
+    result = BudgetResult(sizes)
+    for chunk, measured in sizes.items():
+        limits = budgets.get(chunk)
+        if limits is None:
+            result.unbudgeted.append(chunk)
+            continue
+        for metric, limit in limits.items():
+            if measured[metric] > limit:
+                result.overages.append(Overage(chunk, metric, measured[metric], limit))
+    return result
+
+
+def totals(sizes: dict[str, dict[str, int]]) -> dict[str, dict[str, int]]:
+    """言語ごとの配信サイズの合計"""
+    summed: dict[str, dict[str, int]] = {}
+    for chunk, measured in sizes.items():
+        directory, name = chunk.split("/")
+        lang = name if directory == "core" else directory
+        summed.setdefault(lang, dict.fromkeys(METRICS, 0))
+        for metric in METRICS:
+            summed[lang][metric] += measured[metric]
+    return summed
+
+
+def release_version(root: Path) -> str:
+    return json.loads((root / "package.json").read_text(encoding="utf-8"))["version"]
+
+
+def record_history(root: Path, sizes: dict[str, dict[str, int]]) -> list[str]:
+    """リリースごとに1件、最新のサイズを記録する（同じ version の間は最後の1件を更新）"""
+    path = root / HISTORY_FILE
+    history = json.loads(path.read_text(encoding="utf-8")) if path.exists() else []
+    version = release_version(root)
+    if history and history[-1]["version"] == version:
+        if history[-1]["chunks"] == sizes:
+            return []
+        history.pop()
+    history.append({
+        "version": version,
+        "date": datetime.now(timezone.utc).date().isoformat(),
+        "totals": totals(sizes),
+        "chunks": sizes,
+    })
+    path.parent.mkdir(exist_ok=True)
+    return write_if_changed(root, path, history)
@@ -0,0 +1,92 @@
+"""
+インクリメンタルなカタログビルド
+
+スクリプト本体と各出力カタログの内容ハッシュをキャッシュに記録し、
+入力が変わった出力だけを書き直す。
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .output import atomic_write, serialize, write_bytes_if_changed
+from .sources import LANGS, SCRIPTS, Script, render
+from .trace import span
+
+CACHE_FILE = ".i18n_catalog_cache.json"
+# 出力の形式を変えたら上げる（古いキャッシュの出力を書き直させる）
+CACHE_VERSION = 2
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass
+class BuildResult:
+    written: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    skipped_scripts: list[str] = field(default_factory=list)
+
+
+def load_cache(root: Path) -> dict:
+    try:
+        cache = json.loads((root / CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": CACHE_VERSION, "scripts": {}, "outputs": {}}
+    if cache.get("version") != CACHE_VERSION:
+        return {"version": CACHE_VERSION, "scripts": {}, "outputs": {}}
+    return cache
+
+
+def save_cache(root: Path, cache: dict) -> None:
+    atomic_write(root / CACHE_FILE, json.dumps(cache, indent=2, sort_keys=True).encode("utf-8"))
+
+
+def file_digest(path: Path) -> str | None:
+    try:
+        return digest(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+def is_fresh(root: Path, script: Script, source_digest: str, cache: dict) -> bool:
+    """スクリプトが未変更で、出力もキャッシュ時点のまま残っているか"""
+    if cache["scripts"].get(script.path) != source_digest:
+        return False
+    for output in script.outputs:
+        for lang in LANGS:
+            name = output.filename(lang)
+            recorded = cache["outputs"].get(name)
+            if recorded is None or file_digest(root / name) != recorded:
+                return False
+    return True
+
+
+def build(root: Path, force: bool = False) -> BuildResult:
+    """全スクリプトのカタログを生成する。変更のない出力は書き込まない"""
+    cache = load_cache(root)
+    result = BuildResult()
+
+    for script in SCRIPTS:
+        source = (root / script.path).read_bytes()
+        source_digest = digest(source)
+        if not force and is_fresh(root, script, source_digest, cache):
+            result.skipped_scripts.append(script.path)
+            continue
+
+        with span("render_script", script=script.path):
+            rendered = render(script, source.decode("utf-8"))
+        for (stem, lang), catalog in rendered.items():
+            name = f"{stem}_{lang}.json"
+            data = serialize(catalog)
+            if write_bytes_if_changed(root / name, data):
+                result.written.append(name)
+            else:
+                result.unchanged.append(name)
+            cache["outputs"][name] = digest(data)
+        cache["scripts"][script.path] = source_digest
+
+    save_cache(root, cache)
+    return result
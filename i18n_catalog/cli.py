@@ -0,0 +1,670 @@
+"""
+カタログビルドのコマンドライン入口
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from .artifacts import ARTIFACTS_DIR, emit_artifacts
+from .bench import DEFAULT_SIZES, compare, default_output, parse_size, run as run_bench, save as save_bench
+from .budget import (
+    BUDGET_FILE,
+    HISTORY_FILE,
+    BudgetResult,
+    chunk_namespace,
+    load_budget,
+    measure_artifacts,
+    measure_catalogs,
+    record_history,
+    totals,
+    write_budget,
+)
+from .budget import check as check_budget
+from .build import build
+from .codemod import LITERALS_SCRIPT
+from .codemod import run as run_codemod
+from .constants import load_constants
+from .fallback import lookup, resolve_fallbacks
+from .fallback import write_report as write_fallback_report
+from .fuzzy import build_index, human_translations
+from .glossary import GLOSSARY_FILE, Glossary
+from .glossary import check as check_glossary
+from .lint import RULES, lint
+from .literals import DRAFTS_DIR, propose, scan_file, source_files, write_drafts
+from .memory import TranslationMemory
+from .merge import LOCALES_DIR, MergeResult, load_catalog, locale_path, merge_locales, write_locales
+from .mt import TARGET_LANGS, Client, apply_translations, load_translations, missing, translate
+from .output import ROOT
+from .placeholders import Mismatch, verify
+from .prune import prune
+from .prune import write_report as write_prune_report
+from .split import CORE_NAMESPACES, split_locales
+from .trace import TRACE_FILE, span
+from .trace import start as start_trace
+from .trace import stop as stop_trace
+from .usage import UsageIndex
+from .variants import (
+    VARIANTS_DIR,
+    VARIANTS_FILE,
+    Variant,
+    find_variant,
+    load_variants,
+    render,
+    render_variants,
+)
+from .watch import watch
+
+
+def report_conflicts(result: MergeResult) -> int:
+    count = 0
+    for lang, conflicts in result.conflicts.items():
+        for conflict in conflicts:
+            print(f"[{lang}] {conflict.describe()}")
+        count += len(conflicts)
+    return count
+
+
+def report_mismatches(mismatches: list[Mismatch]) -> int:
+    for mismatch in mismatches:
+        print(f"プレースホルダーの不一致: {mismatch.describe()}")
+    return len(mismatches)
+
+
+def budget_command(namespaces, production: bool = False) -> str:
+    """指定した名前空間の予算だけを作り直すコマンド"""
+    option = " --production" if production else ""
+    return f"python3 build_catalogs.py budget{option} --update {' '.join(sorted(set(namespaces)))}"
+
+
+def report_budget(result: BudgetResult, production: bool = False) -> int:
+    for chunk in result.unbudgeted:
+        print(f"{chunk}: {BUDGET_FILE} に予算がありません（{budget_command([chunk_namespace(chunk)], production)} で追加）")
+    for overage in result.overages:
+        print(f"予算超過: {overage.describe()}")
+    if result.overages:
+        namespaces = [chunk_namespace(overage.chunk) for overage in result.overages]
+        print(f"意図した増加なら {budget_command(namespaces, production)} で予算を更新してください")
+    return len(result.overages)
+
+
+def run_scripts(args: argparse.Namespace) -> None:
+    with span("scripts"):
+        result = build(ROOT, force=args.force)
+    for name in result.written:
+        print(f"更新: {name}")
+    print(
+        f"書き込み {len(result.written)} 件 / 変更なし {len(result.unchanged)} 件 / "
+        f"スキップしたスクリプト {len(result.skipped_scripts)} 本"
+    )
+
+
+def prepare(shake: bool = True, strict: bool = False) -> dict[str, dict] | None:
+    """マージ・プレースホルダー検証・フォールバック解決・未使用キーの除去（全バリアント共通の処理）
+
+    strict では衝突があれば何も書き出さずに None を返す。
+    """
+    with span("merge"):
+        merged = merge_locales(ROOT, write=False)
+    conflicts = report_conflicts(merged)
+    if conflicts and strict:
+        print(f"衝突が {conflicts} 件あります")
+        return None
+    merged.written = write_locales(ROOT, merged.trees)
+    for name in merged.written:
+        print(f"更新: {name}")
+    with span("placeholders"):
+        mismatches = verify(merged.trees["ja"], merged.trees["en"])
+    if report_mismatches(mismatches):
+        return None
+    with span("mt"):
+        trees, translated = apply_translations(ROOT, merged.trees)
+    for lang, keys in translated.items():
+        if keys:
+            print(f"[{lang}] 機械翻訳で補ったキー: {len(keys)} 件")
+    with span("fallback"):
+        resolved = resolve_fallbacks(trees)
+        written = write_fallback_report(ROOT, resolved)
+    for name in written:
+        print(f"更新: {name}")
+    for lang, filled in resolved.filled.items():
+        if filled:
+            print(f"[{lang}] フォールバックで補ったキー: {len(filled)} 件")
+    if not shake:
+        return resolved.trees
+
+    with span("usage"):
+        index = UsageIndex.load(ROOT)
+        index.update(ROOT)
+        index.save(ROOT)
+    with span("prune"):
+        pruned = prune(ROOT, resolved.trees, index)
+        written = write_prune_report(ROOT, pruned)
+    for name in written:
+        print(f"更新: {name}")
+    for lang, removed in pruned.removed.items():
+        saved = sum(sizes.get(lang, 0) for sizes in pruned.saved.values())
+        print(f"[{lang}] 未使用のキー {len(removed)} 件を除去（{saved} バイト削減）")
+    return pruned.trees
+
+
+def cmd_build(args: argparse.Namespace) -> int:
+    run_scripts(args)
+    trees = prepare(shake=not args.no_prune, strict=args.strict)
+    if trees is None:
+        return 1
+
+    # コミットする client/src/locales は常に既定の描画で、環境変数の定数も畳み込まない
+    # （実行する人や CI の環境で内容が変わらないように）。定数はバリアント
+    # （build/catalogs/<name>）と本番の成果物にだけ畳み込み、本番ビルドでは
+    # 配信する成果物をバリアントで作る
+    constants = load_constants(ROOT)
+    with span("render", variant="default"):
+        rendered = render(trees, Variant("default"), {})
+    with span("split"):
+        written = split_locales(ROOT, rendered)
+    locales_dir = LOCALES_DIR
+    variant = Variant("default")
+    if args.variant:
+        variant = find_variant(ROOT, args.variant)
+        locales_dir = VARIANTS_DIR / variant.name
+        with span("render", variant=variant.name):
+            rendered = render(trees, variant, constants)
+        with span("split"):
+            written += split_locales(ROOT, rendered, locales_dir)
+    if args.production:
+        if not args.variant and constants:
+            with span("render", variant=variant.name):
+                rendered = render(trees, variant, constants)
+        with span("artifacts"):
+            written += emit_artifacts(ROOT, rendered)
+    for name in written:
+        print(f"更新: {name}")
+
+    with span("budget"):
+        # 本番ビルドでは実際に配信するハッシュ付きの成果物を測る
+        sizes = measure_artifacts(ROOT) if args.production else measure_catalogs(ROOT, locales_dir)
+        budget = check_budget(sizes, load_budget(ROOT, args.production))
+    if args.record_history:
+        for name in record_history(ROOT, sizes):
+            print(f"更新: {name}")
+    return 1 if report_budget(budget, args.production) else 0
+
+
+def cmd_variants(args: argparse.Namespace) -> int:
+    variants = load_variants(ROOT)
+    if args.only:
+        variants = [variant for variant in variants if variant.name in args.only]
+    if not variants:
+        print(f"{VARIANTS_FILE} にバリアントが定義されていません")
+        return 1
+
+    run_scripts(args)
+    trees = prepare(shake=not args.no_prune)
+    if trees is None:
+        return 1
+
+    # ワーカープロセス内の段階は記録されない（プール全体で1つのスパン）
+    with span("render_variants", variants=len(variants)):
+        results = render_variants(ROOT, trees, variants, load_constants(ROOT), args.jobs, args.production)
+    for name, written in results.items():
+        print(f"[{name}] 書き込み {len(written)} 件 → {VARIANTS_DIR / name}")
+    return 0
+
+
+def cmd_merge(args: argparse.Namespace) -> int:
+    write = not (args.check or args.include_superseded)
+    merged = merge_locales(ROOT, write=write, include_superseded=args.include_superseded)
+    for name in merged.written:
+        print(f"更新: {name}")
+    conflicts = report_conflicts(merged)
+    print(f"衝突 {conflicts} 件")
+    return 1 if conflicts and not write else 0
+
+
+def cmd_placeholders(args: argparse.Namespace) -> int:
+    ja = load_catalog(locale_path(ROOT, "ja"))
+    en = load_catalog(locale_path(ROOT, "en"))
+    mismatches = report_mismatches(verify(ja, en))
+    print(f"プレースホルダーの不一致 {mismatches} 件")
+    return 1 if mismatches else 0
+
+
+def cmd_usage(args: argparse.Namespace) -> int:
+    index = UsageIndex.load(ROOT)
+    stats = index.update(ROOT, jobs=args.jobs, full=args.full)
+    index.save(ROOT)
+    print(f"スキャン {stats.scanned} 件 / 再利用 {stats.reused} 件 / 削除 {stats.removed} 件")
+
+    if args.key:
+        for key in args.key:
+            locations = index.lookup(key)
+            for path, line in locations:
+                print(f"{key}: {path}:{line}")
+            if not locations:
+                print(f"{key}: 参照なし")
+        return 0
+
+    references = index.references()
+    patterns = index.dynamic_patterns()
+    print(f"静的なキー {len(references)} 件 / 動的なパターン {len(patterns)} 件")
+    ja = load_catalog(locale_path(ROOT, "ja"))
+    missing = 0
+    for key, locations in references.items():
+        if lookup(ja, key) is None:
+            path, line = locations[0]
+            print(f"カタログにないキー: {key} ({path}:{line})")
+            missing += 1
+    return 1 if missing and args.strict else 0
+
+
+def cmd_literals(args: argparse.Namespace) -> int:
+    files = args.paths or source_files(ROOT)
+    literals = [literal for path in files for literal in scan_file(ROOT, path)]
+    proposals = propose(literals, load_catalog(locale_path(ROOT, "ja")))
+    for name in write_drafts(ROOT, proposals):
+        print(f"更新: {name}")
+
+    counts: dict[str, int] = {}
+    for proposal in proposals:
+        counts[proposal.literal.path] = counts.get(proposal.literal.path, 0) + 1
+    for path, count in counts.items():
+        print(f"{path}: {count} 件")
+    for proposal in proposals:
+        if proposal.numbered:
+            print(f"警告: {proposal.literal.path}:{proposal.literal.line} は名前が決められず番号を付けました: {proposal.key}")
+    reused = sum(proposal.existing for proposal in proposals)
+    print(f"ハードコードされた文字列 {len(proposals)} 件（既存キーを再利用 {reused} 件）→ {DRAFTS_DIR}")
+    return 1 if proposals and args.check else 0
+
+
+def cmd_codemod(args: argparse.Namespace) -> int:
+    paths = args.paths or sorted(str(path.relative_to(ROOT)) for path in (ROOT / "client/src/pages").glob("*.tsx"))
+    try:
+        result = run_codemod(ROOT, paths, load_catalog(locale_path(ROOT, "ja")), args.jobs, args.dry_run)
+    except ValueError as error:
+        print(f"書き換えを中止しました: {error}")
+        return 1
+    for edit in result.edits:
+        if edit.applied or edit.skipped:
+            print(f"{edit.path}: 書き換え {len(edit.applied)} 件 / コンポーネント外のため未対応 {len(edit.skipped)} 件")
+        if edit.applied:
+            namespaces = sorted({proposal.key.split(".")[0] for proposal in edit.applied})
+            print(f"  使用する名前空間: {', '.join(namespaces)}")
+        for literal in edit.skipped:
+            print(f"  {literal.path}:{literal.line} {literal.text}")
+        for proposal in edit.applied:
+            if proposal.numbered:
+                print(f"  警告: {proposal.literal.line} 行目は名前が決められず番号を付けました: {proposal.key}")
+    for route, namespaces in result.registered.items():
+        print(f"ROUTE_NAMESPACES['{route}'] に追加: {', '.join(namespaces)}")
+    verb = "書き換え予定" if args.dry_run else "更新"
+    for name in result.written:
+        print(f"{verb}: {name}")
+    print(f"{LITERALS_SCRIPT} に追加したキー {len(result.added)} 件")
+    if result.added and not args.dry_run:
+        # 追加した文言の分だけ名前空間のカタログが大きくなり、build の予算の確認に掛かる
+        # （コアの名前空間はコアバンドルの予算）
+        added = {key.split(".")[0] for key in result.added}
+        namespaces = sorted({"core" if namespace in CORE_NAMESPACES else namespace for namespace in added})
+        budgeted = {chunk_namespace(chunk) for chunk in load_budget(ROOT)}
+        print("次の手順でカタログと予算に反映してください:")
+        print("  1. python3 build_catalogs.py（予算の確認で失敗しても、カタログは書き出されます）")
+        print(f"  2. {budget_command(namespaces)}")
+        for namespace in namespaces:
+            print(f"     {namespace}: {'予算を今のサイズから作り直します' if namespace in budgeted else '予算が無いので追加します'}")
+        print("  3. python3 build_catalogs.py（予算に収まることを確認）")
+        print(f"  本番の成果物の予算は build --production の後に {budget_command(namespaces, production=True)}")
+    return 0
+
+
+def cmd_mt(args: argparse.Namespace) -> int:
+    # translate_*.py に足したばかりの ja も対象にするため、build と同じく先に出力を作り直す
+    run_scripts(args)
+    merged = merge_locales(ROOT)
+    for name in merged.written:
+        print(f"更新: {name}")
+    if args.dry_run:
+        memory = TranslationMemory.load(ROOT)
+        for lang in TARGET_LANGS:
+            requests = missing(merged.trees, lang, load_translations(ROOT, lang))
+            index = build_index(memory, human_translations(merged.trees["ja"], merged.trees[lang]), lang)
+            for request in requests:
+                suggestion = "".join(
+                    f" → {match.target}（{match.score:.2f}）" for match in index.search(request.source, 1)
+                )
+                print(f"[{lang}] {request.key}: {request.source}{suggestion}")
+            print(f"[{lang}] 翻訳が必要なキー {len(requests)} 件")
+        return 0
+
+    try:
+        result = translate(
+            ROOT, merged.trees, Client.from_environ(),
+            concurrency=args.concurrency, rate=args.rpm / 60, batch_size=args.batch_size,
+        )
+    except (OSError, ValueError, KeyError) as error:
+        print(f"翻訳に失敗しました: {error}")
+        print("完了したバッチは記録済みです。再実行すると続きから翻訳します")
+        return 1
+    for name in result.written:
+        print(f"更新: {name}")
+    for lang in result.translated:
+        print(
+            f"[{lang}] 翻訳 {len(result.translated[lang])} 件 / 翻訳メモリから {len(result.reused[lang])} 件 / "
+            f"既存の訳から {len(result.prefilled[lang])} 件 / 失敗 {len(result.failed[lang])} 件（リクエスト {result.requests} 回）"
+        )
+        for key in result.failed[lang]:
+            print(f"[{lang}] 翻訳できなかったキー: {key}")
+    return 1 if any(result.failed.values()) else 0
+
+
+def cmd_tm(args: argparse.Namespace) -> int:
+    merged = merge_locales(ROOT, write=False)
+    index = build_index(
+        TranslationMemory.load(ROOT), human_translations(merged.trees["ja"], merged.trees[args.lang]), args.lang
+    )
+    for text in args.text:
+        started = time.perf_counter()
+        matches = index.search(text, args.k, args.threshold)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"{text}（{len(index)} 件から {elapsed:.2f} ms）")
+        for match in matches:
+            print(f"  {match.score:.2f} {match.source} → {match.target}")
+    return 0
+
+
+def cmd_glossary(args: argparse.Namespace) -> int:
+    merged = merge_locales(ROOT, write=False)
+    trees, _ = apply_translations(ROOT, merged.trees)
+    glossary = Glossary.load(ROOT)
+    started = time.perf_counter()
+    violations = check_glossary(trees, glossary)
+    elapsed = (time.perf_counter() - started) * 1000
+    for violation in violations:
+        print(violation.describe())
+    print(f"用語 {len(glossary.terms)} 件 / 訳語の不一致 {len(violations)} 件（{elapsed:.1f} ms）")
+    return 1 if violations and args.strict else 0
+
+
+def cmd_lint(args: argparse.Namespace) -> int:
+    merged = merge_locales(ROOT, write=False)
+    trees, _ = apply_translations(ROOT, merged.trees)
+    started = time.perf_counter()
+    report = lint(trees, args.rule)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    counts = {severity: 0 for severity in ("error", "warning", "info")}
+    for finding in report.findings:
+        counts[finding.severity] += 1
+    if args.format == "json":
+        print(json.dumps({"findings": report.to_json(), "counts": counts}, ensure_ascii=False, indent=2))
+    else:
+        for finding in report.findings:
+            if finding.severity != "info" or args.verbose:
+                print(finding.describe())
+        print(f"error {counts['error']} 件 / warning {counts['warning']} 件 / info {counts['info']} 件（{elapsed:.1f} ms）")
+    failed = counts["error"] + (counts["warning"] if args.strict else 0)
+    return 1 if failed else 0
+
+
+def cmd_watch(args: argparse.Namespace) -> int:
+    variant = find_variant(ROOT, args.variant) if args.variant else None
+    try:
+        for changed, written, elapsed in watch(ROOT, args.debounce / 1000, variant):
+            if not changed:
+                print(f"初回ビルド: 書き込み {len(written)} 件。変更を監視しています（Ctrl+C で終了）")
+                continue
+            names = ", ".join(sorted(str(path.relative_to(ROOT)) for path in changed))
+            print(f"{names} → 書き込み {len(written)} 件（{elapsed * 1000:.0f} ms）")
+            for name in written:
+                print(f"  更新: {name}")
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_budget(args: argparse.Namespace) -> int:
+    # build と同じ形式を測る（--production は build --production が書き出した成果物）
+    sizes = measure_artifacts(ROOT) if args.production else measure_catalogs(ROOT)
+    if not sizes:
+        print(f"測るカタログがありません（先に build{' --production' if args.production else ''} を実行してください）")
+        return 1
+    if args.update:
+        unknown = sorted(set(args.namespaces) - {chunk_namespace(chunk) for chunk in sizes})
+        if unknown:
+            print(f"測ったカタログに無い名前空間です: {', '.join(unknown)}")
+            return 1
+        before = load_budget(ROOT, args.production)
+        for name in write_budget(ROOT, sizes, args.production, args.namespaces or None):
+            print(f"更新: {name}")
+        for chunk, limits in load_budget(ROOT, args.production).items():
+            if chunk not in before:
+                print(f"予算を追加: {chunk} " + " / ".join(f"{metric} {limits[metric]}" for metric in limits))
+            elif limits != before[chunk]:
+                changes = [f"{metric} {before[chunk].get(metric)} → {limit}" for metric, limit in limits.items()]
+                print(f"予算を変更: {chunk} " + " / ".join(changes))
+        return 0
+
+    budgets = load_budget(ROOT, args.production)
+    print(f"{'':<22}{'raw':>16}{'minified':>16}{'gzip':>16}")
+    for chunk, measured in sizes.items():
+        limits = budgets.get(chunk, {})
+        cells = "".join(
+            f"{measured[metric]:>8} / {limits[metric]:<5}" if metric in limits else f"{measured[metric]:>8} / -    "
+            for metric in ("raw", "minified", "gzip")
+        )
+        print(f"{chunk:<22}{cells}")
+    for lang, summed in totals(sizes).items():
+        print(f"合計 [{lang}]: raw {summed['raw']} / minified {summed['minified']} / gzip {summed['gzip']} バイト")
+    return 1 if report_budget(check_budget(sizes, budgets), args.production) else 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    def progress(result) -> None:
+        print(f"{result.keys:,} キー（{result.namespaces} 名前空間、ja {result.bytes['ja'] / 1e6:.1f} MB）")
+        for stage, measured in result.stages.items():
+            print(f"  {stage:<13}{measured.seconds * 1000:10.1f} ms")
+        print(f"  ピーク RSS {result.peak_rss / 2**20:.1f} MB")
+
+    # 保存先が比較対象と同じファイルでも上書き前の結果と比べる
+    base = json.loads(Path(args.compare).read_text(encoding="utf-8")) if args.compare else None
+    results = run_bench(ROOT, args.sizes, args.repeat, progress=progress)
+    output = Path(args.output) if args.output else default_output(ROOT, results)
+    save_bench(output, results)
+    print(f"結果: {output.relative_to(ROOT) if output.is_relative_to(ROOT) else output}")
+    if base is None:
+        return 0
+
+    regressions = 0
+    print(f"比較対象: {base['commit']}")
+    for comparison in compare(base, results):
+        slower = comparison.regressed(args.threshold)
+        regressions += slower
+        if comparison.stage == "peak_rss":
+            values = f"{comparison.base / 2**20:.1f} → {comparison.current / 2**20:.1f} MB"
+        else:
+            values = f"{comparison.base * 1000:.1f} → {comparison.current * 1000:.1f} ms"
+        mark = "  ← 悪化" if slower else ""
+        print(f"  {comparison.keys:>9,} {comparison.stage:<13}{values}（×{comparison.ratio:.2f}）{mark}")
+    return 1 if regressions else 0
+
+
+def run_profiled(args: argparse.Namespace) -> int:
+    tracer = start_trace(memory=args.profile_memory)
+    try:
+        with span(args.command or "build"):
+            return args.func(args)
+    finally:
+        stop_trace()
+        path = ROOT / args.trace_file
+        tracer.save(path)
+        print(f"\nトレース: {path.relative_to(ROOT) if path.is_relative_to(ROOT) else path}（chrome://tracing や Perfetto で開けます）")
+        for name, count, total in tracer.summary()[:15]:
+            print(f"  {name:<16}{count:>5} 回 {total / 1e6:10.1f} ms")
+        for stage in tracer.spans:
+            if stage.depth == 1 and stage.allocations:
+                print(f"\n[{stage.name}] 割り当ての多い箇所")
+                for allocation in stage.allocations:
+                    print(f"  {allocation.size / 1024:+10.1f} KiB ({allocation.count:+d}) {allocation.site}")
+
+
+def positive(kind):
+    """argparse の type: 0 以下の値をエラーにする（--rpm 0 などで止まらないように）"""
+    def parse(text: str):
+        value = kind(text)
+        if value <= 0:
+            raise argparse.ArgumentTypeError(f"正の数を指定してください: {text}")
+        return value
+    return parse
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="build_catalogs.py", description="翻訳カタログをビルドする"
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help=f"段階ごとのスパンを Chrome のトレースイベント形式で書き出す（既定: {TRACE_FILE}）",
+    )
+    parser.add_argument("--profile-memory", action="store_true", help="--profile に加えて段階ごとの割り当て箇所を tracemalloc で計測")
+    parser.add_argument("--trace-file", default=TRACE_FILE, help="トレースの保存先")
+    subparsers = parser.add_subparsers(dest="command")
+
+    build_parser = subparsers.add_parser("build", help="translate_*.py からカタログを生成")
+    build_parser.add_argument("--force", action="store_true", help="キャッシュを無視して全て再生成")
+    build_parser.add_argument("--strict", action="store_true", help="マージ時の衝突をエラーにする")
+    build_parser.add_argument(
+        "--variant", help=f"{VARIANTS_FILE} のバリアントを {VARIANTS_DIR}/<name>/（--production では配信用の成果物）に描画"
+    )
+    build_parser.add_argument("--no-prune", action="store_true", help="未使用のキーを除去しない")
+    build_parser.add_argument(
+        "--production", action="store_true", help=f"ハッシュ付き・事前圧縮済みの本番用カタログを {ARTIFACTS_DIR} に書き出す"
+    )
+    build_parser.add_argument(
+        "--record-history", action="store_true", help=f"カタログのサイズを {HISTORY_FILE} に記録する（リリース時）"
+    )
+    build_parser.set_defaults(func=cmd_build)
+
+    variants_parser = subparsers.add_parser(
+        "variants", help=f"全バリアントを並列に {VARIANTS_DIR}/<name>/ へ描画"
+    )
+    variants_parser.add_argument("--force", action="store_true", help="キャッシュを無視して全て再生成")
+    variants_parser.add_argument("--jobs", type=int, help="並列数（既定: CPU 数）")
+    variants_parser.add_argument("--only", nargs="+", metavar="NAME", help="描画するバリアント")
+    variants_parser.add_argument("--no-prune", action="store_true", help="未使用のキーを除去しない")
+    variants_parser.add_argument(
+        "--production", action="store_true", help="ハッシュ付き・事前圧縮済みの本番用カタログとマニフェストを書き出す"
+    )
+    variants_parser.set_defaults(func=cmd_variants)
+
+    merge_parser = subparsers.add_parser("merge", help="スクリプト出力をロケールカタログにマージ")
+    merge_parser.add_argument("--check", action="store_true", help="書き込まずに衝突だけを検査")
+    merge_parser.add_argument(
+        "--include-superseded",
+        action="store_true",
+        help="置き換え済みの出力も含めて衝突を検査（書き込みなし）",
+    )
+    merge_parser.set_defaults(func=cmd_merge)
+
+    placeholders_parser = subparsers.add_parser(
+        "placeholders", help="ja と en のプレースホルダーの一致を検査（pre-commit 用）"
+    )
+    placeholders_parser.set_defaults(func=cmd_placeholders)
+
+    usage_parser = subparsers.add_parser(
+        "usage", help="client/src の翻訳キー使用箇所インデックスを更新して検査"
+    )
+    usage_parser.add_argument("--key", nargs="+", help="キーの参照箇所を表示")
+    usage_parser.add_argument("--full", action="store_true", help="インデックスを無視して全ファイルを再スキャン")
+    usage_parser.add_argument("--jobs", type=int, help="並列数（既定: CPU 数）")
+    usage_parser.add_argument("--strict", action="store_true", help="カタログにないキーをエラーにする")
+    usage_parser.set_defaults(func=cmd_usage)
+
+    literals_parser = subparsers.add_parser(
+        "literals", help="client/src にハードコードされた日本語を検出してキーを提案"
+    )
+    literals_parser.add_argument("paths", nargs="*", help="対象の .tsx（既定: client/src 全体）")
+    literals_parser.add_argument("--check", action="store_true", help="検出したらエラー終了")
+    literals_parser.set_defaults(func=cmd_literals)
+
+    codemod_parser = subparsers.add_parser(
+        "codemod", help="ハードコードされた日本語を t() 呼び出しに書き換え、キーを追加"
+    )
+    codemod_parser.add_argument("paths", nargs="*", help="対象の .tsx（既定: client/src/pages）")
+    codemod_parser.add_argument("--jobs", type=int, help="並列数（既定: CPU 数）")
+    codemod_parser.add_argument("--dry-run", action="store_true", help="書き込まずに対象を表示")
+    codemod_parser.set_defaults(func=cmd_codemod)
+
+    mt_parser = subparsers.add_parser(
+        "mt", help="en に無いキーを OpenAI 互換 API でまとめて機械翻訳"
+    )
+    mt_parser.add_argument("--concurrency", type=positive(int), default=4, help="同時リクエスト数（既定: 4）")
+    mt_parser.add_argument("--rpm", type=positive(float), default=60, help="1分あたりのリクエスト数の上限（既定: 60）")
+    mt_parser.add_argument("--batch-size", type=positive(int), default=40, help="1リクエストあたりのキー数（既定: 40）")
+    mt_parser.add_argument("--dry-run", action="store_true", help="翻訳せずに対象のキーを表示")
+    mt_parser.set_defaults(func=cmd_mt)
+
+    tm_parser = subparsers.add_parser("tm", help="翻訳メモリと既存の訳から似た文字列の訳を検索")
+    tm_parser.add_argument("text", nargs="+", help="検索する原文（ja）")
+    tm_parser.add_argument("--lang", default="en", help="訳文の言語（既定: en）")
+    tm_parser.add_argument("-k", type=int, default=5, help="表示する件数（既定: 5）")
+    tm_parser.add_argument("--threshold", type=float, default=0.5, help="類似度（Jaccard 係数）の下限（既定: 0.5）")
+    tm_parser.set_defaults(func=cmd_tm)
+
+    glossary_parser = subparsers.add_parser(
+        "glossary", help=f"{GLOSSARY_FILE} の用語が承認済みの訳語で訳されているかを検査"
+    )
+    glossary_parser.add_argument("--strict", action="store_true", help="不一致があればエラー終了")
+    glossary_parser.set_defaults(func=cmd_glossary)
+
+    lint_parser = subparsers.add_parser("lint", help="マージ済みカタログを1回の走査で検査")
+    lint_parser.add_argument("--rule", nargs="+", choices=sorted(RULES), help="実行するルール（既定: 全て）")
+    lint_parser.add_argument("--format", choices=("text", "json"), default="text", help="出力形式")
+    lint_parser.add_argument("--strict", action="store_true", help="warning もエラーにする")
+    lint_parser.add_argument("-v", "--verbose", action="store_true", help="info も表示")
+    lint_parser.set_defaults(func=cmd_lint)
+
+    watch_parser = subparsers.add_parser(
+        "watch", help="ソースの変更を監視し、変わった名前空間だけを再生成"
+    )
+    watch_parser.add_argument("--debounce", type=float, default=50, help="連続した保存をまとめる待ち時間（ミリ秒、既定: 50）")
+    watch_parser.add_argument("--variant", help=f"{VARIANTS_FILE} のバリアントを {VARIANTS_DIR}/<name>/ に描画")
+    watch_parser.set_defaults(func=cmd_watch)
+
+    budget_parser = subparsers.add_parser(
+        "budget", help="名前空間・言語ごとのサイズ（raw / minified / gzip）を予算と比較"
+    )
+    budget_parser.add_argument("--update", action="store_true", help=f"現在のサイズに余裕を持たせて {BUDGET_FILE} を作り直す")
+    budget_parser.add_argument(
+        "namespaces", nargs="*", help="--update で予算を作り直す名前空間（コアバンドルは core。既定: 全て）"
+    )
+    budget_parser.add_argument(
+        "--production", action="store_true", help=f"{ARTIFACTS_DIR} の本番用の成果物を測り、本番用の予算と比べる"
+    )
+    budget_parser.set_defaults(func=cmd_budget)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="合成カタログで各段階の時間とピーク RSS を計測"
+    )
+    bench_parser.add_argument(
+        "--sizes", nargs="+", type=parse_size, default=list(DEFAULT_SIZES),
+        help="キー数（10k や 1m のようにも書ける。既定: 1k 10k 100k）",
+    )
+    bench_parser.add_argument("--repeat", type=int, default=3, help="各サイズの繰り返し回数（最短時間を記録、既定: 3）")
+    bench_parser.add_argument("--output", help="結果の保存先（既定: catalog_bench/<コミット>.json）")
+    bench_parser.add_argument("--compare", help="比較する過去の結果ファイル")
+    bench_parser.add_argument(
+        "--threshold", type=float, default=1.25, help="この倍率を超えて遅く・大きくなったら悪化とみなす（既定: 1.25）"
+    )
+    bench_parser.set_defaults(func=cmd_bench)
+
+    # サブコマンド省略時は build として扱う
+    parser.set_defaults(
+        func=cmd_build, force=False, strict=False, variant=None, no_prune=False, production=False, record_history=False
+    )
+
+    args = parser.parse_args(argv)
+    if not (args.profile or args.profile_memory):
+        return args.func(args)
+    return run_profiled(args)
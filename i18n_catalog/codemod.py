@@ -0,0 +1,305 @@
+"""
+ハードコードされた日本語を t() 呼び出しに書き換えるコードモッド
+
+literals.py が検出したリテラルを、ファイル内の位置（文字オフセット）での
+置き換えとして後ろから順に適用する。正規表現によるファイル全体の置換は行わないため、
+書き換えた箇所以外の整形はそのまま残る。useTranslation の import とフックの呼び出しが
+無いコンポーネントには追加し、t を取り出していない呼び出し（const { i18n } = …）には t を
+加える。新しいキーは translate_literals.py の辞書に追加し、ページが使う名前空間は
+client/src/i18n.ts の ROUTE_NAMESPACES のそのページのルートに登録する。ソースファイル・
+辞書・i18n.ts はまとめて（全て書き込めた場合だけ）置き換える。
+"""
+
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .literals import KeyIndex, Literal, Proposal, namespace_for, propose_key, scan_source
+from .sources import load_dicts
+from .split import CORE_NAMESPACES
+from .usage import SOURCE_DIR
+
+LITERALS_SCRIPT = "translate_literals.py"
+LITERALS_VARIABLES = ("literals_ja", "literals_en")
+
+# トップレベルのコンポーネント定義（function Home( / const Footer = ...）
+COMPONENT = re.compile(r"^(?:export\s+(?:default\s+)?)?(?:function\s+[A-Z]\w*\s*\(|const\s+[A-Z]\w*\s*(?::[^=\n]+)?=\s*(?:\([^\n]*\)|\w+)\s*(?::[^=\n]+)?=>)", re.M)
+COMPONENT_END = re.compile(r"^\};?[ \t]*$", re.M)
+BODY = re.compile(r"(?:\)|=>)[ \t]*\{[ \t]*\n")
+IMPORT = re.compile(r"^import\s[^;]*?from\s+(['\"])[^'\"]+\1;?[ \t]*\n", re.M | re.S)
+HOOK_CALL = re.compile(r"\{([^{}]*)\}\s*=\s*useTranslation\(")
+
+# ページのルートと、ルートごとに読み込む名前空間
+APP_FILE = SOURCE_DIR / "App.tsx"
+I18N_FILE = SOURCE_DIR / "i18n.ts"
+DEFAULT_IMPORT = re.compile(r"^import\s+(\w+)\s+from\s+[\"']([^\"']+)[\"']", re.M)
+ROUTE = re.compile(r"<Route\s+path=\{?[\"']([^\"']+)[\"']\}?\s+component=\{(\w+)\}")
+ROUTE_TABLE = re.compile(r"^export const ROUTE_NAMESPACES\b[^=]*=\s*\{\n(.*?)^\};", re.M | re.S)
+ROUTE_ENTRY = re.compile(r"^([ \t]*)'([^']+)':\s*\[(.*?)\],[ \t]*\n", re.M | re.S)
+
+
+@dataclass
+class FileEdit:
+    path: str
+    source: str
+    rewritten: str
+    applied: list[Proposal] = field(default_factory=list)
+    # コンポーネントの外にあり t を使えないリテラル
+    skipped: list[Literal] = field(default_factory=list)
+
+
+def call(key: str, literal: Literal) -> str:
+    if not literal.values:
+        return f"t('{key}')"
+    values = ", ".join(
+        name if name == expression else f"{name}: {expression}" for name, expression in literal.values
+    )
+    return f"t('{key}', {{ {values} }})"
+
+
+def replacement(proposal: Proposal) -> str:
+    literal = proposal.literal
+    expression = call(proposal.key, literal)
+    if literal.kind == "text" or literal.bare_attribute:
+        return f"{{{expression}}}"
+    return expression
+
+
+def components(source: str) -> list[tuple[int, int, int]]:
+    """(定義の開始, 本体の開始位置, 終了) をコンポーネントごとに返す"""
+    found = []
+    for match in COMPONENT.finditer(source):
+        body = BODY.search(source, match.end() - 1)
+        end = COMPONENT_END.search(source, match.end())
+        if body and end and body.end() < end.start():
+            found.append((match.start(), body.end(), end.end()))
+    return found
+
+
+def hook_edit(source: str, component: tuple[int, int, int]) -> tuple[int, int, str] | None:
+    """コンポーネントで t を使えるようにする置き換え（既に t を取り出していれば None）"""
+    start, body, end = component
+    call = HOOK_CALL.search(source, start, end)
+    if call is None:
+        indent = re.match(r"[ \t]*", source[body:]).group()
+        return body, body, f"{indent or '  '}const {{ t }} = useTranslation();\n"
+    names = [name.strip() for name in call.group(1).split(",") if name.strip()]
+    if any(re.match(r"t\b", name) for name in names):
+        return None
+    return call.start(1), call.end(1), f" {', '.join(['t', *names])} "
+
+
+def import_edit(source: str) -> tuple[int, str] | None:
+    if re.search(r"\buseTranslation\b[^;]*from\s+['\"]react-i18next['\"]", source):
+        return None
+    imports = list(IMPORT.finditer(source))
+    quote = imports[0].group(1) if imports else '"'
+    position = imports[-1].end() if imports else 0
+    return position, f"import {{ useTranslation }} from {quote}react-i18next{quote};\n"
+
+
+def rewrite(path: str, source: str, index: KeyIndex) -> FileEdit:
+    edit = FileEdit(path, source, source)
+    ranges = components(source)
+    splices: list[tuple[int, int, str]] = []
+    hooks: set[tuple[int, int, int]] = set()
+    for literal in scan_source(path, source):
+        component = next((r for r in ranges if r[1] <= literal.start < r[2]), None)
+        if component is None:
+            edit.skipped.append(literal)
+            continue
+        proposal = Proposal(literal, *propose_key(literal, index))
+        splices.append((literal.start, literal.end, replacement(proposal)))
+        edit.applied.append(proposal)
+        hooks.add(component)
+
+    if not splices:
+        return edit
+    for component in hooks:
+        hook = hook_edit(source, component)
+        if hook:
+            splices.append(hook)
+    added_import = import_edit(source)
+    if added_import:
+        position, text = added_import
+        splices.append((position, position, text))
+
+    # 後ろから適用すれば前の位置はずれない
+    rewritten = source
+    for start, end, text in sorted(splices, key=lambda splice: (splice[0], splice[1]), reverse=True):
+        rewritten = rewritten[:start] + text + rewritten[end:]
+    edit.rewritten = rewritten
+    return edit
+
+
+def rewrite_files(root: Path, paths: list[str], index: KeyIndex) -> list[FileEdit]:
+    """同じ名前空間のファイルを順に書き換える（新しいキーの衝突を避けるため1つの index を共有する）"""
+    return [rewrite(path, (root / path).read_text(encoding="utf-8"), index) for path in paths]
+
+
+def render_script(ja: dict[str, str], en: dict[str, str]) -> str:
+    """translate_literals.py の内容（コードモッドが書き換えるため手で編集したコメントは残らない）"""
+    def literal(catalog: dict[str, str]) -> str:
+        return json.dumps(catalog, ensure_ascii=False, indent=4) if catalog else "{}"
+
+    return (
+        '#!/usr/bin/env python3\n'
+        '"""\n'
+        'ハードコードされていた文言の翻訳キー（build_catalogs.py codemod が追加する）\n'
+        '\n'
+        'en に無いキーはビルド時に ja の値で補われる（catalog_reports/fallback.json）。\n'
+        '"""\n'
+        '\n'
+        'from i18n_catalog.output import write_catalog\n'
+        '\n'
+        f'literals_ja = {literal(ja)}\n'
+        '\n'
+        f'literals_en = {literal(en)}\n'
+        '\n'
+        '# JSONファイルに保存\n'
+        'write_catalog("literals_ja.json", literals_ja)\n'
+        'write_catalog("literals_en.json", literals_en)\n'
+    )
+
+
+def stage(path: Path, text: str) -> str:
+    """path と同じディレクトリの一時ファイルに書き、そのパスを返す"""
+    fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    os.chmod(temp, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+    return temp
+
+
+def commit(root: Path, changes: dict[str, str]) -> None:
+    """全ファイルを一時ファイルに書き終えてから置き換える。途中で失敗したら何も変えない"""
+    staged: list[tuple[str, Path]] = []
+    try:
+        for path, text in changes.items():
+            staged.append((stage(root / path, text), root / path))
+    except BaseException:
+        for temp, _ in staged:
+            os.unlink(temp)
+        raise
+    for temp, path in staged:
+        os.replace(temp, path)
+
+
+def page_routes(app_source: str) -> dict[str, str]:
+    """App.tsx のルーティングから、ページのファイル（client/src/pages/Settings.tsx）→ ルート"""
+    modules = dict(DEFAULT_IMPORT.findall(app_source))
+    routes: dict[str, str] = {}
+    for route, component in ROUTE.findall(app_source):
+        module = modules.get(component, "")
+        for prefix in ("./", "@/"):
+            if module.startswith(prefix):
+                routes.setdefault(f"{(SOURCE_DIR / module[len(prefix):]).as_posix()}.tsx", route)
+    return routes
+
+
+def route_namespaces(i18n_source: str) -> dict[str, list[str]]:
+    table = ROUTE_TABLE.search(i18n_source)
+    if table is None:
+        raise ValueError(f"{I18N_FILE} に ROUTE_NAMESPACES が見つかりません")
+    return {route: re.findall(r"'([^']+)'", names) for _, route, names in ROUTE_ENTRY.findall(table.group(1))}
+
+
+def quoted(names: list[str]) -> list[str]:
+    return [f"'{name}'" for name in names]
+
+
+def register_namespaces(i18n_source: str, additions: dict[str, list[str]]) -> str:
+    """ROUTE_NAMESPACES のルートに名前空間を加えた i18n.ts（無いルートは末尾に足す）"""
+    table = ROUTE_TABLE.search(i18n_source)
+    remaining = dict(additions)
+
+    def extend(match: re.Match) -> str:
+        indent, route, names = match.groups()
+        added = remaining.pop(route, [])
+        if not added:
+            return match.group(0)
+        if "\n" in names:
+            # 1行に1つずつ並べた書き方（'/' など）はそのまま行を足す
+            item_indent = re.search(r"\n([ \t]*)'", names).group(1)
+            names = names.rstrip(" \t") + "".join(f"{item_indent}{name},\n" for name in quoted(added)) + indent
+        else:
+            names = ", ".join([names.strip(), *quoted(added)] if names.strip() else quoted(added))
+        return f"{indent}'{route}': [{names}],\n"
+
+    body = ROUTE_ENTRY.sub(extend, table.group(1))
+    first = ROUTE_ENTRY.search(table.group(1))
+    indent = first.group(1) if first else "  "
+    for route, added in remaining.items():
+        body += f"{indent}'{route}': [{', '.join(quoted(added))}],\n"
+    return i18n_source[:table.start(1)] + body + i18n_source[table.end(1):]
+
+
+def route_additions(root: Path, edits: list[FileEdit], registered: dict[str, list[str]]) -> dict[str, list[str]]:
+    """書き換えたページが使う名前空間のうち、そのルートに登録されていないもの
+
+    ルートの分からないファイル（複数のページで使うコンポーネントなど）が未登録の名前空間を
+    使うときは、どのページで読み込むべきか決められないので ValueError にする。
+    """
+    routes = page_routes((root / APP_FILE).read_text(encoding="utf-8"))
+    additions: dict[str, list[str]] = {}
+    for edit in edits:
+        used = sorted({proposal.key.split(".")[0] for proposal in edit.applied} - set(CORE_NAMESPACES))
+        route = routes.get(Path(edit.path).as_posix())
+        if route is None:
+            unrouted = [name for name in used if not any(name in names for names in registered.values())]
+            if unrouted:
+                raise ValueError(
+                    f"{edit.path} はルートが分からないため、名前空間 {', '.join(unrouted)} を"
+                    f" {I18N_FILE} の ROUTE_NAMESPACES に登録できません（先に登録してください）"
+                )
+            continue
+        for name in used:
+            if name not in registered.get(route, []) and name not in additions.get(route, []):
+                additions.setdefault(route, []).append(name)
+    return additions
+
+
+@dataclass
+class CodemodResult:
+    edits: list[FileEdit]
+    added: dict[str, str]
+    written: list[str]
+    # ルート → ROUTE_NAMESPACES に登録した名前空間
+    registered: dict[str, list[str]] = field(default_factory=dict)
+
+
+def run(root: Path, paths: list[str], ja: dict, jobs: int | None = None, dry_run: bool = False) -> CodemodResult:
+    index = KeyIndex(ja)
+    # 新しいキーはファイルの名前空間に作られるので、名前空間ごとに並列に処理できる
+    groups: dict[str, list[str]] = {}
+    for path in paths:
+        groups.setdefault(namespace_for(path), []).append(path)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(rewrite_files, [root] * len(groups), groups.values(), [index] * len(groups))
+        edits_by_path = {edit.path: edit for group in results for edit in group}
+    edits = [edits_by_path[path] for path in paths]
+
+    script = root / LITERALS_SCRIPT
+    dicts = load_dicts(script.read_text(encoding="utf-8"), LITERALS_SCRIPT)
+    literals_ja, literals_en = (dicts.get(name, {}) for name in LITERALS_VARIABLES)
+    added: dict[str, str] = {}
+    for edit in edits:
+        for proposal in edit.applied:
+            if not proposal.existing and proposal.key not in literals_ja:
+                literals_ja[proposal.key] = added[proposal.key] = proposal.literal.text
+
+    i18n_source = (root / I18N_FILE).read_text(encoding="utf-8")
+    additions = route_additions(root, edits, route_namespaces(i18n_source))
+
+    changes = {edit.path: edit.rewritten for edit in edits if edit.rewritten != edit.source}
+    if added:
+        changes[LITERALS_SCRIPT] = render_script(literals_ja, literals_en)
+    if additions:
+        changes[str(I18N_FILE)] = register_namespaces(i18n_source, additions)
+    if not dry_run:
+        commit(root, changes)
+    return CodemodResult(edits, added, list(changes), additions)
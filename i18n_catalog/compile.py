@@ -0,0 +1,66 @@
+"""
+補間テンプレートのビルド時コンパイル
+
+"{{count}}件選択中" のようなメッセージを [プレースホルダー名の配列, セグメント配列]
+（セグメントはリテラル文字列か名前のインデックス）に一度だけ変換する。
+実行時は client/src/lib/messageFormat.ts が正規表現なしで連結する。
+プレースホルダーを含まないメッセージは定数としてテンプレートを出力しない。
+"""
+
+import re
+
+# i18next の既定の補間記法（prefix "{{", suffix "}}"）
+PLACEHOLDER = re.compile(r"\{\{(.*?)\}\}")
+NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def compile_message(text: str) -> list | None:
+    """テンプレートを返す。プレースホルダーが無ければ None（定数）"""
+    names: list[str] = []
+    segments: list = []
+    position = 0
+    for match in PLACEHOLDER.finditer(text):
+        name = match.group(1).strip()
+        if not NAME.match(name):
+            raise ValueError(f"未対応のプレースホルダーです: {match.group(0)!r} in {text!r}")
+        if match.start() > position:
+            segments.append(text[position:match.start()])
+        if name not in names:
+            names.append(name)
+        segments.append(names.index(name))
+        position = match.end()
+    if not names:
+        return None
+    if position < len(text):
+        segments.append(text[position:])
+    return [names, segments]
+
+
+def template_source(template: list) -> str:
+    """テンプレートから元のメッセージを組み立てる（client/src/lib/messageFormat.ts の templateSource と同じ）"""
+    names, segments = template
+    return "".join(segment if isinstance(segment, str) else f"{{{{{names[segment]}}}}}" for segment in segments)
+
+
+def compile_templates(catalog, prefix: str = "") -> dict[str, list]:
+    """カタログ中のプレースホルダーを含むメッセージを {完全なキー: テンプレート} で返す
+
+    配列の要素は i18next と同じく "key.0" のようなキーで参照される。
+    """
+    if isinstance(catalog, dict):
+        items = catalog.items()
+    elif isinstance(catalog, list):
+        items = enumerate(catalog)
+    else:
+        template = compile_message(catalog) if isinstance(catalog, str) else None
+        return {prefix.rstrip("."): template} if template else {}
+
+    templates = {}
+    for key, value in items:
+        templates.update(compile_templates(value, f"{prefix}{key}."))
+    return templates
+
+
+def compile_chunk(catalog: dict, prefix: str = "") -> dict:
+    """名前空間ファイル・コアバンドルの出力形式（メッセージとテンプレートの組）"""
+    return {"messages": catalog, "templates": compile_templates(catalog, prefix)}
@@ -0,0 +1,61 @@
+"""
+ビルド定数の畳み込み
+
+APP_TITLE のようにビルド時に値が決まるプレースホルダーを、出力カタログ上で
+リテラルに置き換える。置き換えたメッセージは補間テンプレートを持たなくなる。
+値は client/src/const.ts と同じく Vite の環境変数から取る。
+畳み込むのは本番の成果物とバリアントの出力だけで、コミットする client/src/locales には
+畳み込まない（実行する人や CI の環境で内容が変わらないように）。
+"""
+
+import os
+import re
+from pathlib import Path
+
+# プレースホルダー名 → 値を取る環境変数（client/src/const.ts と揃えること）
+CONSTANT_ENV = {"APP_TITLE": "VITE_APP_TITLE"}
+
+# Vite と同じく後のファイルほど優先（プロセスの環境変数が最優先）
+ENV_FILES = (".env", ".env.local", ".env.production", ".env.production.local")
+
+
+def read_env_file(path: Path) -> dict[str, str]:
+    values = {}
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return values
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        values[key.strip()] = value.strip().strip("'\"")
+    return values
+
+
+def load_constants(root: Path, environ=os.environ) -> dict[str, str]:
+    """値が設定されている定数だけを返す（未設定なら実行時の補間に任せる）"""
+    env: dict[str, str] = {}
+    for name in ENV_FILES:
+        env.update(read_env_file(root / name))
+    env.update(environ)
+    return {name: env[var] for name, var in CONSTANT_ENV.items() if env.get(var)}
+
+
+def fold(tree, constants: dict[str, str]):
+    """{{NAME}} を定数の値で置き換えた新しいツリーを返す"""
+    if not constants:
+        return tree
+    pattern = re.compile(r"\{\{(%s)\}\}" % "|".join(map(re.escape, constants)))
+    return _fold(tree, pattern, constants)
+
+
+def _fold(tree, pattern: re.Pattern, constants: dict[str, str]):
+    if isinstance(tree, dict):
+        return {key: _fold(value, pattern, constants) for key, value in tree.items()}
+    if isinstance(tree, list):
+        return [_fold(value, pattern, constants) for value in tree]
+    if isinstance(tree, str) and "{{" in tree:
+        return pattern.sub(lambda m: constants[m.group(1)], tree)
+    return tree
@@ -0,0 +1,73 @@
+"""
+フォールバックのビルド時解決
+
+en に欠けているキーを ja の値で埋めた完全なカタログを出力する。実行時に
+i18next のフォールバックを辿る必要がなくなり、英語ユーザーに ja のカタログを
+配信しなくて済む。埋めたキーはレポートに記録する。
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .output import REPORTS_DIR, write_if_changed
+
+# 言語ごとのフォールバック先（client/src/i18n.ts の fallbackLng と揃えること）
+FALLBACKS = {"en": ("ja",)}
+
+
+@dataclass
+class FallbackResult:
+    trees: dict[str, dict] = field(default_factory=dict)
+    # 言語 → {キー: 埋めた値の取得元の言語}
+    filled: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
+def fill(target: dict, source: dict, source_lang: str, filled: dict[str, str], prefix: str = "") -> dict:
+    """target に無いキーを source から補った新しい辞書を返す（キー順は target 優先）"""
+    resolved = dict(target)
+    for key, value in source.items():
+        path = f"{prefix}{key}"
+        if key not in resolved:
+            resolved[key] = value
+            if isinstance(value, dict):
+                filled.update((f"{path}.{leaf}", source_lang) for leaf in leaves(value))
+            else:
+                filled[path] = source_lang
+        elif isinstance(value, dict) and isinstance(resolved[key], dict):
+            resolved[key] = fill(resolved[key], value, source_lang, filled, f"{path}.")
+    return resolved
+
+
+def leaves(tree: dict, prefix: str = ""):
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            yield from leaves(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}"
+
+
+def lookup(tree: dict, key: str):
+    """ドット区切りのキーの値（無ければ None）"""
+    node = tree
+    for part in key.split("."):
+        if not isinstance(node, dict) or part not in node:
+            return None
+        node = node[part]
+    return node
+
+
+def resolve_fallbacks(trees: dict[str, dict]) -> FallbackResult:
+    result = FallbackResult()
+    for lang, tree in trees.items():
+        filled: dict[str, str] = {}
+        for fallback in FALLBACKS.get(lang, ()):
+            tree = fill(tree, trees[fallback], fallback, filled)
+        result.trees[lang] = tree
+        result.filled[lang] = filled
+    return result
+
+
+def write_report(root: Path, result: FallbackResult) -> list[str]:
+    (root / REPORTS_DIR).mkdir(exist_ok=True)
+    report = {lang: dict(sorted(filled.items())) for lang, filled in result.filled.items()}
+    return write_if_changed(root, root / REPORTS_DIR / "fallback.json", report)
@@ -0,0 +1,105 @@
+"""
+翻訳メモリのあいまい検索（文字 n-gram の転置インデックス）
+
+「ログインが必要です」や「〜に失敗しました」のようなほぼ同じ文字列の既訳を、
+文字 bigram の Jaccard 係数で上位 k 件返す。しきい値 t を満たす候補は、クエリの
+n-gram のうち出現頻度の低いものから |Q| - ceil(t|Q|) + 1 個のどれかを必ず共有する
+（prefix filter）ので、ポスティングリストの長い n-gram を辿らずに済み、全件走査もしない。
+"""
+
+import heapq
+import math
+import re
+from dataclasses import dataclass
+
+from .fallback import leaves, lookup
+from .memory import TranslationMemory
+
+N = 2
+
+
+def grams(text: str, n: int = N) -> frozenset[str]:
+    text = re.sub(r"\s+", " ", text.strip().lower())
+    if len(text) <= n:
+        return frozenset((text,)) if text else frozenset()
+    return frozenset(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+@dataclass(frozen=True)
+class Match:
+    score: float
+    source: str
+    target: str
+
+
+class FuzzyIndex:
+    def __init__(self, n: int = N):
+        self.n = n
+        self.sources: list[str] = []
+        self.targets: list[str] = []
+        self.grams: list[frozenset[str]] = []
+        self.postings: dict[str, list[int]] = {}
+        self.ids: dict[str, int] = {}
+
+    def add(self, source: str, target: str) -> None:
+        """原文ごとに1件（同じ原文は後から追加した訳で上書き）"""
+        if source in self.ids:
+            self.targets[self.ids[source]] = target
+            return
+        found = grams(source, self.n)
+        if not found:
+            return
+        id = self.ids[source] = len(self.sources)
+        self.sources.append(source)
+        self.targets.append(target)
+        self.grams.append(found)
+        for gram in found:
+            self.postings.setdefault(gram, []).append(id)
+
+    def search(self, query: str, k: int = 5, threshold: float = 0.5) -> list[Match]:
+        """Jaccard 係数が threshold 以上の既訳を類似度の高い順に最大 k 件"""
+        wanted = grams(query, self.n)
+        if not wanted:
+            return []
+        overlap = max(1, math.ceil(threshold * len(wanted)))
+        rare = sorted(wanted, key=lambda gram: len(self.postings.get(gram, ())))
+        candidates: set[int] = set()
+        for gram in rare[:len(wanted) - overlap + 1]:
+            candidates.update(self.postings.get(gram, ()))
+
+        # |X| が threshold|Q| 〜 |Q|/threshold の外なら係数は threshold に届かない
+        shortest, longest = threshold * len(wanted), len(wanted) / threshold if threshold else math.inf
+        scored = []
+        for id in candidates:
+            found = self.grams[id]
+            if not shortest <= len(found) <= longest:
+                continue
+            common = len(wanted & found)
+            score = common / (len(wanted) + len(found) - common)
+            if score >= threshold:
+                scored.append((score, id))
+        return [Match(score, self.sources[id], self.targets[id]) for score, id in heapq.nlargest(k, scored)]
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+
+def human_translations(source: dict, target: dict) -> dict[str, str]:
+    """カタログの人手の訳（原文 → 訳文）"""
+    found = {}
+    for key in leaves(source):
+        text, translated = lookup(source, key), lookup(target, key)
+        if isinstance(text, str) and isinstance(translated, str):
+            found.setdefault(text, translated)
+    return found
+
+
+def build_index(memory: TranslationMemory, human: dict[str, str], lang: str) -> FuzzyIndex:
+    """翻訳メモリの lang 向けの訳と人手の訳から索引を作る（人手の訳を優先）"""
+    index = FuzzyIndex()
+    for entry in memory.entries.values():
+        if entry.glossary.startswith(f"{lang}:"):
+            index.add(entry.source, entry.target)
+    for source, target in human.items():
+        index.add(source, target)
+    return index
@@ -0,0 +1,170 @@
+"""
+用語集と、用語の訳の一貫性チェック
+
+用語集（catalog_glossary.json）の原語を Aho-Corasick オートマトンにまとめ、ja の全メッセージを
+1回ずつ走査する。用語が見つかったメッセージについて、各言語の対応するメッセージに
+承認済みの訳語（大文字小文字は区別しない）のどれかが含まれているかを確かめる。
+走査の手間はメッセージの長さの合計に比例し、用語数が増えても変わらない。
+
+用語集の値は訳語の文字列、訳語の候補のリスト、または言語ごとの辞書
+（{"en": ["Resume"], "zh": "简历"}）で書ける。文字列とリストは en の訳語として扱う。
+"""
+
+import hashlib
+import json
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+GLOSSARY_FILE = "catalog_glossary.json"
+DEFAULT_LANG = "en"
+
+
+def parse_renderings(value) -> dict[str, tuple[str, ...]]:
+    if isinstance(value, str):
+        value = {DEFAULT_LANG: value}
+    elif isinstance(value, list):
+        value = {DEFAULT_LANG: value}
+    return {lang: (v,) if isinstance(v, str) else tuple(v) for lang, v in value.items()}
+
+
+@dataclass(frozen=True)
+class Glossary:
+    # 原語 → 言語 → 承認済みの訳語
+    terms: dict[str, dict[str, tuple[str, ...]]]
+    version: str
+
+    @classmethod
+    def load(cls, root: Path) -> "Glossary":
+        path = root / GLOSSARY_FILE
+        if not path.exists():
+            return cls({}, "none")
+        data = path.read_bytes()
+        terms = {term: parse_renderings(value) for term, value in json.loads(data)["terms"].items()}
+        return cls(terms, hashlib.sha256(data).hexdigest()[:12])
+
+    def renderings(self, lang: str) -> dict[str, tuple[str, ...]]:
+        return {term: by_lang[lang] for term, by_lang in self.terms.items() if lang in by_lang}
+
+
+class Automaton:
+    """複数の語を1回の走査で探す Aho-Corasick オートマトン"""
+
+    def __init__(self, words: list[str]):
+        self.words = words
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        # 状態で終わる語（自身で終わる語がなければ -1）と、fail を辿った先で語が終わる状態
+        self.output: list[int] = [-1]
+        self.next_output: list[int] = [-1]
+        for id, word in enumerate(words):
+            state = 0
+            for char in word:
+                if char not in self.goto[state]:
+                    self.goto[state][char] = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(-1)
+                    self.next_output.append(-1)
+                state = self.goto[state][char]
+            self.output[state] = id
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                suffix = self.fail[child]
+                self.next_output[child] = suffix if self.output[suffix] >= 0 else self.next_output[suffix]
+
+    def find(self, text: str) -> list[tuple[int, int, int]]:
+        """(開始, 終了, 語の番号) を全て返す（重なりも含む）"""
+        found = []
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            match = state if self.output[state] >= 0 else self.next_output[state]
+            while match > 0:
+                id = self.output[match]
+                found.append((end - len(self.words[id]), end, id))
+                match = self.next_output[match]
+        return found
+
+
+def outermost(hits: list[tuple[int, int, int]]) -> list[tuple[int, int, int]]:
+    """長い用語に含まれる短い用語の一致を除く（マイテンプレート 中の テンプレート など）"""
+    hits = sorted(hits, key=lambda hit: (hit[0], -hit[1]))
+    kept = []
+    end = -1
+    for hit in hits:
+        if hit[1] > end:
+            kept.append(hit)
+            end = hit[1]
+    return kept
+
+
+def messages(tree, prefix: str = ""):
+    """(キー, 文言)。配列の要素（terms.article2.features など）は添字をキーに含める"""
+    if isinstance(tree, dict):
+        for key, value in tree.items():
+            yield from messages(value, f"{prefix}{key}.")
+    elif isinstance(tree, list):
+        for i, value in enumerate(tree):
+            yield from messages(value, f"{prefix}{i}.")
+    elif isinstance(tree, str):
+        yield prefix.rstrip("."), tree
+
+
+def element(tree, key: str):
+    """messages() のキーの値（無ければ None）"""
+    node = tree
+    for part in key.split("."):
+        if isinstance(node, dict) and part in node:
+            node = node[part]
+        elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+            node = node[int(part)]
+        else:
+            return None
+    return node
+
+
+@dataclass(frozen=True)
+class Violation:
+    key: str
+    lang: str
+    term: str
+    expected: tuple[str, ...]
+    text: str
+
+    def describe(self) -> str:
+        expected = " / ".join(self.expected)
+        return f"[{self.lang}] {self.key}: 「{self.term}」の訳語 {expected} がありません: {self.text}"
+
+
+def check(trees: dict[str, dict], glossary: Glossary, source_lang: str = "ja") -> list[Violation]:
+    terms = list(glossary.terms)
+    automaton = Automaton(terms)
+    source = trees[source_lang]
+    langs = [lang for lang in trees if lang != source_lang]
+    violations = []
+    for key, text in messages(source):
+        hits = outermost(automaton.find(text))
+        if not hits:
+            continue
+        for lang in langs:
+            translated = element(trees[lang], key)
+            if not isinstance(translated, str):
+                continue
+            folded = translated.casefold()
+            for term in dict.fromkeys(terms[id] for _, _, id in hits):
+                expected = glossary.terms[term].get(lang)
+                if expected and not any(rendering.casefold() in folded for rendering in expected):
+                    violations.append(Violation(key, lang, term, expected, translated))
+    return violations
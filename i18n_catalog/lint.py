@@ -0,0 +1,199 @@
+"""
+カタログの lint
+
+マージ済みの ja / en のツリーを1回だけ同時に走査し、各メッセージ（Leaf）を登録された
+全ルールの visit に渡す。キーをまたぐ検査（重複など）はルール側で集計して finish で報告する。
+ルールを追加するには Rule を継承したクラスに @register を付ける。
+"""
+
+from dataclasses import asdict, dataclass, field
+
+from .literals import CJK
+from .placeholders import placeholders
+from .sources import LANGS
+
+SEVERITIES = ("error", "warning", "info")
+
+
+class Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = Missing()
+
+
+@dataclass(frozen=True)
+class Leaf:
+    key: str
+    # 言語 → 値（無ければ MISSING、文字列以外ならその値）
+    values: dict[str, object]
+
+
+@dataclass(frozen=True)
+class Finding:
+    rule: str
+    severity: str
+    key: str
+    message: str
+    lang: str = ""
+
+    def describe(self) -> str:
+        lang = f"[{self.lang}] " if self.lang else ""
+        return f"{self.severity}: {lang}{self.key}: {self.message} ({self.rule})"
+
+
+@dataclass
+class Report:
+    findings: list[Finding] = field(default_factory=list)
+
+    def add(self, rule: "Rule", key: str, message: str, lang: str = "", severity: str | None = None) -> None:
+        self.findings.append(Finding(rule.name, severity or rule.severity, key, message, lang))
+
+    def to_json(self) -> list[dict]:
+        return [asdict(finding) for finding in self.findings]
+
+
+class Rule:
+    name = ""
+    severity = "warning"
+    description = ""
+
+    def visit(self, leaf: Leaf, report: Report) -> None:
+        pass
+
+    def finish(self, report: Report) -> None:
+        pass
+
+
+RULES: dict[str, type[Rule]] = {}
+
+
+def register(rule: type[Rule]) -> type[Rule]:
+    RULES[rule.name] = rule
+    return rule
+
+
+@register
+class Parity(Rule):
+    name = "parity"
+    description = "片方の言語にしか無いキー"
+
+    def visit(self, leaf, report):
+        for lang, value in leaf.values.items():
+            if value is MISSING:
+                report.add(self, leaf.key, "キーがありません", lang)
+
+
+@register
+class Shape(Rule):
+    name = "shape"
+    severity = "error"
+    description = "言語によって値の型（文字列 / 配列 / オブジェクト）が違うキー"
+
+    def visit(self, leaf, report):
+        kinds = {type(value).__name__ for value in leaf.values.values() if value is not MISSING}
+        if len(kinds) > 1:
+            report.add(self, leaf.key, f"値の型が一致しません: {', '.join(sorted(kinds))}")
+
+
+@register
+class Empty(Rule):
+    name = "empty"
+    severity = "error"
+    description = "空文字列のメッセージ"
+
+    def visit(self, leaf, report):
+        for lang, value in leaf.values.items():
+            if isinstance(value, str) and not value.strip():
+                report.add(self, leaf.key, "メッセージが空です", lang)
+
+
+@register
+class Whitespace(Rule):
+    name = "whitespace"
+    description = "前後に空白のあるメッセージ"
+
+    def visit(self, leaf, report):
+        for lang, value in leaf.values.items():
+            if isinstance(value, str) and value.strip() and value != value.strip():
+                report.add(self, leaf.key, "前後に空白があります", lang)
+
+
+@register
+class Placeholders(Rule):
+    name = "placeholders"
+    severity = "error"
+    description = "ja と en でプレースホルダーが一致しないメッセージ"
+
+    def visit(self, leaf, report):
+        ja, en = leaf.values["ja"], leaf.values["en"]
+        if isinstance(ja, str) and isinstance(en, str) and placeholders(ja) != placeholders(en):
+            ja_names = ", ".join(sorted(placeholders(ja))) or "なし"
+            en_names = ", ".join(sorted(placeholders(en))) or "なし"
+            report.add(self, leaf.key, f"プレースホルダーが一致しません: ja={ja_names} en={en_names}")
+
+
+@register
+class Untranslated(Rule):
+    name = "untranslated"
+    description = "en が ja と同じ（日本語のまま）のメッセージ"
+
+    def visit(self, leaf, report):
+        ja, en = leaf.values["ja"], leaf.values["en"]
+        if isinstance(en, str) and en == ja and CJK.search(en):
+            report.add(self, leaf.key, "翻訳されていません", "en")
+
+
+@register
+class Duplicates(Rule):
+    name = "duplicates"
+    severity = "info"
+    description = "同じ ja の文言を持つキー（en の訳が食い違う場合は warning）"
+
+    def __init__(self):
+        self.keys: dict[str, list[tuple[str, object]]] = {}
+
+    def visit(self, leaf, report):
+        ja = leaf.values["ja"]
+        if isinstance(ja, str) and ja.strip():
+            self.keys.setdefault(ja, []).append((leaf.key, leaf.values["en"]))
+
+    def finish(self, report):
+        for text, keys in self.keys.items():
+            if len(keys) < 2:
+                continue
+            translations = {en for _, en in keys if isinstance(en, str)}
+            names = ", ".join(key for key, _ in keys[1:])
+            if len(translations) > 1:
+                report.add(self, keys[0][0], f"「{text}」の訳が {names} と食い違っています", severity="warning")
+            else:
+                report.add(self, keys[0][0], f"「{text}」が {names} と重複しています")
+
+
+def walk(trees: dict[str, object], prefix: str = ""):
+    """全言語のツリーを同時に1回走査して Leaf を返す（キー順は ja 優先）"""
+    present = {lang: tree for lang, tree in trees.items() if tree is not MISSING}
+    if present and all(isinstance(tree, dict) for tree in present.values()):
+        keys = dict.fromkeys(key for tree in present.values() for key in tree)
+        for key in keys:
+            yield from walk({lang: tree.get(key, MISSING) if tree is not MISSING else MISSING
+                             for lang, tree in trees.items()}, f"{prefix}{key}.")
+    elif present and all(isinstance(tree, list) for tree in present.values()):
+        for i in range(max(len(tree) for tree in present.values())):
+            yield from walk({lang: tree[i] if tree is not MISSING and i < len(tree) else MISSING
+                             for lang, tree in trees.items()}, f"{prefix}{i}.")
+    else:
+        yield Leaf(prefix.rstrip("."), dict(trees))
+
+
+def lint(trees: dict[str, dict], rules: list[str] | None = None) -> Report:
+    active = [RULES[name]() for name in (rules or RULES)]
+    report = Report()
+    for leaf in walk({lang: trees[lang] for lang in LANGS}):
+        for rule in active:
+            rule.visit(leaf, report)
+    for rule in active:
+        rule.finish(report)
+    report.findings.sort(key=lambda finding: SEVERITIES.index(finding.severity))
+    return report
@@ -0,0 +1,649 @@
+"""
+client/src にハードコードされた日本語文字列の検出
+
+TSX を左から順にトークン化し（コメント・文字列・テンプレートリテラル・JSX テキスト）、
+CJK 文字を含む JSX テキスト、文字列 props、toast / confirm などの呼び出し引数を拾う。
+各リテラルには既存の命名規則（home.toast.saved、favorites.confirm.delete）に沿って、
+周りのコード（コンポーネント、要素のハンドラーや id、囲んでいる関数）から名前を付けた
+キーを提案する。既存カタログに同じ文言があればそのキーを再利用するが、対象はファイル
+自身の名前空間とコアの名前空間に限る（他の名前空間はそのページで読み込まれていない）。
+"""
+
+import bisect
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from .fallback import leaves, lookup
+from .output import write_if_changed
+from .split import CORE_NAMESPACES
+from .usage import SOURCE_DIR
+
+DRAFTS_DIR = Path("catalog_drafts")
+
+CJK = re.compile("[぀-ヿ㐀-䶿一-鿿！-｠]")
+
+# JSX テキスト中の {式}（ネストした波括弧・JSX を含まない単純な式だけ）
+EXPRESSION = r"\{[^{}<>'\"`]*\}"
+# JSX テキストはアポストロフィやセミコロンも含み得る（Don't など）。> が JSX のタグを
+# 閉じているときだけテキストとみなす（tokens）ので、比較演算子や型引数の > の後の
+# コードがテキストとして読まれることはない
+TOKEN = re.compile(
+    r"(?P<comment>//[^\n]*|/\*.*?\*/)"
+    r"|(?P<string>'(?:\\.|[^'\\\n])*'|\"(?:\\.|[^\"\\\n])*\")"
+    r"|(?P<template>`(?:\\.|[^`\\])*`)"
+    r"|(?<![=\-])>(?P<text>(?:(?!//|/\*)[^<>{}`]|" + EXPRESSION + r")*)(?=[<{])",
+    re.S,
+)
+INTERPOLATION = re.compile(r"\$\{([^}]*)\}|" + EXPRESSION)
+ATTRIBUTE = re.compile(r"([A-Za-z][\w-]*)=\s*\{?\s*$")
+CALLEE = re.compile(r"([A-Za-z_$][\w$.]*)\(\s*$")
+IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+# オブジェクトリテラルのプロパティの値（{ finance: "金融業界", … }）
+PROPERTY = re.compile(r"[{,]\s*([A-Za-z_$][\w$]*)\s*:\s*$")
+OBJECT_BINDING = re.compile(r"\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)(?:\s*:[^=;]+)?\s*=\s*$")
+
+# キーの名前を決める手がかり
+# 大文字だけの定数（CATEGORY_LABELS）はコンポーネントではない
+COMPONENT_NAME = re.compile(r"^(?:export\s+(?:default\s+)?)?(?:function|const)\s+([A-Z]\w*[a-z]\w*)", re.M)
+# 開始タグ・終了タグ（useState<string>( のような型引数は除く）
+TAG = re.compile(r"(?<![A-Za-z0-9_$.])<(/?)([A-Za-z][\w.]*)((?:=>|[^<>])*?)(/?)>", re.S)
+# 終了タグとフラグメント（テキストの直後の </span> は TAG の後読みに掛かるので別に探す）
+CLOSING = re.compile(r"</[A-Za-z][\w.]*\s*>|<\/?>")
+# 要素が式の先頭にあることを示す直前のコード（( && = , [ { => return）
+EXPRESSION_START = re.compile(r"(?:[(&|=,\[{]|=>|\breturn)$")
+TAG_START = re.compile(r"(?<![A-Za-z0-9_$.])<([A-Za-z][\w.]*)")
+HANDLER = re.compile(r"\bon[A-Z]\w*=\{\s*(?:\([^)]*\)\s*=>\s*)?([A-Za-z_$][\w$.]*)")
+IDENTITY = re.compile(r"\b(?:id|htmlFor|name)=[\"']([^\"']+)[\"']")
+# 関数・変数の定義と、onSuccess: () => のようなコールバックのプロパティ
+BINDING = re.compile(
+    r"\b(?:const|let|var|function)\s+([A-Za-z_$][\w$]*)"
+    r"|\b([a-z]\w*)\s*:\s*(?:async\s*)?(?:\([^()]*\)|[A-Za-z_$][\w$]*)\s*=>"
+)
+NAME_AFFIXES = re.compile(r"^(?:handle|on|set)(?=[A-Z])|Mutation$")
+# 囲んでいる条件（{compareMode && (…)}、{x ? (…)}）やダイアログ（<Dialog open={showEditDialog}>）の
+# 式から付けるセクション名（compareMode → compare、evaluationDetails → evaluation）
+CONTEXT_AFFIXES = re.compile(r"^(?:is|has|show|selected|current)(?:For)?(?=[A-Z])|(?:Mode|Details|Query|Data|Open|Visible)$")
+# 名前にならない汎用的なメンバー・プレースホルダー（favoritesQuery.data.length、{{count}}件）
+GENERIC_NAMES = {"data", "current", "value", "length", "count", "props", "state"}
+MEMBER_CHAIN = re.compile(r"!*\s*([A-Za-z_$][\w$]*(?:\??\.[A-Za-z_$][\w$]*)*)")
+# { の直後の条件（{user && <p>…</p>}）
+CONDITION_AFTER = re.compile(r"\{((?:[^{}();:,?<>]|\?\.)*?)(?:&&|\?(?!\.))\s*<")
+OPEN_PROP = re.compile(r"\bopen=\{\s*([A-Za-z_$][\w$.]*)\s*\}")
+# JSX テキストの要素 → 名前（ハンドラーや id が無いとき）
+TAG_NAMES = {
+    "h1": "title", "h2": "title", "CardTitle": "title", "DialogTitle": "title",
+    "h3": "heading", "h4": "heading", "th": "heading",
+    "p": "description", "CardDescription": "description", "DialogDescription": "description",
+    "label": "label", "Label": "label",
+    "button": "button", "Button": "button",
+    "a": "link", "Link": "link",
+    "li": "item", "option": "option", "SelectItem": "option", "td": "cell",
+}
+
+# 呼び出し先 → キーのセクション
+CALL_SECTIONS = {
+    "toast": "toast",
+    "toast.success": "toast",
+    "toast.error": "toast",
+    "toast.info": "toast",
+    "toast.warning": "toast",
+    "confirm": "confirm",
+    "window.confirm": "confirm",
+    "prompt": "prompt",
+    "window.prompt": "prompt",
+    "alert": "alert",
+    "window.alert": "alert",
+}
+# 翻訳対象外の呼び出し（開発者向けのログや翻訳済みの呼び出し）
+IGNORED_CALLEES = re.compile(r"^(?:console\.\w+|t|i18n\.t)$")
+
+
+@dataclass(frozen=True)
+class Literal:
+    path: str
+    # ファイル内の文字オフセット（置き換える範囲。文字列ならクォートを含む）
+    start: int
+    end: int
+    line: int
+    # text（JSX テキスト）/ prop / call / message
+    kind: str
+    section: str
+    # {{name}} 形式に正規化した文言
+    text: str
+    # プレースホルダー名 → 元の式
+    values: tuple[tuple[str, str], ...] = ()
+    # 文字列 prop が {"…"} ではなく ="…" で書かれているか
+    bare_attribute: bool = False
+    # 囲んでいるコンポーネントと、周りのコードから付けた名前（キーの末尾）
+    component: str = ""
+    name: str = ""
+    # 囲んでいる条件やダイアログから付けたセクション（内側から。favorites.compare.title の compare）
+    contexts: tuple[str, ...] = ()
+
+
+def camel(name: str) -> str:
+    """openai-key → openaiKey、CATEGORY_LABELS → categoryLabels"""
+    parts = [part.lower() if part.isupper() else part for part in re.split(r"[-_]", name)]
+    head = parts[0][:1].lower() + parts[0][1:]
+    return head + "".join(part[:1].upper() + part[1:] for part in parts[1:])
+
+
+def namespace_for(path: str) -> str:
+    """ファイル名から名前空間（Home.tsx → home、ApiSettings.tsx → apiSettings）"""
+    return camel(Path(path).stem)
+
+
+def placeholder_name(expression: str, used: dict[str, str]) -> str:
+    identifiers = IDENTIFIER.findall(expression)
+    base = identifiers[-1] if identifiers else "value"
+    name, suffix = base, 2
+    while name in used and used[name] != expression:
+        name, suffix = f"{base}{suffix}", suffix + 1
+    return name
+
+
+def interpolate(raw: str) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """${式} と {式} を {{name}} に置き換える"""
+    values: dict[str, str] = {}
+
+    def replace(match: re.Match) -> str:
+        expression = (match.group(1) if match.group(1) is not None else match.group(0)[1:-1]).strip()
+        name = placeholder_name(expression, values)
+        values[name] = expression
+        return f"{{{{{name}}}}}"
+
+    return INTERPOLATION.sub(replace, raw), tuple(values.items())
+
+
+def unquote(literal: str) -> str:
+    body = literal[1:-1]
+    return re.sub(r"\\(.)", lambda match: {"n": "\n", "t": "\t"}.get(match.group(1), match.group(1)), body)
+
+
+def text_starts(source: str) -> set[int]:
+    """JSX テキストが続き得る > の位置
+
+    開始タグとフラグメントの > の後は子要素。終了タグ・自己終了タグの > の後は、その要素が
+    式の先頭（cond ? (<div />) : (…) の <div />）でなく他の要素の子であるときだけ。
+    """
+    # > の位置 → (タグ名, 開始位置, 開く / 閉じる / 自己終了)
+    events: dict[int, tuple[str, int, str]] = {}
+    for match in TAG.finditer(source):
+        closing, tag, _, self_closing = match.groups()
+        events[match.end() - 1] = (tag, match.start(), "close" if closing else "self" if self_closing else "open")
+    for match in CLOSING.finditer(source):
+        closing = match.group().startswith("</")
+        tag = match.group().strip("</> \t\n")
+        events.setdefault(match.end() - 1, (tag, match.start(), "close" if closing else "open"))
+
+    starts: set[int] = set()
+    opened: list[tuple[str, int]] = []
+    for end, (tag, start, kind) in sorted(events.items()):
+        if kind == "open":
+            opened.append((tag, start))
+            starts.add(end)
+            continue
+        if kind == "close":
+            while opened:
+                name, start = opened.pop()
+                if name == tag:
+                    break
+        if not EXPRESSION_START.search(source[max(0, start - 80):start].rstrip()):
+            starts.add(end)
+    return starts
+
+
+def tokens(source: str):
+    """コメント・文字列・テンプレートリテラル・JSX テキストのトークンを順に返す
+
+    JSX テキストは、直前の > が要素の中にあるタグを閉じているものだけ（text_starts）。
+    それ以外の > （a > b、useState<string>()）からはトークン化をやり直す。
+    """
+    tag_ends = text_starts(source)
+    position = 0
+    while match := TOKEN.search(source, position):
+        if match.lastgroup == "text" and match.start() not in tag_ends:
+            position = match.start() + 1
+            continue
+        yield match
+        position = match.end()
+
+
+def mask(source: str) -> str:
+    """コメント・文字列・JSX テキストを空白にしたソース（括弧の対応を数えるため）"""
+    masked = list(source)
+    for match in tokens(source):
+        kind = match.lastgroup
+        start, end = match.span(kind)
+        masked[start:end] = " " * (end - start)
+    return "".join(masked)
+
+
+def clean_name(name: str) -> str:
+    """handleSaveApiKey → saveApiKey、saveMutation → save、openai-key → openaiKey"""
+    name = NAME_AFFIXES.sub("", camel(name.rsplit(".", 1)[-1]))
+    return name[:1].lower() + name[1:]
+
+
+def enclosing_names(masked: str, start: int, bound: int) -> list[str]:
+    """リテラルを囲んでいる関数・変数の名前（内側から）
+
+    定義の後で開いた括弧の中にいる間、またはまだ終わっていない初期化式
+    （const label = "…"）の中にいる間を囲んでいるとみなす。同じ深さの , や ; と、
+    定義と同じ深さに戻る } で範囲が終わる。
+    """
+    bindings = list(BINDING.finditer(masked, bound, start))
+    # [名前, 定義の深さ]
+    active: list[list] = []
+    level = 0
+    for position in range(bound, start):
+        while bindings and bindings[0].end() <= position:
+            match = bindings.pop(0)
+            active.append([match.group(1) or match.group(2), level])
+        char = masked[position]
+        if char in "([{":
+            level += 1
+        elif char in ")]}":
+            level -= 1
+            active = [a for a in active if a[1] < level or (a[1] == level and char != "}")]
+        elif char in ",;":
+            active = [a for a in active if a[1] != level]
+    return [name for name, _ in reversed(active)]
+
+
+def object_name(masked: str, start: int, bound: int) -> str:
+    """リテラルを直接囲んでいるオブジェクトリテラルを代入している変数の名前"""
+    level = 0
+    for position in range(start - 1, bound - 1, -1):
+        char = masked[position]
+        if char in ")]}":
+            level += 1
+        elif char in "([{":
+            if level == 0:
+                binding = OBJECT_BINDING.search(masked, bound, position) if char == "{" else None
+                return clean_name(binding.group(1)) if binding else ""
+            level -= 1
+    return ""
+
+
+def enclosing_name(masked: str, start: int, bound: int) -> str:
+    """囲んでいる関数・変数の名前。onSuccess などのコールバックは外側の名前と合わせる
+    （saveMutation の onSuccess → saveSuccess）"""
+    names = enclosing_names(masked, start, bound)
+    if not names:
+        return ""
+    if len(names) > 1 and re.match(r"on[A-Z]", names[0]):
+        return clean_name(names[1]) + names[0][2:]
+    return clean_name(names[0])
+
+
+def element_name(tag: str, attributes: str) -> str:
+    """要素の id / htmlFor / name、なければ onClick などのハンドラーから付けた名前"""
+    identity = IDENTITY.search(attributes)
+    if identity:
+        return clean_name(identity.group(1))
+    handler = HANDLER.search(attributes)
+    return clean_name(handler.group(1)) if handler else ""
+
+
+def open_elements(source: str, start: int, bound: int) -> list[tuple[int, str, str]]:
+    """start の位置で開いている要素の (開始タグの位置, タグ名, 属性)（外側から）"""
+    stack: list[tuple[int, str, str]] = []
+    for match in TAG.finditer(source, bound, start):
+        closing, tag, attributes, self_closing = match.groups()
+        if closing:
+            while stack and stack.pop()[1] != tag:
+                pass
+        elif not self_closing:
+            stack.append((match.start(), tag, attributes))
+    return stack
+
+
+def enclosing_element(source: str, start: int, bound: int) -> tuple[str, str]:
+    """JSX テキストを直接囲んでいる要素の (タグ名, 属性)"""
+    stack = open_elements(source, start, bound)
+    return stack[-1][1:] if stack else ("", "")
+
+
+def opening_tag(source: str, start: int, bound: int) -> tuple[str, str]:
+    """文字列 prop が書かれている開始タグの (タグ名, 属性)"""
+    starts = list(TAG_START.finditer(source, bound, start))
+    if not starts:
+        return "", ""
+    match = TAG.match(source, starts[-1].start())
+    return starts[-1].group(1), match.group(3) if match else source[starts[-1].end():start]
+
+
+def component_at(source: str, start: int) -> tuple[str, int]:
+    """start より前で最後に定義されたコンポーネントの (名前, 定義の位置)"""
+    found = ("", 0)
+    for match in COMPONENT_NAME.finditer(source, 0, start):
+        found = (match.group(1), match.end())
+    return found
+
+
+def placeholder_key(values: tuple[tuple[str, str], ...]) -> str:
+    """プレースホルダーが1つだけならその名前（関連性: {{relevance}}点 → relevance）"""
+    names = [name for name, _ in values if name not in GENERIC_NAMES]
+    return names[0] if len(values) == 1 and names else ""
+
+
+def context_name(condition: str) -> str:
+    """条件の最初の項のメンバーから汎用的なものを除いた最後の名前（否定の条件は使わない）"""
+    match = MEMBER_CHAIN.match(condition.strip())
+    if match is None or match.group().startswith("!"):
+        return ""
+    members = [member for member in re.split(r"\??\.", match.group(1)) if member not in GENERIC_NAMES]
+    if not members:
+        return ""
+    name = CONTEXT_AFFIXES.sub("", members[-1])
+    return name[:1].lower() + name[1:]
+
+
+def condition_before(masked: str, position: int, bound: int) -> str:
+    """( の直前が cond && か cond ? なら cond（直前の { ( ) ; : , ? の後から。?. は除く）"""
+    end = position
+    while end > bound and masked[end - 1].isspace():
+        end -= 1
+    if masked[end - 1:end] == "?":
+        end -= 1
+    elif masked[end - 2:end] == "&&":
+        end -= 2
+    else:
+        return ""
+    while end > bound and masked[end - 1].isspace():
+        end -= 1
+    if masked[end - 1:end] == ")":
+        # 括弧で囲んだ条件（(a || b) && (）は括弧の中
+        close, level = end - 1, 0
+        for begin in range(close, bound - 1, -1):
+            level += {")": 1, "(": -1}.get(masked[begin], 0)
+            if level == 0:
+                return masked[begin + 1:close]
+        return ""
+    begin = end
+    while begin > bound and (masked[begin - 1] not in "{}();:,?" or masked[begin:begin + 1] == "."):
+        begin -= 1
+    return masked[begin:end]
+
+
+def contexts(source: str, masked: str, start: int, bound: int, child: bool) -> list[str]:
+    """リテラルを囲んでいる条件・ダイアログ・ラベルのグループから付けたセクション名（内側から）"""
+    found: list[tuple[int, str]] = []
+    opened: list[int] = []
+    for position in range(bound, start):
+        char = masked[position]
+        if char in "({":
+            opened.append(position)
+        elif char in ")}" and opened:
+            opened.pop()
+    for position in opened:
+        if masked[position] == "(":
+            text = condition_before(masked, position, bound)
+        else:
+            condition = CONDITION_AFTER.match(masked, position)
+            text = condition.group(1) if condition else ""
+        if text and (name := context_name(re.split(r"&&|\|\|", text)[0])):
+            found.append((position, name))
+    elements = open_elements(source, start, bound)
+    for position, _, attributes in elements:
+        dialog = OPEN_PROP.search(attributes)
+        if dialog and (name := context_name(dialog.group(1))):
+            found.append((position, name))
+    # 同じグループ（<div><Label htmlFor="openai-key" /><Input /><p>…</p></div>）の前の要素の id
+    # JSX テキストなら直接囲んでいる要素の親、文字列 prop なら書かれている要素の親
+    group = elements[-2] if child and len(elements) > 1 else elements[-1] if not child and elements else None
+    if group is not None:
+        siblings = TAG.finditer(source, group[0] + 1, elements[-1][0] if child else start)
+        identity = next((IDENTITY.search(match.group(3)) for match in siblings if IDENTITY.search(match.group(3))), None)
+        if identity:
+            found.append((group[0], clean_name(identity.group(1))))
+    return [name for _, name in sorted(found, reverse=True)]
+
+
+def literal_name(source: str, masked: str, kind: str, start: int, bound: int, values=()) -> str:
+    if kind == "text":
+        tag, attributes = enclosing_element(source, start, bound)
+        return (
+            element_name(tag, attributes)
+            or enclosing_name(masked, start, bound)
+            or placeholder_key(values)
+            or TAG_NAMES.get(tag)
+            or (clean_name(tag) if tag[:1].isupper() else "text")
+        )
+    if kind == "prop":
+        tag, attributes = opening_tag(source, start, bound)
+        return (
+            element_name(tag, attributes)
+            or enclosing_name(masked, start, bound)
+            or TAG_NAMES.get(tag)
+            or clean_name(tag)
+        )
+    return enclosing_name(masked, start, bound)
+
+
+def scan_source(path: str, source: str):
+    """source 中の日本語リテラルを出現順に返すジェネレーター"""
+    newlines = [i for i, char in enumerate(source) if char == "\n"]
+    masked = mask(source)
+
+    def context(kind: str, start: int, values=(), key: str = "") -> dict:
+        component, bound = component_at(source, start)
+        name = literal_name(source, masked, kind, start, bound, values)
+        if key:
+            # オブジェクトのプロパティ（CATEGORY_LABELS = { finance: "…" }）は変数の名前の下にプロパティ名で
+            section = object_name(masked, start, bound) or name
+            return {"component": component, "name": key, "contexts": (section,) if section else ()}
+        if kind not in ("text", "prop"):
+            return {"component": component, "name": name}
+        # 名前・名前空間・コンポーネントと同じセクションは付けない（{avgDiffRate > 0 && …} の avgDiffRate）
+        skipped = {name, namespace_for(path), camel(component)}
+        found = dict.fromkeys(s for s in contexts(source, masked, start, bound, kind == "text") if s not in skipped)
+        return {"component": component, "name": name, "contexts": tuple(found)}
+
+    for match in tokens(source):
+        kind = match.lastgroup
+        if kind == "comment" or not CJK.search(match.group(kind)):
+            continue
+        if kind == "text":
+            raw = match.group("text")
+            if not CJK.search(INTERPOLATION.sub("", raw)):
+                continue
+            # JSX と同じく、行頭・行末の空白を落として1行にまとめる
+            start = match.start("text") + len(raw) - len(raw.lstrip())
+            end = match.end("text") - (len(raw) - len(raw.rstrip()))
+            text, values = interpolate(re.sub(r"\s*\n\s*", " ", source[start:end]))
+            line = bisect.bisect_left(newlines, start) + 1
+            yield Literal(path, start, end, line, "text", "text", text, values, **context("text", start, values))
+            continue
+
+        start, end = match.span()
+        before = source[max(0, start - 80):start]
+        if kind == "template":
+            text, values = interpolate(source[start + 1:end - 1])
+        else:
+            text, values = unquote(match.group()), ()
+        line = bisect.bisect_left(newlines, start) + 1
+
+        attribute = ATTRIBUTE.search(before)
+        callee = CALLEE.search(before)
+        if attribute:
+            bare = not before.rstrip().endswith("{")
+            yield Literal(
+                path, start, end, line, "prop", camel(attribute.group(1)), text, values, bare, **context("prop", start)
+            )
+        elif callee and IGNORED_CALLEES.match(callee.group(1)):
+            continue
+        elif callee and callee.group(1) in CALL_SECTIONS:
+            yield Literal(
+                path, start, end, line, "call", CALL_SECTIONS[callee.group(1)], text, values, **context("call", start)
+            )
+        else:
+            key = PROPERTY.search(before)
+            yield Literal(
+                path, start, end, line, "message", "message", text, values,
+                **context("message", start, key=key.group(1) if key else ""),
+            )
+
+
+def scan_file(root: Path, path: str) -> list[Literal]:
+    return list(scan_source(path, (root / path).read_text(encoding="utf-8")))
+
+
+def source_files(root: Path) -> list[str]:
+    files = []
+    for directory, _, names in os.walk(root / SOURCE_DIR):
+        for name in sorted(names):
+            if name.endswith(".tsx"):
+                files.append(os.path.relpath(os.path.join(directory, name), root))
+    return sorted(files)
+
+
+class KeyIndex:
+    """カタログの既存のキーと、提案したキー（新しいキーが既存のものと衝突しないように）"""
+
+    def __init__(self, tree: dict) -> None:
+        # キー → 文言（配列などの文字列以外も、衝突の判定のために持つ）
+        self.values: dict[str, object] = {key: lookup(tree, key) for key in leaves(tree)}
+        self.branches = {key.rsplit(".", i)[0] for key in self.values for i in range(1, key.count(".") + 1)}
+        # 文言 → キー（定義順）
+        self.texts: dict[str, list[str]] = {}
+        for key, value in self.values.items():
+            if isinstance(value, str):
+                self.texts.setdefault(value, []).append(key)
+
+    def reusable(self, literal: Literal) -> str | None:
+        """同じ文言のキーのうち、literal のファイルで読み込まれる名前空間の最初のもの"""
+        namespaces = {namespace_for(literal.path), *CORE_NAMESPACES}
+        return next((key for key in self.texts.get(literal.text, ()) if key.split(".")[0] in namespaces), None)
+
+    def is_free(self, key: str) -> bool:
+        return key not in self.values and key not in self.branches and self.can_nest(key)
+
+    def can_nest(self, key: str) -> bool:
+        """key の親がどれも文言のキーでないか（そうでなければ番号を付けても空かない）"""
+        parts = key.split(".")
+        return not any(".".join(parts[:i]) in self.values for i in range(1, len(parts)))
+
+    def add(self, key: str, text: str) -> str:
+        self.values[key] = text
+        self.texts.setdefault(text, []).append(key)
+        self.branches.update(key.rsplit(".", i)[0] for i in range(1, key.count(".") + 1))
+        return key
+
+    def allocate(self, base: str, text: str) -> str:
+        """base が空いていればそのまま、使われていれば base2, base3, … を割り当てる"""
+        key, suffix = base, 2
+        while not self.is_free(key):
+            key, suffix = f"{base}{suffix}", suffix + 1
+        return self.add(key, text)
+
+
+def capitalize(name: str) -> str:
+    return name[:1].upper() + name[1:]
+
+
+def key_base(literal: Literal, context: str = "", flat: bool = False) -> str:
+    """{名前空間}[.{コンポーネント}][.{文脈}][.{種類}].{名前}
+
+    JSX テキストには種類を付けない。文脈の中の文字列 prop は、既存のキー
+    （myTemplates.createDialog.namePlaceholder）と同じく名前と種類をつなげ、名前の先頭の
+    文脈と同じ語は省く（editDialog の editName の placeholder → editDialog.namePlaceholder）。
+    flat なら文脈を名前の前につなげる（compare の title → compareTitle）。
+    """
+    namespace = namespace_for(literal.path)
+    parts = [namespace]
+    component = camel(literal.component)
+    if component and component != namespace:
+        parts.append(component)
+    name = literal.name or literal.section
+    if context:
+        if literal.kind == "prop":
+            leading = re.match(r"[a-z]*", context).group()
+            if leading and name.startswith(leading) and name[len(leading):len(leading) + 1].isupper():
+                name = name[len(leading)].lower() + name[len(leading) + 1:]
+            name += capitalize(literal.section)
+        if flat:
+            name = context + capitalize(name)
+        else:
+            parts.append(context)
+    elif literal.kind != "text":
+        parts.append(literal.section)
+    parts.append(name)
+    return ".".join(parts)
+
+
+def key_candidates(literal: Literal) -> list[str]:
+    """提案するキーの候補（優先順）
+
+    内側の文脈から順に favorites.compare.title、favorites.compareTitle を試し、
+    最後に文脈を付けない favorites.title を試す。
+    """
+    candidates = []
+    for context in literal.contexts:
+        candidates += [key_base(literal, context), key_base(literal, context, flat=True)]
+    candidates.append(key_base(literal))
+    return list(dict.fromkeys(candidates))
+
+
+def propose_key(literal: Literal, index: KeyIndex) -> tuple[str, bool, bool]:
+    """(キー, 既存のキーか, 番号を付けたか)
+
+    どの候補も使われているときだけ、最初の候補に番号を付ける（呼び出し側で警告する）。
+    """
+    reused = index.reusable(literal)
+    if reused is not None:
+        return reused, True, False
+    candidates = key_candidates(literal)
+    free = next((key for key in candidates if index.is_free(key)), None)
+    if free is not None:
+        return index.add(free, literal.text), False, False
+    # 親が文言のキーになっている候補（favorites.compare が既にある favorites.compare.title）は番号を付けても空かない
+    base = next((key for key in candidates if index.can_nest(key)), candidates[-1])
+    while not index.can_nest(base):
+        # settings.toast が文言のキーなら settings.toastSaved のように親とつなげる
+        head, parent, name = base.rsplit(".", 2)
+        base = f"{head}.{parent}{capitalize(name)}"
+    return index.allocate(base, literal.text), False, True
+
+
+@dataclass(frozen=True)
+class Proposal:
+    literal: Literal
+    key: str
+    existing: bool
+    # 名前が衝突して末尾に番号を付けたキー（settings.title2）
+    numbered: bool = False
+
+
+def propose(literals: list[Literal], ja: dict) -> list[Proposal]:
+    index = KeyIndex(ja)
+    return [Proposal(literal, *propose_key(literal, index)) for literal in literals]
+
+
+def write_drafts(root: Path, proposals: list[Proposal]) -> list[str]:
+    """新規キーの ja 下書き・en の TODO カタログ・検出箇所の一覧を catalog_drafts/ に書き出す"""
+    ja: dict[str, str] = {}
+    en: dict[str, str] = {}
+    found = []
+    for proposal in proposals:
+        literal = proposal.literal
+        if not proposal.existing:
+            ja.setdefault(proposal.key, literal.text)
+            en.setdefault(proposal.key, f"TODO: {literal.text}")
+        found.append({
+            "file": literal.path,
+            "line": literal.line,
+            "kind": literal.kind,
+            "key": proposal.key,
+            "existing": proposal.existing,
+            "numbered": proposal.numbered,
+            "text": literal.text,
+        })
+    written = []
+    written += write_if_changed(root, root / DRAFTS_DIR / "literals_ja.json", ja)
+    written += write_if_changed(root, root / DRAFTS_DIR / "literals_en.json", en)
+    written += write_if_changed(root, root / DRAFTS_DIR / "literals.json", found)
+    return written
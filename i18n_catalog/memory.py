@@ -0,0 +1,64 @@
+"""
+翻訳メモリ（content-addressed）
+
+訳文は (原文, 文脈, 用語集のバージョン) のハッシュをキーに保存するので、同じ文字列を
+二度翻訳に出すことはない。用語集を変えるとバージョン（内容のハッシュ）が変わり、
+以前の訳は再利用されなくなる。
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from .output import write_bytes_if_changed
+
+MT_DIR = Path("catalog_mt")
+MEMORY_FILE = MT_DIR / "memory.json"
+
+
+def memory_key(source: str, context: str, glossary: str) -> str:
+    return hashlib.sha256("\0".join((source, context, glossary)).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class Entry:
+    source: str
+    context: str
+    glossary: str
+    target: str
+
+
+class TranslationMemory:
+    def __init__(self, entries: dict[str, Entry] | None = None):
+        self.entries: dict[str, Entry] = entries or {}
+
+    @classmethod
+    def load(cls, root: Path) -> "TranslationMemory":
+        path = root / MEMORY_FILE
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls({key: Entry(*value) for key, value in data.items()})
+
+    def save(self, root: Path) -> bool:
+        # 1エントリ1行（差分が読みやすく、数十万件でもコンパクト）
+        lines = ",\n".join(
+            f"{json.dumps(key)}: "
+            + json.dumps([entry.source, entry.context, entry.glossary, entry.target], ensure_ascii=False)
+            for key, entry in self.entries.items()
+        )
+        data = f"{{\n{lines}\n}}" if lines else "{}"
+        return write_bytes_if_changed(root / MEMORY_FILE, data.encode("utf-8"))
+
+    def get(self, source: str, context: str, glossary: str) -> str | None:
+        entry = self.entries.get(memory_key(source, context, glossary))
+        return entry.target if entry else None
+
+    def add(self, entry: Entry) -> str:
+        key = memory_key(entry.source, entry.context, entry.glossary)
+        self.entries[key] = entry
+        return key
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,152 @@
+"""
+フラットなドット区切りキーの出力を、ネストしたロケールカタログへマージする
+
+全レイヤーのキーを1回ずつトライに挿入するだけなので、キー数に対して線形時間。
+同じキーの値の食い違い（value）と、文字列とオブジェクトの衝突（shape）を検出する。
+入力は手で管理するベースカタログ（catalog_base/{lang}.json）とスクリプト出力だけで、
+書き出した client/src/locales/{lang}.json は読み込まない。
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .output import write_if_changed
+from .placeholders import normalize_tree
+from .sources import LANGS, outputs
+from .trace import span
+
+LOCALES_DIR = Path("client/src/locales")
+# ロケールにしかないキー（home, header など）の手で管理する辞書
+BASE_DIR = Path("catalog_base")
+
+
+@dataclass(frozen=True)
+class Layer:
+    name: str
+    catalog: dict
+    mount: str = ""
+
+
+@dataclass(frozen=True)
+class Conflict:
+    key: str
+    kind: str  # "value" | "shape"
+    origin: str
+    previous_origin: str
+
+    def describe(self) -> str:
+        label = "値の食い違い" if self.kind == "value" else "文字列とオブジェクトの衝突"
+        return f"{self.key}: {label}（{self.previous_origin} → {self.origin}）"
+
+
+class CatalogTrie:
+    """ドット区切りのパスをネストした辞書に畳み込むトライ（後勝ち）"""
+
+    def __init__(self) -> None:
+        self.root: dict = {}
+        self.conflicts: list[Conflict] = []
+        self._origins: dict[tuple[str, ...], str] = {}
+
+    def add(self, catalog: dict, origin: str, mount: str = "") -> None:
+        prefix = tuple(mount.split(".")) if mount else ()
+        self._add(prefix, catalog, origin)
+
+    def _add(self, prefix: tuple[str, ...], catalog: dict, origin: str) -> None:
+        for key, value in catalog.items():
+            path = prefix + tuple(key.split("."))
+            if isinstance(value, dict):
+                self._add(path, value, origin)
+            else:
+                self.insert(path, value, origin)
+
+    def insert(self, path: tuple[str, ...], value, origin: str) -> None:
+        node = self.root
+        for depth, part in enumerate(path[:-1], start=1):
+            child = node.get(part)
+            if not isinstance(child, dict):
+                if child is not None:
+                    self._conflict(path[:depth], "shape", origin)
+                child = node[part] = {}
+                self._origins[path[:depth]] = origin
+            node = child
+
+        leaf = path[-1]
+        existing = node.get(leaf)
+        if isinstance(existing, dict):
+            self._conflict(path, "shape", origin)
+        elif existing is not None and existing != value:
+            self._conflict(path, "value", origin)
+        node[leaf] = value
+        self._origins[path] = origin
+
+    def _conflict(self, path: tuple[str, ...], kind: str, origin: str) -> None:
+        self.conflicts.append(
+            Conflict(".".join(path), kind, origin, self._origins.get(path, "?"))
+        )
+
+
+def merge_layers(layers: list[Layer]) -> tuple[dict, list[Conflict]]:
+    trie = CatalogTrie()
+    for layer in layers:
+        trie.add(layer.catalog, layer.name, layer.mount)
+    return trie.root, trie.conflicts
+
+
+def locale_path(root: Path, lang: str) -> Path:
+    return root / LOCALES_DIR / f"{lang}.json"
+
+
+def base_path(root: Path, lang: str) -> Path:
+    return root / BASE_DIR / f"{lang}.json"
+
+
+def locale_layers(root: Path, lang: str, include_superseded: bool = False) -> list[Layer]:
+    """ベースカタログを土台に、スクリプト出力をマージ順に重ねる
+
+    前回書き出したロケールカタログは土台にしない（スクリプトから消したキーが残り続け、
+    文言の修正が全て値の食い違いとして報告されるため）。
+    プレースホルダーは各レイヤーで {{name}} 形式に正規化してからマージする。
+    """
+    base = base_path(root, lang)
+    layers = [Layer(str(BASE_DIR / base.name), load_catalog(base))]
+    for output in outputs(include_superseded):
+        name = output.filename(lang)
+        layers.append(Layer(name, load_catalog(root / name), output.mount))
+    return layers
+
+
+def load_catalog(path: Path) -> dict:
+    with span("load", file=path.name):
+        text = path.read_text(encoding="utf-8")
+        with span("parse"):
+            catalog = json.loads(text)
+        with span("normalize"):
+            return normalize_tree(catalog)
+
+
+@dataclass
+class MergeResult:
+    trees: dict[str, dict] = field(default_factory=dict)
+    written: list[str] = field(default_factory=list)
+    conflicts: dict[str, list[Conflict]] = field(default_factory=dict)
+
+
+def merge_locales(root: Path, write: bool = True, include_superseded: bool = False) -> MergeResult:
+    result = MergeResult()
+    for lang in LANGS:
+        layers = locale_layers(root, lang, include_superseded)
+        with span("merge_layers", lang=lang):
+            tree, conflicts = merge_layers(layers)
+        result.trees[lang] = tree
+        result.conflicts[lang] = conflicts
+    if write:
+        result.written = write_locales(root, result.trees)
+    return result
+
+
+def write_locales(root: Path, trees: dict[str, dict]) -> list[str]:
+    written = []
+    for lang, tree in trees.items():
+        written += write_if_changed(root, locale_path(root, lang), tree)
+    return written
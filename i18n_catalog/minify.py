@@ -0,0 +1,93 @@
+"""
+本番用カタログの圧縮
+
+build --production の成果物（artifacts.py）は名前空間ファイルとコアバンドルを空白なしの JSON で書き出し、
+同じチャンク内で繰り返し現れる文字列（"保存"、"キャンセル"、ログインが必要な旨の説明など）を
+文字列表 strings に1回だけ置いて、メッセージ側はそのインデックス（数値）で参照する。
+プレースホルダーを含むメッセージはテンプレートと内容が重複するので messages から省く。
+client/src/i18n.ts が読み込み時に両方を元に戻すので t() の呼び出しは変わらない。
+
+文字列表はチャンクごとに持つ。名前空間をまたいで共有すると、1つの名前空間の編集で
+インデックスがずれて全チャンクが書き換わり、読み込み順にも依存するようになるため。
+"""
+
+import json
+from collections import Counter
+
+from .compile import template_source
+
+
+def strings(tree):
+    if isinstance(tree, dict):
+        for value in tree.values():
+            yield from strings(value)
+    elif isinstance(tree, list):
+        for value in tree:
+            yield from strings(value)
+    elif isinstance(tree, str):
+        yield tree
+
+
+def has_scalars(tree) -> bool:
+    """文字列以外の値（数値など）があるか。あれば参照と区別できないので表を作らない"""
+    if isinstance(tree, dict):
+        return any(has_scalars(value) for value in tree.values())
+    if isinstance(tree, list):
+        return any(has_scalars(value) for value in tree)
+    return not isinstance(tree, str)
+
+
+def string_table(messages: dict) -> list[str]:
+    """参照に置き換えるとバイト数が減る文字列を、出現回数の多い順に並べる"""
+    counts = Counter(strings(messages))
+    table = []
+    for text, count in sorted(counts.items(), key=lambda item: -item[1]):
+        if count < 2:
+            break
+        encoded = len(json.dumps(text, ensure_ascii=False).encode("utf-8"))
+        reference = len(str(len(table)))
+        # 全出現を参照に置き換えた削減分から、表の要素（とカンマ）の分を引く
+        if count * (encoded - reference) - (encoded + 1) > 0:
+            table.append(text)
+    return table
+
+
+def replace(tree, indexes: dict[str, int]):
+    if isinstance(tree, dict):
+        return {key: replace(value, indexes) for key, value in tree.items()}
+    if isinstance(tree, list):
+        return [replace(value, indexes) for value in tree]
+    return indexes.get(tree, tree)
+
+
+def without(tree: dict, paths: set[tuple[str, ...]], path: tuple[str, ...] = ()) -> dict:
+    pruned = {}
+    for key, value in tree.items():
+        if path + (key,) in paths:
+            continue
+        pruned[key] = without(value, paths, path + (key,)) if isinstance(value, dict) else value
+    return pruned
+
+
+def templated_paths(messages: dict, templates: dict[str, list], prefix: str) -> set[tuple[str, ...]]:
+    """テンプレートから復元できるメッセージのパス（配列の要素は位置がずれるので含めない）"""
+    paths = set()
+    for key, template in templates.items():
+        path = tuple(key.removeprefix(prefix).split("."))
+        node = messages
+        for part in path[:-1]:
+            node = node.get(part) if isinstance(node, dict) else None
+        if isinstance(node, dict) and node.get(path[-1]) == template_source(template):
+            paths.add(path)
+    return paths
+
+
+def minify_chunk(chunk: dict, prefix: str = "") -> dict:
+    """{messages, templates} から本番用のチャンクを作る（prefix はテンプレートのキーの名前空間）"""
+    messages = without(chunk["messages"], templated_paths(chunk["messages"], chunk["templates"], prefix))
+    minified = {**chunk, "messages": messages}
+    table = [] if has_scalars(messages) else string_table(messages)
+    if table:
+        indexes = {text: index for index, text in enumerate(table)}
+        minified.update(messages=replace(messages, indexes), strings=table)
+    return minified
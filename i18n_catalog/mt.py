@@ -0,0 +1,349 @@
+"""
+機械翻訳ステージ（オフラインのバッチ翻訳）
+
+ja にあって en に無いキーと、原文が変わって古くなった機械翻訳を集め、
+OpenAI 互換のエンドポイントへ1リクエストあたり複数キーずつ翻訳に出す。
+訳文は翻訳メモリ（memory.py）に保存し、同じ原文は二度と送らない。
+同時リクエスト数の上限とトークンバケットによるレート制限を掛け、完了した
+バッチはジャーナルに追記するので、途中で落ちても再実行で続きから翻訳できる。
+
+結果は catalog_mt/{lang}.json にキーごとに記録し、ビルドは原文が現在の ja と
+一致するものだけを en の欠けているキーに補う（人手の訳が常に優先）。
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .fallback import leaves, lookup
+from .fuzzy import FuzzyIndex, Match, build_index, human_translations
+from .glossary import Glossary
+from .memory import MT_DIR, Entry, TranslationMemory, memory_key
+from .output import write_if_changed
+from .placeholders import placeholders
+
+SOURCE_LANG = "ja"
+TARGET_LANGS = ("en",)
+LANGUAGE_NAMES = {"ja": "Japanese", "en": "English"}
+JOURNAL_FILE = MT_DIR / ".journal.jsonl"
+
+BASE_URL_ENV = "I18N_MT_BASE_URL"
+API_KEY_ENVS = ("I18N_MT_API_KEY", "OPENAI_API_KEY")
+MODEL_ENV = "I18N_MT_MODEL"
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# 翻訳に出すときに例として添える既訳の類似度の下限
+EXAMPLE_THRESHOLD = 0.5
+
+# 429 と 5xx は待ってから再送する
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def insert(tree: dict, key: str, value: str) -> dict:
+    """key に value を入れた新しい辞書を返す（経路上の辞書だけ複製）"""
+    head, _, rest = key.partition(".")
+    copied = dict(tree)
+    copied[head] = insert(copied.get(head, {}), rest, value) if rest else value
+    return copied
+
+
+def translations_path(lang: str) -> Path:
+    return MT_DIR / f"{lang}.json"
+
+
+def load_translations(root: Path, lang: str) -> dict[str, dict[str, str]]:
+    """キー → {"source": 原文, "text": 訳文}"""
+    path = root / translations_path(lang)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@dataclass(frozen=True)
+class Request:
+    key: str
+    source: str
+    # 名前空間（同じ原文でも画面によって訳し分けられるように）
+    context: str
+
+
+def missing(trees: dict[str, dict], lang: str, translations: dict) -> list[Request]:
+    """人手の訳が無く、機械翻訳も無いか古くなっているキー"""
+    ja, target = trees[SOURCE_LANG], trees[lang]
+    found = []
+    for key in leaves(ja):
+        source = lookup(ja, key)
+        if not isinstance(source, str) or not source.strip() or lookup(target, key) is not None:
+            continue
+        if translations.get(key, {}).get("source") == source:
+            continue
+        found.append(Request(key, source, key.split(".")[0]))
+    return found
+
+
+def apply_translations(root: Path, trees: dict[str, dict]) -> tuple[dict[str, dict], dict[str, list[str]]]:
+    """機械翻訳で en の欠けているキーを補う。原文が現在の ja と違う訳は使わない"""
+    resolved = dict(trees)
+    filled: dict[str, list[str]] = {}
+    for lang in TARGET_LANGS:
+        tree = trees[lang]
+        keys = []
+        for key, translation in load_translations(root, lang).items():
+            if lookup(tree, key) is None and lookup(trees[SOURCE_LANG], key) == translation["source"]:
+                tree = insert(tree, key, translation["text"])
+                keys.append(key)
+        resolved[lang] = tree
+        filled[lang] = keys
+    return resolved, filled
+
+
+class TokenBucket:
+    """rate 個/秒で補充され、最大 capacity 個まで貯まるトークンバケット"""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        if rate <= 0:
+            raise ValueError(f"レートは正の数にしてください: {rate}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class Journal:
+    """完了したバッチの訳文を追記するチェックポイント（1行1バッチの JSON）"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def replay(self) -> list[Entry]:
+        if not self.path.exists():
+            return []
+        entries = []
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                entries += [Entry(*entry) for entry in json.loads(line)]
+            except ValueError:
+                # 書き込み途中で落ちた最後の行
+                break
+        return entries
+
+    def append(self, entries: list[Entry]) -> None:
+        line = json.dumps([[e.source, e.context, e.glossary, e.target] for e in entries], ensure_ascii=False)
+        with self.lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+class Client:
+    """OpenAI 互換の chat/completions エンドポイント"""
+
+    def __init__(self, base_url: str, api_key: str, model: str, timeout: float = 120, retries: int = 3):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.model = model
+        self.timeout = timeout
+        self.retries = retries
+
+    @classmethod
+    def from_environ(cls, environ=os.environ) -> "Client":
+        api_key = next((environ[name] for name in API_KEY_ENVS if environ.get(name)), "")
+        return cls(environ.get(BASE_URL_ENV, DEFAULT_BASE_URL), api_key, environ.get(MODEL_ENV, DEFAULT_MODEL))
+
+    def prompt(self, lang: str, glossary: Glossary, examples: list[Match]) -> str:
+        lines = [
+            f"Translate the values of the JSON object from {LANGUAGE_NAMES[SOURCE_LANG]} "
+            f"into {LANGUAGE_NAMES[lang]} for the UI of a resume-writing web app.",
+            "Each value is prefixed with its screen in square brackets; do not translate or keep the prefix.",
+            "Keep {{placeholders}} and line breaks exactly as they are.",
+            "Reply with a JSON object with the same keys and the translated values only.",
+        ]
+        terms = {term: renderings[0] for term, renderings in glossary.renderings(lang).items()}
+        if terms:
+            lines.append("Use this glossary: " + json.dumps(terms, ensure_ascii=False))
+        if examples:
+            pairs = [[example.source, example.target] for example in examples]
+            lines.append("Stay consistent with these existing translations: " + json.dumps(pairs, ensure_ascii=False))
+        return "\n".join(lines)
+
+    def complete(self, system: str, user: str) -> str:
+        body = json.dumps({
+            "model": self.model,
+            "temperature": 0,
+            "response_format": {"type": "json_object"},
+            "messages": [{"role": "system", "content": system}, {"role": "user", "content": user}],
+        }).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        for attempt in range(self.retries + 1):
+            request = urllib.request.Request(f"{self.base_url}/chat/completions", body, headers)
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    return json.load(response)["choices"][0]["message"]["content"]
+            except urllib.error.HTTPError as error:
+                if error.code not in RETRY_STATUSES or attempt == self.retries:
+                    raise
+                time.sleep(float(error.headers.get("Retry-After") or 2 ** attempt))
+            except (urllib.error.URLError, TimeoutError, ConnectionError):
+                # 接続のリセットやタイムアウトなど、一時的な通信エラー
+                if attempt == self.retries:
+                    raise
+                time.sleep(2 ** attempt)
+
+    def translate(
+        self, batch: list[Request], lang: str, glossary: Glossary, examples: list[Match] = ()
+    ) -> dict[str, str]:
+        """id（バッチ内の連番）→ 訳文"""
+        payload = {str(i): f"[{request.context}] {request.source}" for i, request in enumerate(batch)}
+        content = self.complete(self.prompt(lang, glossary, examples), json.dumps(payload, ensure_ascii=False))
+        return {key: value for key, value in json.loads(content).items() if isinstance(value, str)}
+
+
+def examples(index: FuzzyIndex, batch: list[Request], per_request: int = 2, limit: int = 20) -> list[Match]:
+    """バッチの各原文に似た既訳（同じ原文は除く）"""
+    found: dict[str, Match] = {}
+    for request in batch:
+        for match in index.search(request.source, per_request + 1, EXAMPLE_THRESHOLD):
+            if match.source != request.source:
+                found.setdefault(match.source, match)
+    return sorted(found.values(), key=lambda match: -match.score)[:limit]
+
+
+def batches(requests: list[Request], size: int, max_chars: int) -> list[list[Request]]:
+    found: list[list[Request]] = []
+    current: list[Request] = []
+    chars = 0
+    for request in requests:
+        if current and (len(current) >= size or chars + len(request.source) > max_chars):
+            found.append(current)
+            current, chars = [], 0
+        current.append(request)
+        chars += len(request.source)
+    if current:
+        found.append(current)
+    return found
+
+
+@dataclass
+class TranslateResult:
+    # 言語 → 今回翻訳に出したキー / 翻訳メモリから補ったキー / 人手の訳から補ったキー / 失敗したキー
+    translated: dict[str, list[str]] = field(default_factory=dict)
+    reused: dict[str, list[str]] = field(default_factory=dict)
+    prefilled: dict[str, list[str]] = field(default_factory=dict)
+    failed: dict[str, list[str]] = field(default_factory=dict)
+    requests: int = 0
+    written: list[str] = field(default_factory=list)
+
+
+def translate(
+    root: Path,
+    trees: dict[str, dict],
+    client: Client,
+    concurrency: int = 4,
+    rate: float = 1.0,
+    batch_size: int = 40,
+    max_chars: int = 6000,
+) -> TranslateResult:
+    glossary = Glossary.load(root)
+    memory = TranslationMemory.load(root)
+    journal = Journal(root / JOURNAL_FILE)
+    # 前回の実行で完了していたバッチを取り込む
+    for entry in journal.replay():
+        memory.add(entry)
+
+    result = TranslateResult()
+    bucket = TokenBucket(rate)
+    for lang in TARGET_LANGS:
+        translations = load_translations(root, lang)
+        requests = missing(trees, lang, translations)
+        version = f"{lang}:{glossary.version}"
+        human = human_translations(trees[SOURCE_LANG], trees[lang])
+        index = build_index(memory, human, lang)
+
+        # 別のキーに人手の訳がある原文はそれを使い、同じ原文・文脈は1回だけ送る
+        unique: dict[str, Request] = {}
+        for request in requests:
+            if request.source not in human and memory.get(request.source, request.context, version) is None:
+                unique.setdefault(memory_key(request.source, request.context, version), request)
+
+        def run(batch: list[Request]) -> list[Entry]:
+            bucket.acquire()
+            translated = client.translate(batch, lang, glossary, examples(index, batch))
+            entries = []
+            for i, request in enumerate(batch):
+                target = translated.get(str(i))
+                # プレースホルダーが崩れた訳は採用しない
+                if target and placeholders(target) == placeholders(request.source):
+                    entries.append(Entry(request.source, request.context, version, target))
+            return entries
+
+        work = batches(list(unique.values()), batch_size, max_chars)
+        result.requests += len(work)
+        errors = []
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in as_completed([pool.submit(run, batch) for batch in work]):
+                # 失敗したバッチがあっても、完了したバッチはジャーナルに残す
+                try:
+                    entries = future.result()
+                except Exception as error:
+                    errors.append(error)
+                    continue
+                journal.append(entries)
+                for entry in entries:
+                    memory.add(entry)
+        if errors:
+            raise errors[0]
+
+        sent = {request.source for request in unique.values()}
+        translated, reused, prefilled, failed = [], [], [], []
+        for request in requests:
+            if request.source in human:
+                translations[request.key] = {"source": request.source, "text": human[request.source]}
+                prefilled.append(request.key)
+                continue
+            target = memory.get(request.source, request.context, version)
+            if target is None:
+                failed.append(request.key)
+                continue
+            translations[request.key] = {"source": request.source, "text": target}
+            (translated if request.source in sent else reused).append(request.key)
+        # 人手の訳が付いたキーと ja から消えたキーの機械翻訳は捨てる
+        translations = {
+            key: value for key, value in translations.items()
+            if lookup(trees[lang], key) is None and isinstance(lookup(trees[SOURCE_LANG], key), str)
+        }
+        result.written += write_if_changed(root, root / translations_path(lang), translations)
+        result.translated[lang], result.reused[lang] = translated, reused
+        result.prefilled[lang], result.failed[lang] = prefilled, failed
+
+    if memory.save(root):
+        result.written.append(str(MT_DIR / "memory.json"))
+    journal.clear()
+    return result
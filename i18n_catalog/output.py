@@ -0,0 +1,76 @@
+"""
+カタログファイルの書き込み
+
+出力先は常にリポジトリ直下を基準に解決する。整形は translate_*.py 由来の
+形式（ensure_ascii=False, indent=2, 末尾改行なし）に固定し、本番用のカタログだけは
+compact=True で空白なしにする。キーは常にソートして書き出すので、ソース辞書の中で
+定義を並べ替えても出力は変わらない（配列の要素の順序はそのまま）。一時ファイルへ
+書いてから rename するので途中の状態は見えず、内容が同一のファイルには触れない
+（mtime が変わらず Vite の HMR も走らない）。
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from .trace import span
+
+ROOT = Path(__file__).resolve().parent.parent
+# ビルドが書き出すレポート（フォールバック・除去・サイズの履歴）の置き場所
+REPORTS_DIR = Path("catalog_reports")
+
+
+def serialize(catalog, compact: bool = False) -> bytes:
+    with span("serialize"):
+        if compact:
+            return json.dumps(
+                catalog, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+            ).encode("utf-8")
+        return json.dumps(
+            catalog, ensure_ascii=False, indent=2, separators=(",", ": "), sort_keys=True
+        ).encode("utf-8")
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """同じディレクトリの一時ファイルに書いてから置き換える"""
+    with span("write", file=path.name):
+        _atomic_write(path, data)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if path.exists():
+            os.chmod(temp, path.stat().st_mode & 0o777)
+        else:
+            os.chmod(temp, 0o644)
+        os.replace(temp, path)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+
+def write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    atomic_write(path, data)
+    return True
+
+
+def write_if_changed(root: Path, path: Path, catalog, compact: bool = False) -> list[str]:
+    """内容が変わったときだけ書き込み、書き込んだファイルのパスを返す"""
+    if write_bytes_if_changed(path, serialize(catalog, compact)):
+        return [str(path.relative_to(root))]
+    return []
+
+
+def write_catalog(name: str, catalog: dict) -> bool:
+    """translate_*.py 用: リポジトリ直下の name に書き込む。書き込んだら True"""
+    return write_bytes_if_changed(ROOT / name, serialize(catalog))
@@ -0,0 +1,72 @@
+"""
+プレースホルダー記法の正規化と、ja / en 間のプレースホルダー検証
+
+カタログには {{date}}（i18next 形式）、{date}、{APP_TITLE} が混在しているが、
+補間されるのは {{name}} だけなので、ビルド時に全て {{name}} に揃える。
+"""
+
+import re
+from dataclasses import dataclass
+
+# {{name}} と {name} の両方に一致する（{{ }} を先に試す）
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}|\{([A-Za-z_]\w*)\}")
+
+
+def normalize(text: str) -> str:
+    return PLACEHOLDER.sub(lambda m: "{{%s}}" % (m.group(1) or m.group(2)), text)
+
+
+def normalize_tree(tree):
+    if isinstance(tree, dict):
+        return {key: normalize_tree(value) for key, value in tree.items()}
+    if isinstance(tree, list):
+        return [normalize_tree(value) for value in tree]
+    if isinstance(tree, str):
+        return normalize(tree)
+    return tree
+
+
+def placeholders(text: str) -> frozenset[str]:
+    return frozenset(m.group(1) or m.group(2) for m in PLACEHOLDER.finditer(text))
+
+
+EMPTY = frozenset()
+
+
+def index(tree, prefix: str = "", found: dict | None = None) -> dict[str, frozenset[str]]:
+    """全メッセージを {キー: プレースホルダー集合} に索引化する（1回の走査）"""
+    found = {} if found is None else found
+    if isinstance(tree, dict):
+        items = tree.items()
+    elif isinstance(tree, list):
+        items = enumerate(tree)
+    else:
+        text = tree if isinstance(tree, str) else ""
+        found[prefix.rstrip(".")] = placeholders(text) if "{" in text else EMPTY
+        return found
+    for key, value in items:
+        index(value, f"{prefix}{key}.", found)
+    return found
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    key: str
+    ja: frozenset[str]
+    en: frozenset[str]
+
+    def describe(self) -> str:
+        ja = ", ".join(sorted(self.ja)) or "なし"
+        en = ", ".join(sorted(self.en)) or "なし"
+        return f"{self.key}: ja [{ja}] / en [{en}]"
+
+
+def verify(ja: dict, en: dict) -> list[Mismatch]:
+    """両言語にあるキーのうち、プレースホルダー集合が食い違うものを返す"""
+    ja_index = index(ja)
+    mismatches = []
+    for key, actual in index(en).items():
+        expected = ja_index.get(key)
+        if expected is not None and expected != actual:
+            mismatches.append(Mismatch(key, expected, actual))
+    return mismatches
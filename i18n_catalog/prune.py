@@ -0,0 +1,79 @@
+"""
+使われていないキーの除去（tree-shaking）
+
+client/src の使用箇所インデックス（usage.py）で参照されていないキーを、配信する
+カタログから取り除く。テンプレートリテラルで組み立てるキーはインデックスの
+ワイルドカードで、それでも拾えない動的なキーは catalog_keep.json の許可リストで残す。
+名前空間・言語ごとの削減バイト数をレポートに記録する。
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .compile import compile_chunk
+from .output import REPORTS_DIR, serialize, write_if_changed
+from .usage import UsageIndex, pattern_regex
+
+KEEP_FILE = "catalog_keep.json"
+
+
+@dataclass
+class PruneResult:
+    trees: dict[str, dict] = field(default_factory=dict)
+    # 言語 → 取り除いたキー
+    removed: dict[str, list[str]] = field(default_factory=dict)
+    # 名前空間 → {言語: 削減バイト数}
+    saved: dict[str, dict[str, int]] = field(default_factory=dict)
+
+
+def load_keep(root: Path) -> list[str]:
+    """許可リストのパターン（announcement.feature* など）"""
+    path = root / KEEP_FILE
+    if not path.exists():
+        return []
+    return json.loads(path.read_text(encoding="utf-8"))["keep"]
+
+
+def prune_tree(tree: dict, used: set[str], patterns: list, removed: list[str], prefix: str = "") -> dict:
+    pruned = {}
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        # returnObjects で部分木ごと参照しているキーは配下を全て残す
+        if path in used or any(pattern.match(path) for pattern in patterns):
+            pruned[key] = value
+        elif isinstance(value, dict):
+            subtree = prune_tree(value, used, patterns, removed, f"{path}.")
+            if subtree:
+                pruned[key] = subtree
+        else:
+            removed.append(path)
+    return pruned
+
+
+def chunk_size(tree: dict, namespace: str) -> int:
+    if namespace not in tree:
+        return 0
+    return len(serialize(compile_chunk(tree[namespace], f"{namespace}.")))
+
+
+def prune(root: Path, trees: dict[str, dict], index: UsageIndex) -> PruneResult:
+    used = set(index.references())
+    patterns = [pattern_regex(pattern) for pattern in [*index.dynamic_patterns(), *load_keep(root)]]
+    result = PruneResult()
+    for lang, tree in trees.items():
+        removed: list[str] = []
+        result.trees[lang] = prune_tree(tree, used, patterns, removed)
+        result.removed[lang] = removed
+        for namespace in tree:
+            saved = chunk_size(tree, namespace) - chunk_size(result.trees[lang], namespace)
+            if saved:
+                result.saved.setdefault(namespace, {})[lang] = saved
+    return result
+
+
+def write_report(root: Path, result: PruneResult) -> list[str]:
+    (root / REPORTS_DIR).mkdir(exist_ok=True)
+    # 除去したキーの並びはツリーの順序（ベースカタログの並び）に左右されるのでソートする
+    report = {"saved": result.saved, "removed": {lang: sorted(keys) for lang, keys in result.removed.items()}}
+    return write_if_changed(root, root / REPORTS_DIR / "prune.json", report)
@@ -0,0 +1,137 @@
+"""
+翻訳辞書のソース定義
+
+translate_*.py はモジュールレベルで辞書を定義しているため、実行せずに
+ast で辞書リテラルだけを取り出す（スクリプト側の書き込み処理は走らない）。
+"""
+
+import ast
+from dataclasses import dataclass
+
+LANGS = ("ja", "en")
+
+
+@dataclass(frozen=True)
+class Output:
+    """1つの出力カタログ（{stem}_{lang}.json）と、それを構成する辞書変数
+
+    mount: ロケールカタログ上の取り付け位置（名前空間なしの辞書用、例: "privacy"）
+    superseded: 後発のスクリプトに置き換えられ、ロケールへのマージ対象外
+    """
+
+    stem: str
+    ja: tuple[str, ...]
+    en: tuple[str, ...]
+    mount: str = ""
+    superseded: bool = False
+
+    def variables(self, lang: str) -> tuple[str, ...]:
+        return self.ja if lang == "ja" else self.en
+
+    def filename(self, lang: str) -> str:
+        return f"{self.stem}_{lang}.json"
+
+
+@dataclass(frozen=True)
+class Script:
+    """translate_*.py 1本分のソース定義"""
+
+    path: str
+    outputs: tuple[Output, ...]
+
+
+SCRIPTS = (
+    Script("translate_all_pages.py", (
+        Output("pages",
+               ja=("favorites_ja", "api_settings_ja"),
+               en=("favorites_en", "api_settings_en")),
+    )),
+    # ApiSettings.tsx の移植時にキー名が変わった（openaiDescription など）
+    Script("translate_api_settings_extra.py", (
+        Output("api_settings_extra",
+               ja=("api_settings_extra_ja",),
+               en=("api_settings_extra_en",),
+               superseded=True),
+    )),
+    Script("translate_components.py", (
+        Output("components", ja=("announcement_ja",), en=("announcement_en",)),
+    )),
+    Script("translate_final_pages.py", (
+        Output("privacy", ja=("privacy_ja",), en=("privacy_en",), mount="privacy"),
+        # translate_terms_complete.py / translate_mytemplates_complete.py に置き換え済み
+        Output("terms", ja=("terms_ja",), en=("terms_en",),
+               mount="terms", superseded=True),
+        Output("mytemplates", ja=("mytemplates_ja",), en=("mytemplates_en",),
+               mount="myTemplates", superseded=True),
+    )),
+    Script("translate_guide.py", (
+        Output("guide",
+               ja=("guide_translations_ja",),
+               en=("guide_translations_en",)),
+    )),
+    Script("translate_home_remaining.py", (
+        Output("home_remaining",
+               ja=("home_remaining_ja",),
+               en=("home_remaining_en",)),
+    )),
+    Script("translate_mytemplates_complete.py", (
+        Output("mytemplates_complete",
+               ja=("mytemplates_ja",),
+               en=("mytemplates_en",),
+               mount="myTemplates"),
+    )),
+    # translate_all_pages.py と各 *_complete スクリプトに置き換え済み
+    Script("translate_remaining_pages.py", (
+        Output("remaining_pages",
+               ja=("favorites_ja", "privacy_ja", "terms_ja", "myTemplates_ja"),
+               en=("favorites_en", "privacy_en", "terms_en", "myTemplates_en"),
+               superseded=True),
+    )),
+    Script("translate_terms_complete.py", (
+        Output("terms_complete", ja=("terms_ja",), en=("terms_en",), mount="terms"),
+    )),
+    # build_catalogs.py codemod が書き換える
+    Script("translate_literals.py", (
+        Output("literals", ja=("literals_ja",), en=("literals_en",)),
+    )),
+)
+
+
+def load_dicts(source: str, filename: str = "<source>") -> dict[str, dict]:
+    """モジュールレベルで代入された辞書リテラルを変数名ごとに返す（後勝ち）"""
+    tree = ast.parse(source, filename=filename)
+    found: dict[str, dict] = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Dict):
+            continue
+        value = ast.literal_eval(node.value)
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                found[target.id] = value
+    return found
+
+
+def render(script: Script, source: str) -> dict[tuple[str, str], dict]:
+    """スクリプトの全出力を {(stem, lang): 辞書} で返す"""
+    dicts = load_dicts(source, script.path)
+    rendered = {}
+    for output in script.outputs:
+        for lang in LANGS:
+            merged: dict = {}
+            for name in output.variables(lang):
+                if name not in dicts:
+                    raise KeyError(f"{script.path}: 辞書 {name} が見つかりません")
+                merged.update(dicts[name])
+            rendered[(output.stem, lang)] = merged
+    return rendered
+
+
+def outputs(include_superseded: bool = False) -> list[Output]:
+    """ロケールへのマージ順（後勝ち）に出力定義を返す"""
+    return [
+        output
+        for script in SCRIPTS
+        for output in script.outputs
+        if include_superseded or not output.superseded
+    ]
+
@@ -0,0 +1,67 @@
+"""
+ロケールカタログをトップレベルの名前空間ごとのファイルに分割する
+
+client/src/locales/{lang}/{namespace}.json を出力し、i18n.ts はルートが
+必要とする名前空間だけを遅延読み込みする。初回描画に必要な名前空間は
+ロケールごとに client/src/locales/core/{lang}.json にまとめる。
+各ファイルはメッセージとコンパイル済みの補間テンプレートの組（compile.py）。
+本番用の形式（minify.py）はここでは書かず、artifacts.py が追跡対象外のディレクトリに書き出す。
+"""
+
+from pathlib import Path
+
+from .output import write_if_changed
+from .compile import compile_chunk
+from .merge import LOCALES_DIR
+from .trace import span
+
+# client/src/i18n.ts の CORE_NAMESPACES と揃えること
+CORE_NAMESPACES = ("app", "header", "common", "home")
+
+
+def split_locales(
+    root: Path,
+    trees: dict[str, dict],
+    locales_dir: Path = LOCALES_DIR,
+    namespaces: set[str] | None = None,
+) -> list[str]:
+    """名前空間ファイルとロケールごとのコアバンドルを書き出し、更新したファイルのパスを返す
+
+    locales_dir を変えるとバリアント用の出力先（build/catalogs/<name> など）に書き出せる。
+    namespaces を渡すとその名前空間（とそれを含むコアバンドル）だけを書き出す（watch 用）。
+    """
+    written = []
+    core_dir = root / locales_dir / "core"
+    core_dir.mkdir(parents=True, exist_ok=True)
+    for lang, tree in trees.items():
+        directory = root / locales_dir / lang
+        directory.mkdir(exist_ok=True)
+
+        for namespace, catalog in tree.items():
+            if namespaces is None or namespace in namespaces:
+                with span("compile", namespace=namespace):
+                    chunk = compile_chunk(catalog, f"{namespace}.")
+                written += write_if_changed(root, directory / f"{namespace}.json", chunk)
+
+        if namespaces is None or namespaces & set(CORE_NAMESPACES):
+            core = {namespace: tree[namespace] for namespace in CORE_NAMESPACES if namespace in tree}
+            written += write_if_changed(root, core_dir / f"{lang}.json", compile_chunk(core))
+
+        # ロケールから消えた名前空間のファイルを削除
+        for path in directory.glob("*.json"):
+            if path.stem not in tree and (namespaces is None or path.stem in namespaces):
+                path.unlink()
+                written.append(str(path.relative_to(root)))
+
+    # 消えた言語のコアバンドルと名前空間ファイルを削除（言語の一覧は全体の書き出しでだけ変わる）
+    if namespaces is None:
+        for core_path in core_dir.glob("*.json"):
+            if core_path.stem in trees:
+                continue
+            directory = root / locales_dir / core_path.stem
+            for path in [core_path, *directory.glob("*.json")]:
+                path.unlink()
+                written.append(str(path.relative_to(root)))
+            if directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
+    return written
@@ -0,0 +1,146 @@
+"""
+ビルドの段階ごとのトレースとメモリ計測
+
+各段階を span("merge") のように囲み、--profile を付けたときだけ記録する。記録した
+スパンは Chrome のトレースイベント形式（chrome://tracing や Perfetto で開ける）で
+書き出す。--profile-memory では tracemalloc を有効にし、段階ごとに割り当ての多い
+箇所を報告する。記録していないときの span() は使い回しの nullcontext を返すだけ。
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+
+TRACE_FILE = "catalog_trace.json"
+# tracemalloc のスナップショットを取る深さ（ファイル単位の serialize / write などは対象外）
+MEMORY_DEPTH = 2
+TOP_ALLOCATIONS = 5
+
+_NULL = nullcontext()
+_tracer: "Tracer | None" = None
+
+
+@dataclass(frozen=True)
+class Allocation:
+    site: str
+    size: int
+    count: int
+
+
+@dataclass
+class Span:
+    name: str
+    start: int
+    duration: int
+    depth: int
+    thread: int
+    args: dict = field(default_factory=dict)
+    allocations: list[Allocation] = field(default_factory=list)
+
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    """計測自身（tracemalloc とこのモジュール）の割り当てを除いたスナップショット"""
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+
+
+class Tracer:
+    def __init__(self, memory: bool = False, top: int = TOP_ALLOCATIONS) -> None:
+        self.memory = memory
+        self.top = top
+        self.spans: list[Span] = []
+        self.origin = time.perf_counter_ns()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, args: dict):
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        snapshot = self.memory and depth < MEMORY_DEPTH
+        before = take_snapshot() if snapshot else None
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - start
+            allocations = self.allocations(before) if snapshot else []
+            self._local.depth = depth
+            span = Span(name, start - self.origin, duration, depth, threading.get_native_id(), args, allocations)
+            with self._lock:
+                self.spans.append(span)
+
+    def allocations(self, before: tracemalloc.Snapshot) -> list[Allocation]:
+        """スパンの間に増えた割り当てを、割り当てた行ごとに多い順で返す"""
+        diffs = take_snapshot().compare_to(before, "lineno")
+        return [
+            Allocation(str(diff.traceback[0]), diff.size_diff, diff.count_diff)
+            for diff in diffs[: self.top]
+            if diff.size_diff > 0
+        ]
+
+    def trace_events(self) -> dict:
+        """Chrome のトレースイベント形式（完了イベント "X"、時間はマイクロ秒）"""
+        pid = os.getpid()
+        events = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            args = dict(span.args)
+            if span.allocations:
+                args["allocations"] = [
+                    f"{allocation.size / 1024:+.1f} KiB ({allocation.count:+d}) {allocation.site}"
+                    for allocation in span.allocations
+                ]
+            events.append({
+                "name": span.name,
+                "cat": "build",
+                "ph": "X",
+                "ts": span.start / 1000,
+                "dur": span.duration / 1000,
+                "pid": pid,
+                "tid": span.thread,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path: Path) -> None:
+        # output.py もスパンを使うので、循環 import を避けて直接書き込む
+        path.write_text(json.dumps(self.trace_events(), ensure_ascii=False), encoding="utf-8")
+
+    def summary(self) -> list[tuple[str, int, int]]:
+        """スパン名ごとの (名前, 回数, 合計ナノ秒)。合計の大きい順"""
+        totals: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        for span in self.spans:
+            totals[span.name][0] += 1
+            totals[span.name][1] += span.duration
+        return sorted(((name, count, total) for name, (count, total) in totals.items()), key=lambda row: -row[2])
+
+
+def span(name: str, **args):
+    """段階を囲むコンテキストマネージャ。トレース中でなければ何もしない"""
+    if _tracer is None:
+        return _NULL
+    return _tracer.span(name, args)
+
+
+def start(memory: bool = False, top: int = TOP_ALLOCATIONS) -> Tracer:
+    global _tracer
+    if memory:
+        tracemalloc.start()
+    _tracer = Tracer(memory, top)
+    return _tracer
+
+
+def stop() -> Tracer | None:
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer and tracer.memory:
+        tracemalloc.stop()
+    return tracer
@@ -0,0 +1,163 @@
+"""
+client/src の翻訳キー使用箇所の抽出と、永続化した使用箇所インデックス
+
+t('…') / i18n.t('…') / i18nKey="…" を拾い、テンプレートリテラルの ${…} は
+ワイルドカード（announcement.feature*.title）として記録する。
+インデックスはファイルごとの mtime とサイズで管理し、変更のあったファイルだけを
+再スキャンする。変更ファイルが多いときはプロセスプールで並列にスキャンする。
+"""
+
+import bisect
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .output import atomic_write
+
+SOURCE_DIR = Path("client/src")
+SOURCE_SUFFIXES = (".ts", ".tsx")
+INDEX_FILE = ".i18n_usage_index.json"
+INDEX_VERSION = 1
+
+# これ以下の変更ファイル数ならプロセスを起動せずにその場でスキャンする
+PARALLEL_THRESHOLD = 16
+
+STRING = r"""(?:'((?:\\.|[^'\\\n])*)'|"((?:\\.|[^"\\\n])*)"|`((?:\\.|[^`\\])*)`)"""
+CALL = re.compile(r"(?:(?<![\w$.])i18n\.|(?<![\w$.]))t\(\s*" + STRING)
+I18N_KEY = re.compile(r"\bi18nKey=\{?\s*" + STRING)
+INTERPOLATION = re.compile(r"\$\{[^}]*\}")
+KEY = re.compile(r"^[A-Za-z0-9_*]+(?:\.[A-Za-z0-9_*]+)*$")
+
+
+@dataclass(frozen=True)
+class Usage:
+    key: str
+    line: int
+    dynamic: bool = False
+
+
+def scan_source(text: str) -> list[Usage]:
+    newlines = [i for i, char in enumerate(text) if char == "\n"]
+    usages = []
+    for pattern in (CALL, I18N_KEY):
+        for match in pattern.finditer(text):
+            single, double, template = match.groups()
+            key = single if single is not None else double
+            dynamic = False
+            if key is None:
+                key, count = INTERPOLATION.subn("*", template)
+                dynamic = count > 0
+            if not KEY.match(key):
+                continue
+            line = bisect.bisect_left(newlines, match.start()) + 1
+            usages.append(Usage(key, line, dynamic))
+    usages.sort(key=lambda usage: usage.line)
+    return usages
+
+
+def scan_file(path: str) -> list[Usage]:
+    with open(path, encoding="utf-8") as f:
+        return scan_source(f.read())
+
+
+def scan_files(paths: list[str], jobs: int | None = None) -> list[list[Usage]]:
+    if len(paths) <= PARALLEL_THRESHOLD or jobs == 1:
+        return [scan_file(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(scan_file, paths, chunksize=4))
+
+
+def source_files(root: Path) -> dict[str, os.stat_result]:
+    files = {}
+    for directory, _, names in os.walk(root / SOURCE_DIR):
+        for name in names:
+            if name.endswith(SOURCE_SUFFIXES):
+                path = os.path.join(directory, name)
+                files[os.path.relpath(path, root)] = os.stat(path)
+    return files
+
+
+def pattern_regex(pattern: str) -> re.Pattern:
+    return re.compile("^" + ".+".join(map(re.escape, pattern.split("*"))) + "$")
+
+
+@dataclass
+class UpdateStats:
+    scanned: int = 0
+    reused: int = 0
+    removed: int = 0
+
+
+@dataclass
+class UsageIndex:
+    # 相対パス → {"mtime_ns", "size", "usages": [[key, line, dynamic], ...]}
+    files: dict[str, dict] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, root: Path) -> "UsageIndex":
+        try:
+            data = json.loads((root / INDEX_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        if data.get("version") != INDEX_VERSION:
+            return cls()
+        return cls(data["files"])
+
+    def save(self, root: Path) -> None:
+        data = {"version": INDEX_VERSION, "files": self.files}
+        atomic_write(root / INDEX_FILE, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+    def update(self, root: Path, jobs: int | None = None, full: bool = False) -> UpdateStats:
+        """変更・追加されたファイルだけを再スキャンし、削除されたファイルを取り除く"""
+        stats = UpdateStats()
+        current = source_files(root)
+        for path in self.files.keys() - current.keys():
+            del self.files[path]
+            stats.removed += 1
+
+        changed = []
+        for path, stat in current.items():
+            entry = self.files.get(path)
+            if not full and entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                stats.reused += 1
+            else:
+                changed.append(path)
+
+        for path, usages in zip(changed, scan_files([str(root / path) for path in changed], jobs)):
+            stat = current[path]
+            self.files[path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "usages": [[usage.key, usage.line, usage.dynamic] for usage in usages],
+            }
+        stats.scanned = len(changed)
+        return stats
+
+    def references(self) -> dict[str, list[tuple[str, int]]]:
+        """静的なキー → [(ファイル, 行)]"""
+        found: dict[str, list[tuple[str, int]]] = {}
+        for path, entry in sorted(self.files.items()):
+            for key, line, dynamic in entry["usages"]:
+                if not dynamic:
+                    found.setdefault(key, []).append((path, line))
+        return found
+
+    def dynamic_patterns(self) -> dict[str, list[tuple[str, int]]]:
+        """動的なキーのパターン（announcement.feature*.title など）→ [(ファイル, 行)]"""
+        found: dict[str, list[tuple[str, int]]] = {}
+        for path, entry in sorted(self.files.items()):
+            for key, line, dynamic in entry["usages"]:
+                if dynamic:
+                    found.setdefault(key, []).append((path, line))
+        return found
+
+    def lookup(self, key: str) -> list[tuple[str, int]]:
+        """キーを参照している箇所（動的パターンに一致するものを含む）"""
+        locations = list(self.references().get(key, []))
+        for pattern, pattern_locations in self.dynamic_patterns().items():
+            if pattern_regex(pattern).match(key):
+                locations += pattern_locations
+        return locations
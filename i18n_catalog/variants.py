@@ -0,0 +1,120 @@
+"""
+ホワイトラベル向けのバリアントビルド
+
+catalog_variants.json にブランドごとの定数（APP_TITLE など）とキー単位の
+上書き（Manus ログインの文言、フッターの表記など）を定義する。ソース辞書の
+読み込み・マージ・フォールバック解決は1回だけ行い、その結果を共有したまま
+プロセスプールで全バリアントを並列に描画する。
+
+{
+  "variants": {
+    "acme": {
+      "constants": {"APP_TITLE": "Acme Resume"},
+      "overrides": {"favorites.loginDescription": {"ja": "...", "en": "..."}}
+    }
+  }
+}
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .artifacts import emit_artifacts
+from .constants import fold
+from .placeholders import normalize
+from .split import split_locales
+
+VARIANTS_FILE = "catalog_variants.json"
+VARIANTS_DIR = Path("build/catalogs")
+
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    constants: dict[str, str] = field(default_factory=dict)
+    # ドット区切りキー → {言語: 文字列}
+    overrides: dict[str, dict[str, str]] = field(default_factory=dict)
+
+
+def load_variants(root: Path) -> list[Variant]:
+    try:
+        config = json.loads((root / VARIANTS_FILE).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+    return [
+        Variant(name, spec.get("constants", {}), spec.get("overrides", {}))
+        for name, spec in config.get("variants", {}).items()
+    ]
+
+
+def find_variant(root: Path, name: str) -> Variant:
+    for variant in load_variants(root):
+        if variant.name == name:
+            return variant
+    raise KeyError(f"{VARIANTS_FILE} にバリアント {name} がありません")
+
+
+def apply_overrides(tree: dict, overrides: dict[str, str]) -> dict:
+    """上書きするキーの経路だけを複製した新しいツリーを返す（元のツリーは共有のまま）"""
+    if not overrides:
+        return tree
+    tree = dict(tree)
+    for key, value in overrides.items():
+        *parents, leaf = key.split(".")
+        node = tree
+        for part in parents:
+            child = node.get(part)
+            node[part] = dict(child) if isinstance(child, dict) else {}
+            node = node[part]
+        node[leaf] = normalize(value)
+    return tree
+
+
+def render(trees: dict[str, dict], variant: Variant, constants: dict[str, str]) -> dict[str, dict]:
+    constants = {**constants, **variant.constants}
+    rendered = {}
+    for lang, tree in trees.items():
+        overrides = {
+            key: values[lang] for key, values in variant.overrides.items() if lang in values
+        }
+        rendered[lang] = fold(apply_overrides(tree, overrides), constants)
+    return rendered
+
+
+# ワーカープロセスが共有するマージ済みツリー（initializer で1回だけ受け取る）
+_shared: dict = {}
+
+
+def _init_worker(root: Path, trees: dict[str, dict], constants: dict[str, str], production: bool) -> None:
+    _shared.update(root=root, trees=trees, constants=constants, production=production)
+
+
+def _render_worker(variant: Variant) -> tuple[str, list[str]]:
+    rendered = render(_shared["trees"], variant, _shared["constants"])
+    directory = VARIANTS_DIR / variant.name
+    # 本番用はハッシュ付きの成果物とマニフェスト（client/public/locales と同じ構成）
+    if _shared["production"]:
+        return variant.name, emit_artifacts(_shared["root"], rendered, directory)
+    return variant.name, split_locales(_shared["root"], rendered, directory)
+
+
+def render_variants(
+    root: Path,
+    trees: dict[str, dict],
+    variants: list[Variant],
+    constants: dict[str, str],
+    jobs: int | None = None,
+    production: bool = False,
+) -> dict[str, list[str]]:
+    """全バリアントを build/catalogs/<name>/ に並列で書き出す（production では成果物とマニフェスト）"""
+    jobs = jobs or min(len(variants), os.cpu_count() or 1)
+    if jobs <= 1:
+        _init_worker(root, trees, constants, production)
+        return dict(map(_render_worker, variants))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(root, trees, constants, production)
+    ) as pool:
+        return dict(pool.map(_render_worker, variants))
@@ -0,0 +1,313 @@
+"""
+watch モード
+
+translate_*.py、ベースカタログ（catalog_base/{lang}.json）、client/src の TSX などを inotify で監視する。
+パース済みの辞書と使用箇所インデックスはメモリに保持し、読み直すのは変更されたファイル
+だけにする。マージは全体をやり直す（ja.json / en.json を書き出すため。数ミリ秒で終わる）が、
+その後の段階（プレースホルダー検証・機械翻訳・フォールバック・除去・定数の畳み込み）は
+マージ結果の変わった名前空間だけを計算し直す。使用箇所・定数・許可リスト・機械翻訳の
+結果が変わったときは全名前空間が対象になる。内容が変わった名前空間のファイル
+（とそれを含むコアバンドル）だけを書き出す。
+エディタやフォーマッタによる連続した保存は debounce してまとめて1回で処理する。
+inotify が使えない環境では mtime のポーリングで代用する。
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+from .constants import ENV_FILES, load_constants
+from .fallback import resolve_fallbacks
+from .merge import BASE_DIR, LOCALES_DIR, Layer, base_path, load_catalog, locale_path, merge_layers
+from .mt import apply_translations
+from .output import serialize, write_bytes_if_changed, write_if_changed
+from .placeholders import normalize_tree, verify
+from .prune import prune
+from .sources import LANGS, SCRIPTS, Script, outputs, render
+from .split import split_locales
+from .usage import SOURCE_DIR, SOURCE_SUFFIXES, UsageIndex
+from .variants import VARIANTS_DIR, Variant
+from .variants import render as render_variant
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT = struct.Struct("iIII")
+
+# 自分が書き出す名前空間ファイルのディレクトリは監視しない
+OUTPUT_DIRS = tuple(LOCALES_DIR / name for name in (*LANGS, "core"))
+
+
+def watched_directories(root: Path) -> list[Path]:
+    directories = [root, root / BASE_DIR, root / "catalog_mt"]
+    for directory, names, _ in os.walk(root / SOURCE_DIR):
+        path = Path(directory)
+        names[:] = [name for name in names if path.relative_to(root) / name not in OUTPUT_DIRS]
+        directories.append(path)
+    return [directory for directory in directories if directory.is_dir()]
+
+
+class InotifyWatcher:
+    def __init__(self, root: Path):
+        self.root = root
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 に失敗しました")
+        self.directories: dict[int, Path] = {}
+        for directory in watched_directories(root):
+            self.add(directory)
+
+    def add(self, directory: Path) -> None:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self.directories[wd] = directory
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        """変更されたファイルのパス（timeout 秒以内に何も無ければ空）"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT.unpack_from(data, offset)
+            name = data[offset + EVENT.size:offset + EVENT.size + length].rstrip(b"\0")
+            offset += EVENT.size + length
+            directory = self.directories.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                # 新しく作られた client/src 配下のディレクトリも監視する
+                if mask & (IN_CREATE | IN_MOVED_TO) and path.is_relative_to(self.root / SOURCE_DIR):
+                    if path.relative_to(self.root) not in OUTPUT_DIRS:
+                        self.add(path)
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """inotify が無い環境用: 監視ディレクトリのファイルの mtime を定期的に比べる"""
+
+    def __init__(self, root: Path, interval: float = 0.1):
+        self.root = root
+        self.interval = interval
+        self.stats = self.snapshot()
+
+    def snapshot(self) -> dict[Path, tuple[int, int]]:
+        stats = {}
+        for directory in watched_directories(self.root):
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    stat = entry.stat()
+                    stats[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+        stats = self.snapshot()
+        changed = {path for path in stats.keys() | self.stats.keys() if stats.get(path) != self.stats.get(path)}
+        self.stats = stats
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(root: Path):
+    try:
+        return InotifyWatcher(root)
+    except (OSError, AttributeError):
+        return PollingWatcher(root)
+
+
+class CatalogWatch:
+    """ビルドの途中結果をメモリに保持し、変更のあった入力と名前空間だけを計算し直す"""
+
+    def __init__(self, root: Path, variant: Variant | None = None):
+        self.root = root
+        self.variant = variant or Variant("default")
+        # バリアントは build --variant と同じく追跡対象外のディレクトリに書き出す
+        self.locales_dir = VARIANTS_DIR / variant.name if variant else LOCALES_DIR
+        self.scripts = {script.path: script for script in SCRIPTS}
+        self.rendered: dict[tuple[str, str], dict] = {}
+        for script in SCRIPTS:
+            self.load_script(script)
+        self.base = {lang: load_catalog(base_path(root, lang)) for lang in LANGS}
+        self.index = UsageIndex.load(root)
+        self.index.update(root)
+        self.index.save(root)
+        self.constants = self.load_constants()
+        # 前回書き出したときのマージ結果と、配信したツリー
+        self.merged: dict[str, dict] = {}
+        self.shipped: dict[str, dict] = {}
+        # 自分で書き込んだファイルの (mtime, サイズ)。その書き込みによるイベントは無視する
+        self.own: dict[Path, tuple[int, int]] = {}
+
+    def load_constants(self) -> dict[str, str]:
+        """環境変数の定数はバリアントにだけ畳み込む（client/src/locales は環境に依存させない）"""
+        return load_constants(self.root) if self.locales_dir != LOCALES_DIR else {}
+
+    def remember(self, written: list[str]) -> list[str]:
+        for name in written:
+            path = self.root / name
+            if path.exists():
+                stat = path.stat()
+                self.own[path] = (stat.st_mtime_ns, stat.st_size)
+        return written
+
+    def is_own(self, path: Path) -> bool:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+        return self.own.get(path) == (stat.st_mtime_ns, stat.st_size)
+
+    def load_script(self, script: Script) -> list[str]:
+        written = []
+        source = (self.root / script.path).read_text(encoding="utf-8")
+        for (stem, lang), catalog in render(script, source).items():
+            name = f"{stem}_{lang}.json"
+            if write_bytes_if_changed(self.root / name, serialize(catalog)):
+                written.append(name)
+            self.rendered[(stem, lang)] = normalize_tree(catalog)
+        return written
+
+    def layers(self, lang: str) -> list[Layer]:
+        layers = [Layer(str(BASE_DIR / f"{lang}.json"), self.base[lang])]
+        for output in outputs():
+            layers.append(Layer(output.filename(lang), self.rendered[(output.stem, lang)], output.mount))
+        return layers
+
+    def merge(self) -> tuple[dict[str, dict], list[str]]:
+        written = []
+        merged = {}
+        for lang in LANGS:
+            merged[lang], _ = merge_layers(self.layers(lang))
+            written += write_if_changed(self.root, locale_path(self.root, lang), merged[lang])
+        return merged, written
+
+    def compute(self, merged: dict[str, dict]) -> dict[str, dict] | None:
+        """マージ結果から定数の畳み込みまで（build と同じ順序）。プレースホルダーの不一致があれば None"""
+        mismatches = verify(merged["ja"], merged["en"])
+        if mismatches:
+            for mismatch in mismatches:
+                print(f"プレースホルダーの不一致: {mismatch.describe()}")
+            return None
+        trees, _ = apply_translations(self.root, merged)
+        trees = prune(self.root, resolve_fallbacks(trees).trees, self.index).trees
+        return render_variant(trees, self.variant, self.constants)
+
+    def rebuild(self) -> list[str]:
+        """全名前空間を書き出す（起動時）"""
+        merged, written = self.merge()
+        trees = self.compute(merged)
+        if trees is None:
+            return written
+        self.merged, self.shipped = merged, trees
+        return self.remember(written + split_locales(self.root, trees, self.locales_dir))
+
+    def affected(self, merged: dict[str, dict]) -> set[str]:
+        """前回書き出したときからマージ結果の変わった名前空間"""
+        return {
+            namespace
+            for lang in merged
+            for namespace in merged[lang].keys() | self.merged.get(lang, {}).keys()
+            if merged[lang].get(namespace) != self.merged.get(lang, {}).get(namespace)
+        }
+
+    def update(self, changed: set[Path]) -> list[str] | None:
+        """変更されたファイルを反映する。関係のない変更だけなら None"""
+        relevant = False
+        # 全名前空間に影響する変更（使用箇所・定数・許可リスト・機械翻訳の結果）
+        everything = False
+        written: list[str] = []
+        sources_changed = False
+        for path in changed:
+            if self.is_own(path):
+                continue
+            try:
+                relative = path.relative_to(self.root)
+            except ValueError:
+                continue
+            name = str(relative)
+            if name in self.scripts:
+                written += self.load_script(self.scripts[name])
+            elif relative.parent == BASE_DIR and relative.stem in LANGS and relative.suffix == ".json":
+                self.base[relative.stem] = load_catalog(path)
+            elif relative.is_relative_to(SOURCE_DIR) and relative.suffix in SOURCE_SUFFIXES:
+                sources_changed = everything = True
+            elif name in ENV_FILES:
+                self.constants = self.load_constants()
+                everything = True
+            elif name in ("catalog_keep.json", "catalog_mt/en.json"):
+                everything = True
+            else:
+                continue
+            relevant = True
+        if not relevant:
+            return None
+        if sources_changed:
+            self.index.update(self.root)
+            self.index.save(self.root)
+
+        merged, merged_written = self.merge()
+        written += merged_written
+        namespaces = set().union(*(tree.keys() for tree in merged.values())) if everything else self.affected(merged)
+        if not namespaces:
+            return self.remember(written)
+        subset = {lang: {ns: tree[ns] for ns in namespaces if ns in tree} for lang, tree in merged.items()}
+        computed = self.compute(subset)
+        if computed is None:
+            return self.remember(written)
+        trees = {}
+        for lang, tree in computed.items():
+            kept = {ns: value for ns, value in self.shipped.get(lang, {}).items() if ns not in namespaces}
+            trees[lang] = {**kept, **tree}
+        changed_namespaces = {
+            namespace
+            for namespace in namespaces
+            if any(trees[lang].get(namespace) != self.shipped.get(lang, {}).get(namespace) for lang in trees)
+        }
+        if changed_namespaces:
+            written += split_locales(self.root, trees, self.locales_dir, changed_namespaces)
+        self.merged, self.shipped = merged, trees
+        return self.remember(written)
+
+
+def watch(root: Path, debounce: float = 0.05, variant: Variant | None = None):
+    """変更のたびに (変更されたファイル, 書き込んだファイル, 最初の変更からの経過秒) を返すジェネレーター"""
+    state = CatalogWatch(root, variant)
+    yield set(), state.rebuild(), 0.0
+    watcher = make_watcher(root)
+    try:
+        while True:
+            changed = watcher.wait(None)
+            if not changed:
+                continue
+            started = time.perf_counter()
+            # 連続した保存が落ち着くまで待ってまとめる
+            while more := watcher.wait(debounce):
+                changed |= more
+            written = state.update(changed)
+            if written is not None:
+                yield changed, written, time.perf_counter() - started
+    finally:
+        watcher.close()
@@ -58,6 +58,7 @@ export function serveStatic(app: Express) {
     );
   }
 
+  serveCatalogs(app, path.join(distPath, "locales"));
   app.use(express.static(distPath));
 
   // fall through to index.html if the file doesn't exist
@@ -65,3 +66,30 @@ export function serveStatic(app: Express) {
     res.sendFile(path.resolve(distPath, "index.html"));
   });
 }
+
+// Hashed catalog files written by `build_catalogs.py build --production`,
+// e.g. ja/guide.3f9a0c1b2d.json
+const HASHED_CATALOG = /^\/[\w-]+\/[\w-]+\.[0-9a-f]{10}\.json$/;
+
+// Catalog artifacts never change under the same URL, so they are cached for a
+// year and served from their precompressed .gz sibling when the client accepts
+// gzip. The manifest that points at them is revalidated on every load.
+function serveCatalogs(app: Express, localesPath: string) {
+  app.use("/locales", (req, res, next) => {
+    if (req.path === "/manifest.json") {
+      res.setHeader("Cache-Control", "no-cache");
+      return next();
+    }
+    if (!HASHED_CATALOG.test(req.path)) return next();
+
+    res.setHeader("Cache-Control", "public, max-age=31536000, immutable");
+    res.setHeader("Vary", "Accept-Encoding");
+    const compressed = `${req.path.slice(1)}.gz`;
+    if (!req.acceptsEncodings("gzip") || !fs.existsSync(path.join(localesPath, compressed))) {
+      return next();
+    }
+    res.setHeader("Content-Encoding", "gzip");
+    res.setHeader("Content-Type", "application/json; charset=utf-8");
+    res.sendFile(compressed, { root: localesPath }, error => error && next(error));
+  });
+}
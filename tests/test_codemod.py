@@ -0,0 +1,151 @@
+"""コードモッド（codemod.py）の書き換え結果"""
+
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from i18n_catalog.budget import BUDGET_FILE
+from i18n_catalog.codemod import register_namespaces, rewrite
+from i18n_catalog.literals import KeyIndex
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGE = "client/src/pages/Settings.tsx"
+
+
+def test_adds_import_and_hook():
+    source = '''import { useState } from "react";
+
+export default function Settings() {
+  const [name, setName] = useState("");
+  return <h1>設定</h1>;
+}
+'''
+    edit = rewrite(PAGE, source, KeyIndex({}))
+    assert edit.rewritten == '''import { useState } from "react";
+import { useTranslation } from "react-i18next";
+
+export default function Settings() {
+  const { t } = useTranslation();
+  const [name, setName] = useState("");
+  return <h1>{t('settings.title')}</h1>;
+}
+'''
+    assert [proposal.key for proposal in edit.applied] == ["settings.title"]
+
+
+def test_adds_t_to_existing_hook_and_reuses_core_keys():
+    source = '''import { useTranslation } from "react-i18next";
+
+export default function Settings() {
+  const { i18n } = useTranslation();
+  return <button>保存</button>;
+}
+'''
+    edit = rewrite(PAGE, source, KeyIndex({"common": {"save": "保存"}}))
+    assert "const { t, i18n } = useTranslation();" in edit.rewritten
+    assert edit.rewritten.count("import { useTranslation }") == 1
+    assert "<button>{t('common.save')}</button>" in edit.rewritten
+    assert edit.applied[0].existing
+
+
+def test_keeps_existing_t():
+    source = '''import { useTranslation } from "react-i18next";
+
+export default function Settings() {
+  const { t, i18n } = useTranslation();
+  return <p>{t('settings.title')}と説明</p>;
+}
+'''
+    edit = rewrite(PAGE, source, KeyIndex({}))
+    assert edit.rewritten.count("useTranslation()") == 1
+    assert "const { t, i18n } = useTranslation();" in edit.rewritten
+
+
+def test_interpolated_values():
+    source = '''export default function Greeting({ user, count }: Props) {
+  return <p>{`${user.name}さん、${count}件あります`}</p>;
+}
+'''
+    edit = rewrite("client/src/components/Greeting.tsx", source, KeyIndex({}))
+    [proposal] = edit.applied
+    assert proposal.literal.text == "{{name}}さん、{{count}}件あります"
+    assert f"<p>{{t('{proposal.key}', {{ name: user.name, count }})}}</p>" in edit.rewritten
+
+
+def test_does_not_reuse_keys_of_other_pages():
+    source = '''export default function Settings() {
+  return <h1>お気に入り</h1>;
+}
+'''
+    edit = rewrite(PAGE, source, KeyIndex({"favorites": {"title": "お気に入り"}}))
+    [proposal] = edit.applied
+    assert not proposal.existing
+    assert proposal.key.startswith("settings.")
+
+
+def test_literals_outside_components_are_skipped():
+    source = '''const LABEL = "設定";
+
+export default function Settings() {
+  return <h1>{LABEL}</h1>;
+}
+'''
+    edit = rewrite(PAGE, source, KeyIndex({}))
+    assert edit.rewritten == source
+    assert [literal.text for literal in edit.skipped] == ["設定"]
+
+
+def test_register_namespaces():
+    source = '''export const ROUTE_NAMESPACES: Record<string, string[]> = {
+  '/': [
+    'footer',
+  ],
+  '/guide': ['guide'],
+};
+'''
+    registered = register_namespaces(source, {"/": ["toast"], "/guide": ["toast"], "/settings": ["settings"]})
+    assert registered == '''export const ROUTE_NAMESPACES: Record<string, string[]> = {
+  '/': [
+    'footer',
+    'toast',
+  ],
+  '/guide': ['guide', 'toast'],
+  '/settings': ['settings'],
+};
+'''
+
+
+def test_codemod_then_build_stays_within_budget(tmp_path):
+    root = tmp_path / "repo"
+    shutil.copytree(ROOT, root, ignore=shutil.ignore_patterns(
+        ".git", "node_modules", "__pycache__", "Downloads", "pr_images", "marketing", "build", "catalog_drafts",
+    ))
+
+    def run(*args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "build_catalogs.py", *args], cwd=root, capture_output=True, text=True, encoding="utf-8"
+        )
+
+    assert run().returncode == 0
+    budgets = json.loads((root / BUDGET_FILE).read_text(encoding="utf-8"))["budgets"]
+    codemod = run("codemod", "client/src/pages/Favorites.tsx")
+    assert codemod.returncode == 0, codemod.stdout
+
+    # 案内された手順（build → budget --update <名前空間> → build）で予算に収まる
+    namespaces = re.search(r"budget --update ([\w ]+)\n", codemod.stdout).group(1).split()
+    assert namespaces == ["favorites"]
+    build = run()
+    if build.returncode:
+        assert f"budget --update {' '.join(namespaces)}" in build.stdout
+    assert run("budget", "--update", *namespaces).returncode == 0
+    build = run()
+    assert build.returncode == 0, build.stdout
+
+    # 他の名前空間の予算は変わらない
+    updated = json.loads((root / BUDGET_FILE).read_text(encoding="utf-8"))["budgets"]
+    assert {chunk: limits for chunk, limits in updated.items() if not chunk.endswith("/favorites")} == {
+        chunk: limits for chunk, limits in budgets.items() if not chunk.endswith("/favorites")
+    }
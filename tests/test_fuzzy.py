@@ -0,0 +1,72 @@
+"""翻訳メモリのあいまい検索（fuzzy.py）"""
+
+import random
+
+import pytest
+
+from i18n_catalog.fuzzy import FuzzyIndex, build_index, grams, human_translations
+from i18n_catalog.memory import Entry, TranslationMemory
+
+SOURCES = {
+    "ログインが必要です": "Login required",
+    "ログインが必要になります": "You will need to log in",
+    "保存に失敗しました": "Failed to save",
+    "削除に失敗しました": "Failed to delete",
+    "読み込みに失敗しました": "Failed to load",
+    "お気に入りに追加": "Add to favorites",
+}
+
+
+@pytest.fixture
+def index():
+    found = FuzzyIndex()
+    for source, target in SOURCES.items():
+        found.add(source, target)
+    return found
+
+
+def jaccard(a: str, b: str) -> float:
+    x, y = grams(a), grams(b)
+    return len(x & y) / len(x | y)
+
+
+def test_exact_match_comes_first(index):
+    [first, *rest] = index.search("ログインが必要です", threshold=0.4)
+    assert (first.score, first.target) == (1.0, "Login required")
+    assert [match.source for match in rest] == ["ログインが必要になります"]
+
+
+def test_results_are_limited_to_top_k_by_score(index):
+    matches = index.search("更新に失敗しました", k=2, threshold=0.3)
+    assert len(matches) == 2
+    assert [match.score for match in matches] == sorted((match.score for match in matches), reverse=True)
+    assert {match.source for match in matches} <= {"保存に失敗しました", "削除に失敗しました", "読み込みに失敗しました"}
+
+
+def test_threshold_drops_weak_matches(index):
+    assert [match.source for match in index.search("ログインが必要です", threshold=0.9)] == ["ログインが必要です"]
+    assert index.search("設定を開く", threshold=0.1) == []
+    assert index.search("") == []
+
+
+@pytest.mark.parametrize("threshold", [0.2, 0.4, 0.6, 0.8])
+def test_prefix_filter_finds_the_same_matches_as_a_full_scan(threshold):
+    rng = random.Random(threshold)
+    alphabet = "保存削除失敗しましたログイン必要です"
+    sources = {"".join(rng.choices(alphabet, k=rng.randint(2, 12))) for _ in range(300)}
+    index = FuzzyIndex()
+    for source in sources:
+        index.add(source, source)
+    for query in list(sources)[:30]:
+        expected = {source for source in sources if jaccard(query, source) >= threshold}
+        assert {match.source for match in index.search(query, k=len(sources), threshold=threshold)} == expected
+
+
+def test_human_translations_override_the_memory():
+    memory = TranslationMemory()
+    memory.add(Entry("保存に失敗しました", "toast", "en:v1", "Saving failed"))
+    memory.add(Entry("削除に失敗しました", "toast", "fr:v1", "Échec de la suppression"))
+    human = human_translations({"toast": {"saveFailed": "保存に失敗しました"}}, {"toast": {"saveFailed": "Failed to save"}})
+    index = build_index(memory, human, "en")
+    assert len(index) == 1
+    assert index.search("保存に失敗しました")[0].target == "Failed to save"
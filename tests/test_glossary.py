@@ -0,0 +1,72 @@
+"""用語集の訳語チェック（glossary.py）"""
+
+import json
+import random
+
+import pytest
+
+from i18n_catalog.glossary import GLOSSARY_FILE, Automaton, Glossary, check, outermost
+
+
+def naive(words: list[str], text: str) -> list[tuple[int, int, int]]:
+    return sorted(
+        (start, start + len(word), id)
+        for id, word in enumerate(words)
+        for start in range(len(text) - len(word) + 1)
+        if text.startswith(word, start)
+    )
+
+
+def test_finds_overlapping_and_nested_words():
+    words = ["テンプレート", "マイテンプレート", "プレー", "he", "she", "hers"]
+    text = "マイテンプレートとテンプレート ushers"
+    assert sorted(Automaton(words).find(text)) == naive(words, text)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_a_naive_search(seed):
+    rng = random.Random(seed)
+    words = list({"".join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(15)})
+    text = "".join(rng.choices("abc", k=200))
+    assert sorted(Automaton(words).find(text)) == naive(words, text)
+
+
+def test_outermost_drops_terms_inside_longer_terms():
+    words = ["テンプレート", "マイテンプレート", "プロンプト"]
+    text = "マイテンプレートのプロンプトとテンプレート"
+    kept = outermost(Automaton(words).find(text))
+    assert [words[id] for _, _, id in kept] == ["マイテンプレート", "プロンプト", "テンプレート"]
+
+
+GLOSSARY = Glossary(
+    {
+        "テンプレート": {"en": ("Template",)},
+        "マイテンプレート": {"en": ("My Templates",)},
+        "職務経歴書": {"en": ("Resume", "CV"), "zh": ("简历",)},
+    },
+    "test",
+)
+
+
+def test_reports_missing_renderings_per_language():
+    trees = {
+        "ja": {"nav": {"mine": "マイテンプレート", "pick": "テンプレートを選ぶ"}, "resume": ["職務経歴書を作る"]},
+        "en": {"nav": {"mine": "My templates", "pick": "Choose a layout"}, "resume": ["Write your cv"]},
+        "zh": {"resume": ["写履历"]},
+    }
+    violations = check(trees, GLOSSARY)
+    # マイテンプレート の中の テンプレート は My Templates で訳されていれば問わない
+    assert [(violation.lang, violation.key, violation.term) for violation in violations] == [
+        ("en", "nav.pick", "テンプレート"),
+        ("zh", "resume.0", "職務経歴書"),
+    ]
+    assert "Template" in violations[0].describe()
+
+
+def test_load_accepts_strings_lists_and_per_language_values(tmp_path):
+    terms = {"テンプレート": "Template", "職務経歴書": ["Resume", "CV"], "求人": {"en": "Job", "zh": ["职位"]}}
+    (tmp_path / GLOSSARY_FILE).write_text(json.dumps({"terms": terms}), encoding="utf-8")
+    glossary = Glossary.load(tmp_path)
+    assert glossary.renderings("en") == {"テンプレート": ("Template",), "職務経歴書": ("Resume", "CV"), "求人": ("Job",)}
+    assert glossary.renderings("zh") == {"求人": ("职位",)}
+    assert Glossary.load(tmp_path / "missing").terms == {}
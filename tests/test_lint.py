@@ -0,0 +1,79 @@
+"""カタログの lint（lint.py）"""
+
+import pytest
+
+from i18n_catalog.lint import MISSING, RULES, Leaf, Report, Rule, lint, walk
+
+JA = {
+    "common": {"save": "保存", "store": "保存", "keep": "保存", "ok": "OK"},
+    "toast": {"count": "{{count}}件", "blank": "", "padded": "完了 "},
+    "steps": ["選ぶ", "保存する"],
+    "title": "タイトル",
+    "onlyJa": "日本語だけ",
+}
+EN = {
+    "common": {"save": "Save", "store": "Store", "keep": "Save", "ok": "OK"},
+    "toast": {"count": "{{total}} items", "blank": "Blank", "padded": "Done"},
+    "steps": ["Choose"],
+    "title": {"text": "Title"},
+}
+
+
+def findings(rule: str) -> list[tuple[str, str, str]]:
+    report = lint({"ja": JA, "en": EN}, [rule])
+    return [(finding.severity, finding.lang, finding.key) for finding in report.findings]
+
+
+def test_walk_visits_every_key_once_in_ja_order():
+    keys = [leaf.key for leaf in walk({"ja": JA, "en": EN})]
+    assert keys == [
+        "common.save", "common.store", "common.keep", "common.ok",
+        "toast.count", "toast.blank", "toast.padded",
+        "steps.0", "steps.1", "title", "onlyJa",
+    ]
+    assert Leaf("onlyJa", {"ja": "日本語だけ", "en": MISSING}) in walk({"ja": JA, "en": EN})
+
+
+@pytest.mark.parametrize("rule, expected", [
+    ("parity", [("warning", "en", "steps.1"), ("warning", "en", "onlyJa")]),
+    ("shape", [("error", "", "title")]),
+    ("empty", [("error", "ja", "toast.blank")]),
+    ("whitespace", [("warning", "ja", "toast.padded")]),
+    ("placeholders", [("error", "", "toast.count")]),
+    ("untranslated", []),
+])
+def test_each_rule(rule, expected):
+    assert findings(rule) == expected
+
+
+def test_untranslated_japanese_is_reported():
+    report = lint({"ja": {"a": "保存", "b": "OK"}, "en": {"a": "保存", "b": "OK"}}, ["untranslated"])
+    assert [(finding.key, finding.lang) for finding in report.findings] == [("a", "en")]
+
+
+def test_duplicates_warn_only_when_translations_differ():
+    report = lint({"ja": JA, "en": EN}, ["duplicates"])
+    [finding] = report.findings
+    assert (finding.severity, finding.key) == ("warning", "common.save")
+    assert "common.store, common.keep" in finding.message
+    report = lint({"ja": {"a": "保存", "b": "保存"}, "en": {"a": "Save", "b": "Save"}}, ["duplicates"])
+    assert [finding.severity for finding in report.findings] == ["info"]
+
+
+def test_findings_are_sorted_by_severity():
+    severities = [finding.severity for finding in lint({"ja": JA, "en": EN}).findings]
+    assert severities == sorted(severities, key=("error", "warning", "info").index)
+    assert "error: toast.count:" in lint({"ja": JA, "en": EN}, ["placeholders"]).findings[0].describe()
+
+
+def test_registered_rules_run_without_changes_to_lint(monkeypatch):
+    class LongKeys(Rule):
+        name = "long-keys"
+
+        def visit(self, leaf: Leaf, report: Report) -> None:
+            if len(leaf.key) >= 12:
+                report.add(self, leaf.key, "キーが長すぎます")
+
+    monkeypatch.setitem(RULES, LongKeys.name, LongKeys)
+    report = lint({"ja": JA, "en": EN}, ["long-keys"])
+    assert [finding.key for finding in report.findings] == ["common.store", "toast.padded"]
@@ -0,0 +1,156 @@
+"""ハードコードされた日本語の検出（literals.py）"""
+
+from i18n_catalog.literals import propose, scan_source
+
+PAGE = "client/src/pages/Settings.tsx"
+
+
+def scan(source: str) -> list[tuple[str, str]]:
+    return [(literal.kind, literal.text) for literal in scan_source(PAGE, source)]
+
+
+def test_text_may_contain_quotes_and_semicolons():
+    source = '''export default function Settings() {
+  return (
+    <div>
+      <p>ユーザーの "設定" を保存します; Don't 閉じる</p>
+      <Button
+        variant="outline"
+      >
+        It's 保存
+      </Button>
+    </div>
+  );
+}
+'''
+    assert scan(source) == [
+        ("text", 'ユーザーの "設定" を保存します; Don\'t 閉じる'),
+        ("text", "It's 保存"),
+    ]
+
+
+def test_comparisons_and_type_arguments_are_not_text():
+    source = '''export default function Settings({ count }: Props) {
+  const [value] = useState<string>("初期値");
+  const label = count > 0 ? "あり" : "なし";
+  return <span>1</span>;
+}
+'''
+    assert scan(source) == [("message", "初期値"), ("message", "あり"), ("message", "なし")]
+
+
+def test_text_after_a_closing_tag():
+    source = '''export default function Settings() {
+  return (
+    <h3>
+      <span className="badge">1</span>
+      アカウントの作成
+    </h3>
+  );
+}
+'''
+    assert scan(source) == [("text", "アカウントの作成")]
+
+
+FAVORITES = '''export default function Favorites() {
+  const [compareMode, setCompareMode] = useState(false);
+  const [showEditDialog, setShowEditDialog] = useState(false);
+  return (
+    <div>
+      {compareMode ? (
+        <Card>
+          <CardTitle>パターン比較 ({selected.length}件)</CardTitle>
+        </Card>
+      ) : pattern && (
+        <Card>
+          {pattern.evaluationDetails && (
+            <div>
+              <div>関連性: {pattern.evaluationDetails.relevance}点</div>
+              <div>明確性: {pattern.evaluationDetails.clarity}点</div>
+            </div>
+          )}
+        </Card>
+      )}
+      <Dialog open={showEditDialog} onOpenChange={setShowEditDialog}>
+        <DialogTitle>パターンを編集</DialogTitle>
+        <DialogDescription>パターン名とメモを編集できます</DialogDescription>
+        <div>
+          <Label htmlFor="edit-name">パターン名</Label>
+          <Input id="edit-name" placeholder="パターン名を入力" />
+        </div>
+      </Dialog>
+    </div>
+  );
+}
+'''
+
+
+def propose_keys(source: str, catalog: dict | None = None) -> list[tuple[str, bool]]:
+    literals = list(scan_source("client/src/pages/Favorites.tsx", source))
+    return [(proposal.key, proposal.numbered) for proposal in propose(literals, catalog or {})]
+
+
+def test_keys_are_named_after_conditions_dialogs_and_placeholders():
+    assert propose_keys(FAVORITES) == [
+        ("favorites.compare.title", False),
+        ("favorites.evaluation.relevance", False),
+        ("favorites.evaluation.clarity", False),
+        ("favorites.editDialog.title", False),
+        ("favorites.editDialog.description", False),
+        ("favorites.editDialog.editName", False),
+        ("favorites.editDialog.namePlaceholder", False),
+    ]
+
+
+def test_section_that_is_already_a_message_is_joined_to_the_name():
+    keys = propose_keys(FAVORITES, {"favorites": {"compare": "比較"}})
+    assert keys[0] == ("favorites.compareTitle", False)
+
+
+def test_numbers_are_the_last_resort_and_reported():
+    source = '''export default function Settings() {
+  return (
+    <div>
+      <h1>設定</h1>
+      <h2>APIキー設定</h2>
+    </div>
+  );
+}
+'''
+    literals = list(scan_source(PAGE, source))
+    proposals = propose(literals, {})
+    assert [(proposal.key, proposal.numbered) for proposal in proposals] == [
+        ("settings.title", False),
+        ("settings.title2", True),
+    ]
+
+
+def test_object_properties_are_named_after_the_variable():
+    source = '''const CATEGORY_LABELS: Record<string, string> = {
+  IT: "IT業界",
+  finance: "金融業界",
+};
+'''
+    literals = list(scan_source("client/src/components/TemplateSelector.tsx", source))
+    assert [proposal.key for proposal in propose(literals, {})] == [
+        "templateSelector.categoryLabels.IT",
+        "templateSelector.categoryLabels.finance",
+    ]
+
+
+def test_text_after_the_root_element_of_a_branch_is_code():
+    # ) : ( は JSX テキストではないので、括弧の対応（条件の範囲）が崩れない
+    source = '''export default function Favorites() {
+  return (
+    <div>
+      {compareMode ? (
+        <Icon />
+      ) : (
+        <p>パターンを選択してください</p>
+      )}
+    </div>
+  );
+}
+'''
+    [key] = propose_keys(source)
+    assert key == ("favorites.description", False)
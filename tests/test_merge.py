@@ -0,0 +1,76 @@
+"""ロケールカタログのマージ（merge.py）の衝突の検出と、スクリプトから消したキーの扱い"""
+
+import json
+
+import pytest
+
+from i18n_catalog.merge import BASE_DIR, Layer, base_path, locale_path, merge_layers, merge_locales
+from i18n_catalog.sources import LANGS, outputs
+
+GUIDE = next(output for output in outputs() if output.stem == "guide")
+
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture
+def root(tmp_path):
+    """ベースカタログと空のスクリプト出力だけのツリー"""
+    for lang in LANGS:
+        write_json(base_path(tmp_path, lang), {"header": {"title": f"{lang} title"}})
+        for output in outputs():
+            write_json(tmp_path / output.filename(lang), {})
+    return tmp_path
+
+
+def test_value_and_shape_conflicts_are_reported_with_their_origins():
+    tree, conflicts = merge_layers([
+        Layer("a.json", {"home": {"title": "ホーム", "hero": "見出し"}}),
+        Layer("b.json", {"home.title": "トップ"}),
+        Layer("c.json", {"hero": {"lead": "リード"}}, mount="home"),
+    ])
+    # 後勝ちでマージされる
+    assert tree == {"home": {"title": "トップ", "hero": {"lead": "リード"}}}
+    assert [conflict.describe() for conflict in conflicts] == [
+        "home.title: 値の食い違い（a.json → b.json）",
+        "home.hero: 文字列とオブジェクトの衝突（a.json → c.json）",
+    ]
+
+
+def test_same_value_from_two_layers_is_not_a_conflict():
+    _, conflicts = merge_layers([Layer("a.json", {"x": {"y": "同じ"}}), Layer("b.json", {"x.y": "同じ"})])
+    assert conflicts == []
+
+
+def test_keys_removed_from_a_script_drop_out(root):
+    write_json(root / GUIDE.filename("ja"), {"guide": {"tabs": {"tips": "コツ", "steps": "手順"}}})
+    merge_locales(root)
+    assert json.loads(locale_path(root, "ja").read_text(encoding="utf-8"))["guide"]["tabs"] == {
+        "tips": "コツ", "steps": "手順",
+    }
+
+    write_json(root / GUIDE.filename("ja"), {"guide": {"tabs": {"steps": "手順"}}})
+    result = merge_locales(root)
+    # 前回書き出した ja.json は読み込まないので、消したキーは残らず衝突にもならない
+    assert json.loads(locale_path(root, "ja").read_text(encoding="utf-8"))["guide"]["tabs"] == {"steps": "手順"}
+    assert result.conflicts["ja"] == []
+
+
+def test_changed_wording_is_not_reported_as_a_conflict(root):
+    write_json(root / GUIDE.filename("ja"), {"guide": {"title": "ガイド"}})
+    merge_locales(root)
+    write_json(root / GUIDE.filename("ja"), {"guide": {"title": "使い方ガイド"}})
+    result = merge_locales(root)
+    assert result.trees["ja"]["guide"]["title"] == "使い方ガイド"
+    assert result.conflicts["ja"] == []
+
+
+def test_script_output_conflicting_with_the_base_is_reported(root):
+    write_json(root / GUIDE.filename("en"), {"guide": {"title": "Guide"}})
+    write_json(base_path(root, "en"), {"guide": {"title": "How to"}})
+    result = merge_locales(root, write=False)
+    [conflict] = result.conflicts["en"]
+    assert (conflict.key, conflict.kind, conflict.previous_origin) == ("guide.title", "value", f"{BASE_DIR}/en.json")
+    assert not locale_path(root, "en").exists()
@@ -0,0 +1,73 @@
+"""本番用カタログ（minify.py）が client/src/i18n.ts の復元で元のカタログに戻ること"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from i18n_catalog.compile import compile_chunk, template_source
+from i18n_catalog.merge import LOCALES_DIR
+from i18n_catalog.minify import minify_chunk
+from i18n_catalog.output import serialize
+
+ROOT = Path(__file__).resolve().parent.parent
+CHUNKS = sorted((ROOT / LOCALES_DIR).glob("*/*.json"))
+
+
+def resolve_strings(node, strings: list[str]):
+    """i18n.ts の resolveStrings と同じ"""
+    if isinstance(node, int):
+        return strings[node]
+    if isinstance(node, list):
+        return [resolve_strings(item, strings) for item in node]
+    if isinstance(node, dict):
+        return {key: resolve_strings(value, strings) for key, value in node.items()}
+    return node
+
+
+def expand_messages(prefix: str, data: dict) -> dict:
+    """i18n.ts の expandMessages と同じ（テンプレートは messageFormat.ts の templateSource で戻す）"""
+    messages = resolve_strings(data["messages"], data["strings"]) if "strings" in data else data["messages"]
+    for key, template in data["templates"].items():
+        *parents, leaf = key.removeprefix(prefix).split(".")
+        node = messages
+        for part in parents:
+            node = node[int(part)] if isinstance(node, list) else node.setdefault(part, {})
+        # 配列の要素は省かれないので、JS の ??= と同じく既存の値を残す
+        if isinstance(node, dict):
+            node.setdefault(leaf, template_source(template))
+    return messages
+
+
+def round_trip(chunk: dict, prefix: str = "") -> dict:
+    shipped = json.loads(serialize(minify_chunk(chunk, prefix), compact=True))
+    return expand_messages(prefix, shipped)
+
+
+def test_templated_messages_are_dropped_and_restored():
+    chunk = compile_chunk({"selected": "{{count}}件選択中", "title": "お気に入り"}, "favorites.")
+    minified = minify_chunk(chunk, "favorites.")
+    assert "selected" not in minified["messages"]
+    assert round_trip(chunk, "favorites.") == chunk["messages"]
+
+
+def test_repeated_strings_move_to_the_table():
+    message = "この機能を使うにはログインが必要です"
+    chunk = compile_chunk({"a": {"description": message}, "b": {"description": message}, "c": [message, "保存"]})
+    minified = minify_chunk(chunk)
+    assert minified["strings"] == [message]
+    assert minified["messages"]["c"] == [0, "保存"]
+    assert round_trip(chunk) == chunk["messages"]
+
+
+def test_array_elements_with_placeholders_are_kept():
+    chunk = compile_chunk({"steps": ["{{name}}を選ぶ", "保存する"]}, "guide.")
+    assert minify_chunk(chunk, "guide.")["messages"]["steps"] == ["{{name}}を選ぶ", "保存する"]
+    assert round_trip(chunk, "guide.") == chunk["messages"]
+
+
+@pytest.mark.parametrize("path", CHUNKS, ids=lambda path: f"{path.parent.name}/{path.stem}")
+def test_tracked_catalogs_round_trip(path: Path):
+    chunk = json.loads(path.read_text(encoding="utf-8"))
+    prefix = "" if path.parent.name == "core" else f"{path.stem}."
+    assert round_trip(chunk, prefix) == chunk["messages"]
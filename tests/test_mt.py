@@ -0,0 +1,172 @@
+"""機械翻訳ステージ（mt.py）をローカルのスタブサーバーに対して実行する"""
+
+import json
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from i18n_catalog.memory import MT_DIR, TranslationMemory
+from i18n_catalog.mt import JOURNAL_FILE, Client, Journal, Request, TokenBucket, batches, load_translations, translate
+
+
+class StubServer:
+    """OpenAI 互換の chat/completions を真似るサーバー
+
+    受け取った値を "EN:" 付きで返す。failures に積んだステータスは先頭から1回ずつ返し、
+    reject に含まれる原文を含むリクエストは常に 400 で断る。
+    """
+
+    def __init__(self):
+        self.requests: list[dict[str, str]] = []
+        self.failures: list[int] = []
+        self.reject: set[str] = set()
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                payload = json.loads(body["messages"][1]["content"])
+                sources = {key: value.split("] ", 1)[1] for key, value in payload.items()}
+                with stub.lock:
+                    stub.requests.append(sources)
+                    status = stub.failures.pop(0) if stub.failures else 200
+                if set(sources.values()) & stub.reject:
+                    status = 400
+                if status != 200:
+                    self.send_response(status)
+                    self.send_header("Retry-After", "0")
+                    self.end_headers()
+                    return
+                content = json.dumps({key: f"EN:{source}" for key, source in sources.items()})
+                data = json.dumps({"choices": [{"message": {"content": content}}]}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v1"
+
+    def sent(self) -> list[str]:
+        return sorted(source for request in self.requests for source in request.values())
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    server = StubServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / MT_DIR).mkdir()
+    return tmp_path
+
+
+TREES = {
+    "ja": {"toast": {"saved": "保存しました", "deleted": "削除しました", "count": "{{count}}件"}, "common": {"ok": "OK"}},
+    "en": {"common": {"ok": "OK"}},
+}
+
+
+def client(stub: StubServer) -> Client:
+    return Client(stub.url, "", "stub", timeout=5, retries=2)
+
+
+def test_translates_missing_keys_in_batches(root, stub):
+    result = translate(root, TREES, client(stub), concurrency=1, rate=1000, batch_size=2)
+    assert result.requests == 2
+    assert [len(request) for request in stub.requests] == [2, 1]
+    assert sorted(result.translated["en"]) == ["toast.count", "toast.deleted", "toast.saved"]
+    assert load_translations(root, "en")["toast.count"] == {"source": "{{count}}件", "text": "EN:{{count}}件"}
+    assert not (root / JOURNAL_FILE).exists()
+
+
+def test_batches_split_on_size_and_characters():
+    requests = [Request(f"k{i}", "あ" * 10, "ns") for i in range(5)]
+    assert [len(batch) for batch in batches(requests, 2, 1000)] == [2, 2, 1]
+    assert [len(batch) for batch in batches(requests, 40, 25)] == [2, 2, 1]
+
+
+def test_memory_hits_are_not_sent_again(root, stub):
+    translate(root, TREES, client(stub), rate=1000)
+    (root / MT_DIR / "en.json").unlink()
+    stub.requests.clear()
+
+    result = translate(root, TREES, client(stub), rate=1000)
+    assert stub.requests == []
+    assert result.requests == 0
+    assert sorted(result.reused["en"]) == ["toast.count", "toast.deleted", "toast.saved"]
+    assert len(TranslationMemory.load(root)) == 3
+
+
+def test_same_source_and_context_is_sent_once(root, stub):
+    trees = {"ja": {"a": {"save": "保存"}, "b": {"save": "保存"}}, "en": {}}
+    translate(root, trees, client(stub), rate=1000)
+    # 文脈（名前空間）が違えば別々に訳す
+    assert stub.sent() == ["保存", "保存"]
+    trees = {"ja": {"a": {"save": "保存", "again": "保存"}}, "en": {}}
+    stub.requests.clear()
+    translate(root, trees, client(stub), rate=1000)
+    assert stub.requests == []
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_retries_rate_limits_and_server_errors(root, stub, status):
+    stub.failures = [status, status]
+    result = translate(root, TREES, client(stub), rate=1000)
+    assert len(stub.requests) == 3
+    assert len(result.translated["en"]) == 3
+
+
+def test_gives_up_after_retries(root, stub):
+    stub.failures = [503] * 3
+    with pytest.raises(urllib.error.HTTPError):
+        translate(root, TREES, client(stub), rate=1000)
+
+
+def test_resumes_from_the_journal_after_a_failed_batch(root, stub):
+    stub.reject = {"削除しました"}
+    with pytest.raises(urllib.error.HTTPError):
+        translate(root, TREES, client(stub), concurrency=1, rate=1000, batch_size=1)
+    # 完了したバッチだけがジャーナルに残り、翻訳メモリはまだ保存されていない
+    journaled = sorted(entry.source for entry in Journal(root / JOURNAL_FILE).replay())
+    assert journaled == ["{{count}}件", "保存しました"]
+    assert len(TranslationMemory.load(root)) == 0
+
+    stub.reject = set()
+    stub.requests.clear()
+    result = translate(root, TREES, client(stub), concurrency=1, rate=1000, batch_size=1)
+    assert stub.sent() == ["削除しました"]
+    assert sorted(result.translated["en"]) == ["toast.deleted"]
+    assert sorted(result.reused["en"]) == ["toast.count", "toast.saved"]
+    assert not (root / JOURNAL_FILE).exists()
+
+
+def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate=20)
+    started = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    # 最初の1個は貯まっているので、残り4個ぶん（1/20 秒ずつ）待つ
+    assert time.monotonic() - started >= 4 / 20 * 0.9
+
+
+def test_token_bucket_rejects_non_positive_rates():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
@@ -0,0 +1,40 @@
+"""プレースホルダーの正規化と ja / en の検証（placeholders.py）"""
+
+from i18n_catalog.placeholders import normalize, normalize_tree, placeholders, verify
+
+
+def test_single_braces_are_normalized_to_i18next_style():
+    assert normalize("{date}に{{ count }}件、{APP_TITLE}") == "{{date}}に{{count}}件、{{APP_TITLE}}"
+    # 名前にならない波括弧はそのまま
+    assert normalize("{1} と { } と {{a-b}}") == "{1} と { } と {{a-b}}"
+
+
+def test_trees_and_arrays_are_normalized():
+    tree = {"steps": ["{name}を選ぶ", 3], "toast": {"saved": "{{name}}を保存"}}
+    assert normalize_tree(tree) == {"steps": ["{{name}}を選ぶ", 3], "toast": {"saved": "{{name}}を保存"}}
+
+
+def test_placeholders_ignore_the_style():
+    assert placeholders("{{a}} {b} {{a}}") == {"a", "b"}
+
+
+def test_verify_reports_missing_extra_and_renamed_placeholders():
+    ja = {
+        "toast": {"saved": "{{name}}を保存しました", "count": "{{count}}件", "plain": "完了"},
+        "steps": ["{{step}}へ進む"],
+    }
+    en = {
+        "toast": {"saved": "Saved", "count": "{{total}} items", "plain": "Done {{extra}}"},
+        "steps": ["Go to {{step}}"],
+    }
+    assert [mismatch.describe() for mismatch in verify(ja, en)] == [
+        "toast.saved: ja [name] / en [なし]",
+        "toast.count: ja [count] / en [total]",
+        "toast.plain: ja [なし] / en [extra]",
+    ]
+
+
+def test_verify_accepts_matching_sets_and_skips_keys_missing_in_ja():
+    ja = {"a": "{{x}}と{{y}}"}
+    en = {"a": "{y} and {{x}}", "only_en": "{{z}}"}
+    assert verify(ja, en) == []
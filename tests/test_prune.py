@@ -0,0 +1,67 @@
+"""使われていないキーの除去（prune.py）"""
+
+import json
+
+import pytest
+
+from i18n_catalog.prune import KEEP_FILE, prune
+from i18n_catalog.usage import SOURCE_DIR, UsageIndex
+
+TREES = {
+    "ja": {
+        "home": {"title": "ホーム", "unused": "未使用"},
+        "announcement": {"feature1": {"title": "新機能1"}, "feature2": {"title": "新機能2"}, "close": "閉じる"},
+        "guide": {"steps": {"first": "選ぶ", "second": "保存する"}},
+        "errors": {"network": "通信エラー", "timeout": "タイムアウト"},
+    },
+    "en": {"home": {"title": "Home", "unused": "Unused"}},
+}
+
+SOURCE = """const title = t('home.title');
+const steps = t('guide.steps', { returnObjects: true });
+const error = t(`errors.${code}`);
+"""
+
+
+@pytest.fixture
+def root(tmp_path):
+    path = tmp_path / SOURCE_DIR / "Home.tsx"
+    path.parent.mkdir(parents=True)
+    path.write_text(SOURCE, encoding="utf-8")
+    return tmp_path
+
+
+def index(root) -> UsageIndex:
+    usage = UsageIndex()
+    usage.update(root, jobs=1)
+    return usage
+
+
+def test_unused_keys_are_removed_and_subtrees_kept(root):
+    result = prune(root, TREES, index(root))
+    assert result.trees["ja"] == {
+        "home": {"title": "ホーム"},
+        "guide": {"steps": {"first": "選ぶ", "second": "保存する"}},
+        "errors": {"network": "通信エラー", "timeout": "タイムアウト"},
+    }
+    assert sorted(result.removed["ja"]) == [
+        "announcement.close", "announcement.feature1.title", "announcement.feature2.title", "home.unused",
+    ]
+    assert result.removed["en"] == ["home.unused"]
+    assert set(result.saved) == {"home", "announcement"}
+    assert result.saved["home"]["ja"] > 0 and result.saved["home"]["en"] > 0
+
+
+def test_keys_in_the_keep_file_survive(root):
+    (root / KEEP_FILE).write_text(json.dumps({"keep": ["announcement.feature*"]}), encoding="utf-8")
+    result = prune(root, TREES, index(root))
+    assert result.trees["ja"]["announcement"] == {"feature1": {"title": "新機能1"}, "feature2": {"title": "新機能2"}}
+    assert "announcement.close" in result.removed["ja"]
+    assert "announcement.feature1.title" not in result.removed["ja"]
+
+
+def test_without_a_keep_file_only_references_count(root):
+    assert not (root / KEEP_FILE).exists()
+    result = prune(root, TREES, UsageIndex())
+    assert result.trees["ja"] == {}
+    assert len(result.removed["ja"]) == 9
@@ -0,0 +1,46 @@
+"""名前空間ごとの分割（split.py）"""
+
+from pathlib import Path
+
+from i18n_catalog.split import split_locales
+
+LOCALES = Path("locales")
+TREES = {
+    "ja": {"common": {"save": "保存"}, "guide": {"title": "ガイド"}},
+    "en": {"common": {"save": "Save"}, "guide": {"title": "Guide"}},
+}
+
+
+def files(root) -> list[str]:
+    return sorted(str(path.relative_to(root / LOCALES)) for path in (root / LOCALES).rglob("*.json"))
+
+
+def test_writes_namespaces_and_core_bundles(tmp_path):
+    written = split_locales(tmp_path, TREES, LOCALES)
+    assert files(tmp_path) == [
+        "core/en.json", "core/ja.json", "en/common.json", "en/guide.json", "ja/common.json", "ja/guide.json",
+    ]
+    assert len(written) == 6
+    assert split_locales(tmp_path, TREES, LOCALES) == []
+
+
+def test_removed_namespaces_are_deleted(tmp_path):
+    split_locales(tmp_path, TREES, LOCALES)
+    trees = {lang: {"common": tree["common"]} for lang, tree in TREES.items()}
+    written = split_locales(tmp_path, trees, LOCALES)
+    assert sorted(written) == [f"{LOCALES}/en/guide.json", f"{LOCALES}/ja/guide.json"]
+    assert files(tmp_path) == ["core/en.json", "core/ja.json", "en/common.json", "ja/common.json"]
+
+
+def test_removed_languages_are_deleted_with_their_core_bundle(tmp_path):
+    split_locales(tmp_path, TREES, LOCALES)
+    written = split_locales(tmp_path, {"ja": TREES["ja"]}, LOCALES)
+    assert sorted(written) == [f"{LOCALES}/core/en.json", f"{LOCALES}/en/common.json", f"{LOCALES}/en/guide.json"]
+    assert files(tmp_path) == ["core/ja.json", "ja/common.json", "ja/guide.json"]
+    assert not (tmp_path / LOCALES / "en").exists()
+
+
+def test_partial_writes_keep_other_languages(tmp_path):
+    split_locales(tmp_path, TREES, LOCALES)
+    split_locales(tmp_path, {"ja": TREES["ja"]}, LOCALES, {"guide"})
+    assert "core/en.json" in files(tmp_path)
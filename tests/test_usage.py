@@ -0,0 +1,68 @@
+"""翻訳キーの使用箇所の抽出と、インクリメンタルに更新するインデックス（usage.py）"""
+
+import os
+
+import pytest
+
+from i18n_catalog.usage import SOURCE_DIR, Usage, UsageIndex, scan_source
+
+
+def test_calls_i18n_key_and_template_keys_are_found():
+    source = """const a = t('home.title');
+const b = i18n.t("header.login");
+<Trans i18nKey="footer.copyright" />
+const c = t(`announcement.feature${index}.title`);
+const d = format('not.a.key'); const e = t(label);
+"""
+    assert scan_source(source) == [
+        Usage("home.title", 1),
+        Usage("header.login", 2),
+        Usage("footer.copyright", 3),
+        Usage("announcement.feature*.title", 4, dynamic=True),
+    ]
+
+
+def write(root, name: str, text: str, mtime_ns: int) -> None:
+    path = root / SOURCE_DIR / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    # mtime の分解能に依らないよう明示的に進める
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def root(tmp_path):
+    write(tmp_path, "Home.tsx", "t('home.title')\n", 1_000)
+    write(tmp_path, "pages/Guide.tsx", "t(`guide.step${n}`)\n", 1_000)
+    return tmp_path
+
+
+def test_only_changed_files_are_rescanned(root):
+    index = UsageIndex()
+    stats = index.update(root, jobs=1)
+    assert (stats.scanned, stats.reused, stats.removed) == (2, 0, 0)
+
+    write(root, "Home.tsx", "t('home.subtitle')\n", 2_000)
+    stats = index.update(root, jobs=1)
+    assert (stats.scanned, stats.reused, stats.removed) == (1, 1, 0)
+    assert list(index.references()) == ["home.subtitle"]
+
+
+def test_removed_files_are_dropped_and_full_rescans_everything(root):
+    index = UsageIndex()
+    index.update(root, jobs=1)
+    (root / SOURCE_DIR / "Home.tsx").unlink()
+    stats = index.update(root, jobs=1)
+    assert (stats.scanned, stats.reused, stats.removed) == (0, 1, 1)
+    assert index.references() == {}
+    assert index.update(root, jobs=1, full=True).scanned == 1
+
+
+def test_index_survives_a_save_and_load(root):
+    index = UsageIndex()
+    index.update(root, jobs=1)
+    index.save(root)
+    loaded = UsageIndex.load(root)
+    assert loaded.update(root, jobs=1).reused == 2
+    assert loaded.lookup("guide.step3") == [(os.path.join("client", "src", "pages", "Guide.tsx"), 1)]
+    assert loaded.lookup("guide.intro") == []
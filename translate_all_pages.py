@@ -3,7 +3,7 @@
 全ページの翻訳キーを生成するスクリプト
 """
 
-import json
+from i18n_catalog.output import write_catalog
 
 # Favorites.tsx の翻訳キー
 favorites_ja = {
@@ -26,7 +26,7 @@ favorites_ja = {
     "favorites.delete": "削除",
     "favorites.copy": "コピー",
     "favorites.editDialog.title": "お気に入りパターンを編集",
-    "favorites.editDialog.name": "名前",
+    "favorites.editDialog.name": "パターン名",
     "favorites.editDialog.notes": "メモ",
     "favorites.editDialog.save": "保存",
     "favorites.editDialog.cancel": "キャンセル",
@@ -37,22 +37,22 @@ favorites_ja = {
     "favorites.toast.updateFailed": "更新に失敗しました",
     "favorites.confirm.delete": "このお気に入りパターンを削除しますか？",
     "favorites.noFavorites": "お気に入りパターンがありません",
-    "favorites.noFavoritesDescription": "生成結果画面でお気に入りに追加してください",
+    "favorites.noFavoritesDescription": "ホーム画面で生成したパターンをお気に入りに登録すると、ここに表示されます。",
 }
 
 favorites_en = {
     "favorites.title": "Favorite Patterns",
     "favorites.loginRequired": "Login Required",
-    "favorites.loginDescription": "You need to log in with your Manus account to use this feature",
+    "favorites.loginDescription": "You need to log in with a Manus account to use this feature",
     "favorites.loginButton": "Login to Start",
     "favorites.compareMode": "Compare Mode",
     "favorites.compareModeEnd": "End Compare Mode",
     "favorites.selectedCount": "{{count}} selected",
-    "favorites.evaluationScore": "Score: {{score}}",
+    "favorites.evaluationScore": "Score: {{score}} pts",
     "favorites.compareTitle": "Pattern Comparison ({{count}})",
     "favorites.differenceRate": "Difference: {{rate}}%",
     "favorites.patternDetails": "Pattern Details",
-    "favorites.selectPattern": "Select a pattern from the left",
+    "favorites.selectPattern": "Please select a pattern from the left",
     "favorites.name": "Name",
     "favorites.notes": "Notes",
     "favorites.generatedContent": "Generated Content",
@@ -60,7 +60,7 @@ favorites_en = {
     "favorites.delete": "Delete",
     "favorites.copy": "Copy",
     "favorites.editDialog.title": "Edit Favorite Pattern",
-    "favorites.editDialog.name": "Name",
+    "favorites.editDialog.name": "Pattern Name",
     "favorites.editDialog.notes": "Notes",
     "favorites.editDialog.save": "Save",
     "favorites.editDialog.cancel": "Cancel",
@@ -71,7 +71,7 @@ favorites_en = {
     "favorites.toast.updateFailed": "Failed to update",
     "favorites.confirm.delete": "Are you sure you want to delete this favorite pattern?",
     "favorites.noFavorites": "No favorite patterns",
-    "favorites.noFavoritesDescription": "Add favorites from the generation results screen",
+    "favorites.noFavoritesDescription": "Patterns you save as favorites from the home screen will appear here.",
 }
 
 # ApiSettings.tsx の翻訳キー
@@ -133,11 +133,8 @@ all_en.update(favorites_en)
 all_en.update(api_settings_en)
 
 # JSONファイルに保存
-with open('/home/ubuntu/resume_optimizer/pages_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(all_ja, f, ensure_ascii=False, indent=2)
-
-with open('/home/ubuntu/resume_optimizer/pages_en.json', 'w', encoding='utf-8') as f:
-    json.dump(all_en, f, ensure_ascii=False, indent=2)
+write_catalog("pages_ja.json", all_ja)
+write_catalog("pages_en.json", all_en)
 
 print("翻訳キーをpages_ja.jsonとpages_en.jsonに保存しました。")
 print(f"日本語キー数: {len(all_ja)}")
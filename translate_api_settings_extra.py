@@ -3,7 +3,7 @@
 ApiSettings.tsxの追加翻訳キーを生成するスクリプト
 """
 
-import json
+from i18n_catalog.output import write_catalog
 
 # ApiSettings.tsx の追加翻訳キー
 api_settings_extra_ja = {
@@ -59,11 +59,8 @@ api_settings_extra_en = {
 }
 
 # JSONファイルに保存
-with open('/home/ubuntu/resume_optimizer/api_settings_extra_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(api_settings_extra_ja, f, ensure_ascii=False, indent=2)
-
-with open('/home/ubuntu/resume_optimizer/api_settings_extra_en.json', 'w', encoding='utf-8') as f:
-    json.dump(api_settings_extra_en, f, ensure_ascii=False, indent=2)
+write_catalog("api_settings_extra_ja.json", api_settings_extra_ja)
+write_catalog("api_settings_extra_en.json", api_settings_extra_en)
 
 print("追加翻訳キーをapi_settings_extra_ja.jsonとapi_settings_extra_en.jsonに保存しました。")
 print(f"日本語キー数: {len(api_settings_extra_ja)}")
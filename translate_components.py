@@ -3,7 +3,7 @@
 コンポーネントの翻訳キーを生成するスクリプト
 """
 
-import json
+from i18n_catalog.output import write_catalog
 
 # AnnouncementDialog.tsx の翻訳キー
 announcement_ja = {
@@ -76,11 +76,8 @@ all_en = {}
 all_en.update(announcement_en)
 
 # JSONファイルに保存
-with open('/home/ubuntu/resume_optimizer/components_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(all_ja, f, ensure_ascii=False, indent=2)
-
-with open('/home/ubuntu/resume_optimizer/components_en.json', 'w', encoding='utf-8') as f:
-    json.dump(all_en, f, ensure_ascii=False, indent=2)
+write_catalog("components_ja.json", all_ja)
+write_catalog("components_en.json", all_en)
 
 print("翻訳キーをcomponents_ja.jsonとcomponents_en.jsonに保存しました。")
 print(f"日本語キー数: {len(all_ja)}")
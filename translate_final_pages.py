@@ -1,20 +1,4 @@
-import re
-import json
-
-# Privacy.tsx、Terms.tsx、MyTemplates.tsxから日本語テキストを抽出
-files = [
-    'client/src/pages/Privacy.tsx',
-    'client/src/pages/Terms.tsx',
-    'client/src/pages/MyTemplates.tsx'
-]
-
-# 翻訳キーを格納
-privacy_ja = {}
-privacy_en = {}
-terms_ja = {}
-terms_en = {}
-mytemplates_ja = {}
-mytemplates_en = {}
+from i18n_catalog.output import write_catalog
 
 # Privacy.tsxの翻訳キー
 privacy_ja = {
@@ -600,23 +584,12 @@ mytemplates_en = {
 }
 
 # 保存
-with open('privacy_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(privacy_ja, f, ensure_ascii=False, indent=2)
-
-with open('privacy_en.json', 'w', encoding='utf-8') as f:
-    json.dump(privacy_en, f, ensure_ascii=False, indent=2)
-
-with open('terms_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(terms_ja, f, ensure_ascii=False, indent=2)
-
-with open('terms_en.json', 'w', encoding='utf-8') as f:
-    json.dump(terms_en, f, ensure_ascii=False, indent=2)
-
-with open('mytemplates_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(mytemplates_ja, f, ensure_ascii=False, indent=2)
-
-with open('mytemplates_en.json', 'w', encoding='utf-8') as f:
-    json.dump(mytemplates_en, f, ensure_ascii=False, indent=2)
+write_catalog("privacy_ja.json", privacy_ja)
+write_catalog("privacy_en.json", privacy_en)
+write_catalog("terms_ja.json", terms_ja)
+write_catalog("terms_en.json", terms_en)
+write_catalog("mytemplates_ja.json", mytemplates_ja)
+write_catalog("mytemplates_en.json", mytemplates_en)
 
 print("翻訳キーを生成しました。")
 print("- privacy_ja.json, privacy_en.json")
@@ -3,8 +3,7 @@
 Guide.tsxの翻訳キーを自動生成するスクリプト
 """
 
-import re
-import json
+from i18n_catalog.output import write_catalog
 
 # Guide.tsxから日本語テキストを抽出し、翻訳キーを生成
 guide_translations_ja = {
@@ -15,7 +14,7 @@ guide_translations_ja = {
     
     # タイトル
     "guide.title": "ガイド・チュートリアル",
-    "guide.subtitle": "{{title}}の使い方、機能、注意点を詳しく解説します。",
+    "guide.subtitle": "{{APP_TITLE}}の使い方、機能、注意点を詳しく解説します。",
     
     # タブ
     "guide.tabs.overview": "概要",
@@ -24,8 +23,8 @@ guide_translations_ja = {
     "guide.tabs.tips": "注意点・Tips",
     
     # 概要タブ
-    "guide.overview.what.title": "{{title}}とは",
-    "guide.overview.what.description": "{{title}}は、AI技術を活用して職務経歴書を求人情報に最適化するWebアプリケーションです。あなたの職務経歴書と応募したい求人情報を入力するだけで、AIが求人に最適化された職務要約、志望動機、自己PRなどを自動生成します。",
+    "guide.overview.what.title": "{{APP_TITLE}}とは",
+    "guide.overview.what.description": "{{APP_TITLE}}は、AI技術を活用して職務経歴書を求人情報に最適化するWebアプリケーションです。あなたの職務経歴書と応募したい求人情報を入力するだけで、AIが求人に最適化された職務要約、志望動機、自己PRなどを自動生成します。",
     "guide.overview.fast.title": "高速生成",
     "guide.overview.fast.description": "AIが数秒で最適化された文書を生成します。",
     "guide.overview.optimized.title": "求人に最適化",
@@ -161,7 +160,7 @@ guide_translations_en = {
     
     # タイトル
     "guide.title": "Guide & Tutorial",
-    "guide.subtitle": "Learn how to use {{title}}, its features, and important tips.",
+    "guide.subtitle": "Learn how to use {{APP_TITLE}}, its features, and important tips.",
     
     # タブ
     "guide.tabs.overview": "Overview",
@@ -170,8 +169,8 @@ guide_translations_en = {
     "guide.tabs.tips": "Tips & FAQ",
     
     # 概要タブ
-    "guide.overview.what.title": "What is {{title}}?",
-    "guide.overview.what.description": "{{title}} is a web application that optimizes your resume to job postings using AI technology. Simply input your resume and the job posting you want to apply for, and AI will automatically generate optimized career summaries, motivation letters, self-PR, and more.",
+    "guide.overview.what.title": "What is {{APP_TITLE}}?",
+    "guide.overview.what.description": "{{APP_TITLE}} is a web application that optimizes your resume to job postings using AI technology. Simply input your resume and the job posting you want to apply for, and AI will automatically generate optimized career summaries, motivation letters, self-PR, and more.",
     "guide.overview.fast.title": "Fast Generation",
     "guide.overview.fast.description": "AI generates optimized documents in seconds.",
     "guide.overview.optimized.title": "Optimized for Jobs",
@@ -299,11 +298,8 @@ guide_translations_en = {
 }
 
 # JSONファイルに保存
-with open('/home/ubuntu/resume_optimizer/guide_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(guide_translations_ja, f, ensure_ascii=False, indent=2)
-
-with open('/home/ubuntu/resume_optimizer/guide_en.json', 'w', encoding='utf-8') as f:
-    json.dump(guide_translations_en, f, ensure_ascii=False, indent=2)
+write_catalog("guide_ja.json", guide_translations_ja)
+write_catalog("guide_en.json", guide_translations_en)
 
 print("翻訳キーをguide_ja.jsonとguide_en.jsonに保存しました。")
 print(f"日本語キー数: {len(guide_translations_ja)}")
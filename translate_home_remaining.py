@@ -3,7 +3,7 @@
 Home.tsxの残りの翻訳キーを生成するスクリプト
 """
 
-import json
+from i18n_catalog.output import write_catalog
 
 # Home.tsx の残りの翻訳キー
 home_remaining_ja = {
@@ -57,11 +57,8 @@ home_remaining_en = {
 }
 
 # JSONファイルに保存
-with open('/home/ubuntu/resume_optimizer/home_remaining_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(home_remaining_ja, f, ensure_ascii=False, indent=2)
-
-with open('/home/ubuntu/resume_optimizer/home_remaining_en.json', 'w', encoding='utf-8') as f:
-    json.dump(home_remaining_en, f, ensure_ascii=False, indent=2)
+write_catalog("home_remaining_ja.json", home_remaining_ja)
+write_catalog("home_remaining_en.json", home_remaining_en)
 
 print("残りの翻訳キーをhome_remaining_ja.jsonとhome_remaining_en.jsonに保存しました。")
 print(f"日本語キー数: {len(home_remaining_ja)}")
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+ハードコードされていた文言の翻訳キー（build_catalogs.py codemod が追加する）
+
+en に無いキーはビルド時に ja の値で補われる（catalog_reports/fallback.json）。
+"""
+
+from i18n_catalog.output import write_catalog
+
+literals_ja = {}
+
+literals_en = {}
+
+# JSONファイルに保存
+write_catalog("literals_ja.json", literals_ja)
+write_catalog("literals_en.json", literals_en)
@@ -1,4 +1,4 @@
-import json
+from i18n_catalog.output import write_catalog
 
 # MyTemplates.tsxの完全な翻訳キーのマッピング
 mytemplates_ja = {
@@ -88,11 +88,8 @@ mytemplates_en = {
 }
 
 # 保存
-with open('mytemplates_complete_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(mytemplates_ja, f, ensure_ascii=False, indent=2)
-
-with open('mytemplates_complete_en.json', 'w', encoding='utf-8') as f:
-    json.dump(mytemplates_en, f, ensure_ascii=False, indent=2)
+write_catalog("mytemplates_complete_ja.json", mytemplates_ja)
+write_catalog("mytemplates_complete_en.json", mytemplates_en)
 
 print("MyTemplates.tsxの完全な翻訳キーを生成しました。")
 print("- mytemplates_complete_ja.json")
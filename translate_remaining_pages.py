@@ -3,7 +3,7 @@
 残りのページの翻訳キーを生成するスクリプト
 """
 
-import json
+from i18n_catalog.output import write_catalog
 
 # Favorites.tsx の翻訳キー
 favorites_ja = {
@@ -145,11 +145,8 @@ all_en.update(terms_en)
 all_en.update(myTemplates_en)
 
 # JSONファイルに保存
-with open('/home/ubuntu/resume_optimizer/remaining_pages_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(all_ja, f, ensure_ascii=False, indent=2)
-
-with open('/home/ubuntu/resume_optimizer/remaining_pages_en.json', 'w', encoding='utf-8') as f:
-    json.dump(all_en, f, ensure_ascii=False, indent=2)
+write_catalog("remaining_pages_ja.json", all_ja)
+write_catalog("remaining_pages_en.json", all_en)
 
 print("残りのページの翻訳キーをremaining_pages_ja.jsonとremaining_pages_en.jsonに保存しました。")
 print(f"日本語キー数: {len(all_ja)}")
@@ -1,9 +1,4 @@
-import json
-import re
-
-# Terms.tsxを読み込み
-with open('client/src/pages/Terms.tsx', 'r', encoding='utf-8') as f:
-    content = f.read()
+from i18n_catalog.output import write_catalog
 
 # 翻訳キーのマッピング
 terms_ja = {
@@ -229,11 +224,8 @@ terms_en = {
 }
 
 # 保存
-with open('terms_complete_ja.json', 'w', encoding='utf-8') as f:
-    json.dump(terms_ja, f, ensure_ascii=False, indent=2)
-
-with open('terms_complete_en.json', 'w', encoding='utf-8') as f:
-    json.dump(terms_en, f, ensure_ascii=False, indent=2)
+write_catalog("terms_complete_ja.json", terms_ja)
+write_catalog("terms_complete_en.json", terms_en)
 
 print("Terms.tsxの完全な翻訳キーを生成しました。")
 print("- terms_complete_ja.json")
@@ -3,11 +3,57 @@ import tailwindcss from "@tailwindcss/vite";
 import react from "@vitejs/plugin-react";
 import fs from "node:fs";
 import path from "path";
-import { defineConfig } from "vite";
+import { defineConfig, type Plugin } from "vite";
 import { vitePluginManusRuntime } from "vite-plugin-manus-runtime";
 
+const localesDir = path.resolve(import.meta.dirname, "client", "src", "locales");
 
-const plugins = [react(), tailwindcss(), jsxLocPlugin(), vitePluginManusRuntime()];
+// Pushes catalog files rewritten by `build_catalogs.py watch` to the client
+// (see the import.meta.hot handler in client/src/i18n.ts) instead of letting
+// the update propagate to i18n.ts and reload the page.
+function i18nCatalogHmr(): Plugin {
+  return {
+    name: "i18n-catalog-hmr",
+    apply: "serve",
+    async hotUpdate({ file, read }) {
+      if (this.environment.name !== "client") return;
+      const relative = path.relative(localesDir, file);
+      if (relative.startsWith("..") || path.isAbsolute(relative)) return;
+      const parts = relative.split(path.sep);
+      // locales/{lng}.json are build intermediates; no module imports them
+      if (parts.length === 1 && parts[0].endsWith(".json")) return [];
+      if (parts.length !== 2 || !parts[1].endsWith(".json")) return;
+
+      const [dir, name] = parts;
+      const stem = name.slice(0, -".json".length);
+      const update =
+        dir === "core"
+          ? { lng: stem, path: `./locales/core/${name}` }
+          : { lng: dir, ns: stem, path: `./locales/${dir}/${name}` };
+      let catalog: unknown;
+      try {
+        catalog = JSON.parse(await read());
+      } catch {
+        // The build writes atomically, so this is a hand edit in progress
+        return [];
+      }
+      this.environment.hot.send({
+        type: "custom",
+        event: "i18n:catalog-update",
+        data: { ...update, catalog },
+      });
+      return [];
+    },
+  };
+}
+
+const plugins = [
+  react(),
+  tailwindcss(),
+  jsxLocPlugin(),
+  vitePluginManusRuntime(),
+  i18nCatalogHmr(),
+];
 
 export default defineConfig({
   plugins,